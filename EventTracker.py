@@ -2,42 +2,48 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 from tkinter import simpledialog
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
-from matplotlib.patches import Rectangle, Patch
-import matplotlib.dates as mdates
+from datetime import date
+from bisect import bisect_left
 import os
-import json
-import hashlib # Şifreleme
-import hmac # Güvenli Karşılaştırma
-from collections import defaultdict, Counter
 import locale
-import webbrowser # Link açmak için
-import requests   # API sorgusu için
-import threading  # Arayüz donmasın diye
-
-# tkcalendar kontrolü
-try:
-    from tkcalendar import DateEntry
-except ImportError:
+import importlib.util
+from tarih_deposu import TarihDeposu, EtkinlikIndeksi, gun_sirasi
+from onbellek import AnalizOnbellegi
+from izleme import izleyici, izle
+from sifreleme import sifre_ozeti, dogrula as sifre_dogrula, yukseltilmeli_mi, sure_esitle
+from depolama import veri_deposu_ac, kullanici_deposu_ac, ISLEM_EKLE, ISLEM_SIL, ISLEM_ETKINLIK_EKLE, ISLEM_ETKINLIK_SIL, ISLEM_ETKINLIK_ADLANDIR
+
+# Ağır kütüphaneler (matplotlib, numpy, requests, tkcalendar) giriş ekranında gerekmez; ilk kullanıldıkları yerde içe aktarılır.
+# Ölçüm: python benchmarks/baslangic.py
+
+# tkcalendar kontrolü (yalnızca varlığı; modül ana panel kurulurken yüklenir)
+if importlib.util.find_spec("tkcalendar") is None:
     messagebox.showerror("Eksik Kütüphane", "Lütfen 'tkcalendar' kütüphanesini yükleyin.\nKomut: pip install tkcalendar")
     exit()
 
-# Dil ayarı
-try:
-    locale.setlocale(locale.LC_ALL, 'tr_TR.UTF-8')
-except:
+def tarih_secici(master):
+    from tkcalendar import DateEntry
+    return DateEntry(master, width=16, background='darkblue', foreground='white', borderwidth=2, date_pattern='dd.mm.yyyy', locale='tr_TR')
+
+def dil_ayarla():
+    # Dil ayarı (gün/ay adları); ana panel açılırken bir kez
     try:
-        locale.setlocale(locale.LC_ALL, 'Turkish')
+        locale.setlocale(locale.LC_ALL, 'tr_TR.UTF-8')
     except:
-        pass 
+        try:
+            locale.setlocale(locale.LC_ALL, 'Turkish')
+        except:
+            pass 
 
 # --- AYARLAR ---
 DATA_KLASORU = "Data"
 USERS_DOSYASI = "users.json"
 ESKI_TXT_DOSYA_ADI = "eventList.txt"
+SQLITE_DOSYASI = os.path.join(DATA_KLASORU, "eventtracker.db")
+GUNCELLEME_ONBELLEGI = os.path.join(os.path.expanduser("~"), ".eventtracker", "guncelleme.json") # Data dışında: oradaki .json dosyaları hesap sayılır (guncelleme.VARSAYILAN_ONBELLEK)
+DEPOLAMA_TURU = os.environ.get("ETKINLIK_DEPO", "json") # "json" (günlüklü dosyalar) veya "sqlite"
+SON_GUN_FILTRELERI = {"Son 30 Gün": 30, "Son 90 Gün": 90, "Son 365 Gün": 365}
+OZEL_ARALIK = "Özel Aralık..." # Seçilince tarih aralığı sorulur; combo'da "gg.aa.yyyy - gg.aa.yyyy" olarak görünür
 
 
 MEVCUT_SURUM = "v1.0.1"
@@ -49,89 +55,91 @@ if not os.path.exists(DATA_KLASORU):
 
 class UpdateManager:
     @staticmethod
-    def kontrol_et(manuel=False):
+    def kontrol_et(gorevler, manuel=False):
         """
-        GitHub API'sini kontrol eder.
-        manuel=True ise kullanıcı butona basmıştır (Her durumda bilgi ver).
-        manuel=False ise otomatik başlangıçtır (Sadece güncelleme varsa rahatsız et).
+        GitHub API'sini kontrol eder (bkz. guncelleme: diskte önbellek + ETag ile koşullu istek).
+        manuel=True ise kullanıcı butona basmıştır (Her durumda bilgi ver, önbellek taze olsa da sor).
+        manuel=False ise otomatik başlangıçtır (Sadece güncelleme varsa rahatsız et). Önbellek tazeyse
+        yalnızca önbellek dosyası okunur; thread, requests ve bağlantı yoktur.
+        Ağ isteği işçi thread'inde yapılır; mesaj kutuları ana thread'de gösterilir.
         """
-        def thread_hedefi():
-            try:
-                # GitHub API URL'si
-                url = f"https://api.github.com/repos/{GITHUB_KULLANICI}/{GITHUB_REPO}/releases/latest"
-                response = requests.get(url, timeout=5)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    son_surum = data['tag_name'] # Örn: v1.1.0
-                    indirme_linki = data['html_url'] # Release sayfası
-
-                    if son_surum != MEVCUT_SURUM:
-                        # Ana thread'de mesaj kutusu göster
-                        msg = f"Yeni bir güncelleme mevcut!\n\nMevcut Sürüm: {MEVCUT_SURUM}\nYeni Sürüm: {son_surum}\n\nİndirme sayfasına gitmek ister misiniz?"
-                        cevap = messagebox.askyesno("Güncelleme Mevcut", msg)
-                        if cevap:
-                            webbrowser.open(indirme_linki)
-                    else:
-                        if manuel:
-                            messagebox.showinfo("Durum", f"Uygulamanız güncel.\nSürüm: {MEVCUT_SURUM}")
-                else:
-                    if manuel:
-                        messagebox.showerror("Hata", "Güncelleme bilgisi alınamadı.\nRepo bulunamadı veya gizli.")
-            except Exception as e:
+        import guncelleme
+        url = guncelleme.adres(GITHUB_KULLANICI, GITHUB_REPO)
+
+        def bitti(sonuc):
+            if sonuc is None:
                 if manuel:
-                    messagebox.showerror("Bağlantı Hatası", f"İnternet bağlantısı kurulamadı.\n{e}")
+                    messagebox.showerror("Hata", "Güncelleme bilgisi alınamadı.\nRepo bulunamadı veya gizli.")
+                return
+            son_surum, indirme_linki = sonuc
+            if son_surum != MEVCUT_SURUM:
+                msg = f"Yeni bir güncelleme mevcut!\n\nMevcut Sürüm: {MEVCUT_SURUM}\nYeni Sürüm: {son_surum}\n\nİndirme sayfasına gitmek ister misiniz?"
+                cevap = messagebox.askyesno("Güncelleme Mevcut", msg)
+                if cevap:
+                    import webbrowser # Link açmak için
+                    webbrowser.open(indirme_linki)
+            else:
+                if manuel:
+                    messagebox.showinfo("Durum", f"Uygulamanız güncel.\nSürüm: {MEVCUT_SURUM}")
+
+        def hata(e):
+            if manuel:
+                messagebox.showerror("Bağlantı Hatası", f"İnternet bağlantısı kurulamadı.\n{e}")
 
-        threading.Thread(target=thread_hedefi, daemon=True).start()
+        if not manuel:
+            kayit = guncelleme.taze_kayit(GUNCELLEME_ONBELLEGI, url)
+            if kayit is not None:
+                sonuc = guncelleme.surum_bilgisi(kayit)
+                # Bildirim pencere kurulurken değil, ana döngüden (root.after yoklaması) gösterilir
+                if sonuc is not None and sonuc[0] != MEVCUT_SURUM: gorevler.calistir("guncelleme", lambda: sonuc, bitince=bitti)
+                return
+        gorevler.calistir("guncelleme", lambda: guncelleme.son_surum(GUNCELLEME_ONBELLEGI, url), bitince=bitti, hata=hata)
 
 # --- GÜVENLİ KULLANICI YÖNETİCİSİ 
 class UserManager:
     def __init__(self):
-        self.users = {}
-        self.load_users()
-
-    def load_users(self):
-        if os.path.exists(USERS_DOSYASI):
-            with open(USERS_DOSYASI, "r", encoding="utf-8") as f:
-                try:
-                    self.users = json.load(f)
-                except json.JSONDecodeError:
-                    self.users = {}
-
-    def save_users(self):
-        with open(USERS_DOSYASI, "w", encoding="utf-8") as f:
-            json.dump(self.users, f, indent=4)
-
-    def hash_password(self, password, salt=None):
-        if salt is None:
-            salt = os.urandom(16)
-        else:
-            salt = bytes.fromhex(salt)
-        pwd_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
-        return f"{salt.hex()}:{pwd_hash.hex()}"
+        # Hesaplar tek tek okunur/yazılır; tüm kayıt belleğe alınmaz
+        self.depo = kullanici_deposu_ac(DEPOLAMA_TURU, DATA_KLASORU, USERS_DOSYASI, SQLITE_DOSYASI)
 
-    def register(self, username, password):
-        if username in self.users:
-            return False, "Bu kullanıcı adı zaten alınmış."
+    def hash_password(self, password):
+        return sifre_ozeti(password)
+
+    # Özet hesaplama (dogrula/hash_password) işçi thread'inde çalışabilir; depoya yalnızca ana thread yazar
+    def on_kontrol(self, username, password):
+        if username and self.depo.getir(username) is not None:
+            return "Bu kullanıcı adı zaten alınmış."
         if not username or not password:
-            return False, "Kullanıcı adı ve şifre boş olamaz."
-        self.users[username] = self.hash_password(password)
-        self.save_users()
+            return "Kullanıcı adı ve şifre boş olamaz."
+        return None
+
+    def kayit_tamamla(self, username, ozet):
+        if not self.depo.ekle(username, ozet): # Özet hesaplanırken aynı ad (başka bir örnekte de) alınmış olabilir
+            return False, "Bu kullanıcı adı zaten alınmış."
         return True, "Kayıt başarılı."
 
+    def register(self, username, password):
+        hata = self.on_kontrol(username, password)
+        if hata: return False, hata
+        return self.kayit_tamamla(username, self.hash_password(password))
+
+    def dogrula(self, username, password):
+        """
+        (başarılı, yeni özet) döner. Kayıt eski biçimde veya düşük maliyetliyse
+        doğru parolayla güncel ayarda yeni özet üretilir; saklamak ozet_guncelle'nin işidir.
+        """
+        stored_data = self.depo.getir(username)
+        if stored_data is None or not sifre_dogrula(password, stored_data):
+            sure_esitle(password, stored_data) # Olmayan kullanıcı ve eski kayıt da güncel maliyetle reddedilsin
+            return False, None
+        return True, (sifre_ozeti(password) if yukseltilmeli_mi(stored_data) else None)
+
+    def ozet_guncelle(self, username, ozet):
+        self.depo.guncelle(username, ozet)
+
     def login(self, username, password):
-        if username not in self.users:
-            return False
-        stored_data = self.users[username]
-        try:
-            salt_hex, stored_hash_hex = stored_data.split(':')
-            new_hash_data = self.hash_password(password, salt_hex)
-            _, new_hash_hex = new_hash_data.split(':')
-            if hmac.compare_digest(stored_hash_hex, new_hash_hex):
-                return True
-        except ValueError:
-            return False 
-        return False
+        basarili, yeni_ozet = self.dogrula(username, password)
+        if yeni_ozet: self.ozet_guncelle(username, yeni_ozet)
+        return basarili
 
 # --- GİRİŞ EKRANI ---
 class LoginWindow:
@@ -139,6 +147,7 @@ class LoginWindow:
         self.root = root
         self.on_login_success = on_login_success
         self.user_manager = UserManager()
+        self.gorevler = None # İlk giriş/kayıt denemesinde kurulur
         
         self.frame = tk.Frame(root, bg="#eceff1")
         self.frame.place(relwidth=1, relheight=1)
@@ -162,13 +171,32 @@ class LoginWindow:
         btn_frame = tk.Frame(box, bg="white")
         btn_frame.pack(fill=tk.X)
 
-        tk.Button(btn_frame, text="Giriş Yap", command=self.login, bg="#4CAF50", fg="white", width=12, font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=5)
-        tk.Button(btn_frame, text="Kayıt Ol", command=self.register, bg="#2196F3", fg="white", width=12, font=("Arial", 10, "bold")).pack(side=tk.RIGHT, padx=5)
+        self.btn_giris = tk.Button(btn_frame, text="Giriş Yap", command=self.login, bg="#4CAF50", fg="white", width=12, font=("Arial", 10, "bold")); self.btn_giris.pack(side=tk.LEFT, padx=5)
+        self.btn_kayit = tk.Button(btn_frame, text="Kayıt Ol", command=self.register, bg="#2196F3", fg="white", width=12, font=("Arial", 10, "bold")); self.btn_kayit.pack(side=tk.RIGHT, padx=5)
+        self.lbl_durum = tk.Label(box, text="", bg="white", fg="gray", font=("Arial", 9)); self.lbl_durum.pack(pady=(10, 0))
+
+    def mesgul(self, durum):
+        # PBKDF2 işçide çalışırken pencere tepki verir ama ikinci bir deneme başlatılamaz
+        self.btn_giris.config(state=tk.DISABLED if durum else tk.NORMAL)
+        self.btn_kayit.config(state=tk.DISABLED if durum else tk.NORMAL)
+        self.lbl_durum.config(text="Doğrulanıyor..." if durum else "")
+
+    def arka_planda(self, is_fonk, bitince):
+        if self.gorevler is None:
+            from gorevler import GorevYoneticisi
+            self.gorevler = GorevYoneticisi(self.root, isci_sayisi=1, mesgul_degisti=self.mesgul)
+        if str(self.btn_giris["state"]) == tk.DISABLED: return # Enter ile ikinci deneme
+        self.gorevler.calistir("sifre", is_fonk, bitince=bitince)
 
     def login(self):
         u = self.entry_user.get().strip()
         p = self.entry_pass.get().strip()
-        if self.user_manager.login(u, p):
+        self.arka_planda(lambda: self.user_manager.dogrula(u, p), lambda sonuc: self.login_bitti(u, *sonuc))
+
+    def login_bitti(self, u, basarili, yeni_ozet):
+        if basarili:
+            if yeni_ozet: self.user_manager.ozet_guncelle(u, yeni_ozet) # Eski/ucuz özet sessizce yükseltilir
+            self.gorevler.kapat()
             self.frame.destroy()
             self.on_login_success(u)
         else:
@@ -177,29 +205,178 @@ class LoginWindow:
     def register(self):
         u = self.entry_user.get().strip()
         p = self.entry_pass.get().strip()
-        success, msg = self.user_manager.register(u, p)
+        hata = self.user_manager.on_kontrol(u, p)
+        if hata: messagebox.showerror("Hata", hata); return
+        self.arka_planda(lambda: self.user_manager.hash_password(p), lambda ozet: self.register_bitti(u, ozet))
+
+    def register_bitti(self, u, ozet):
+        success, msg = self.user_manager.kayit_tamamla(u, ozet)
         if success:
             messagebox.showinfo("Başarılı", f"Kullanıcı oluşturuldu: {u}")
         else:
             messagebox.showerror("Hata", msg)
 
+# --- KALICI GRAFİK ALANI ---
+class GrafikAlani:
+    """
+    Sağ panelde tek ve kalıcı bir tuval + araç çubuğu. Görünüm değişince Tk widget'ları yeniden
+    kurulmaz; aynı Figure temizlenir (eski eksen ve sanatçılar hemen bırakılır) ve yeniden çizilir.
+    """
+    def __init__(self, master):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+        self.cerceve = tk.Frame(master, bg="white")
+        self.fig = Figure(figsize=(12, 7), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.cerceve)
+        toolbar_frame = tk.Frame(self.cerceve); toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame); self.toolbar.update()
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._baglantilar = []
+        self._bekleyen_cizim = None # after_idle kimliği; draw_idle gibi art arda istekler tek çizimde birleşir
+        self._cizim_eylemi = None
+
+    def _ciz(self):
+        # Ertelenmiş çizim kendisini isteyen eylemin "ciz" evresine sayılır
+        eylem, self._cizim_eylemi, self._bekleyen_cizim = self._cizim_eylemi, None, None
+        with izleyici.devam(eylem), izleyici.eylem("canvas.draw"), izleyici.evre("ciz"): self.canvas.draw()
+
+    def yeni_sekil(self):
+        # Önceki görünümün olay bağlantıları Figure'a aittir; clf() onları silmez
+        for cid in self._baglantilar: self.canvas.mpl_disconnect(cid)
+        self._baglantilar = []
+        from grafikler import sekli_sifirla
+        return sekli_sifirla(self.fig)
+
+    def baglan(self, olay, fonk):
+        self._baglantilar.append(self.canvas.mpl_connect(olay, fonk))
+
+    def goster(self):
+        if not self.cerceve.winfo_ismapped(): self.cerceve.pack(fill=tk.BOTH, expand=True)
+        self.toolbar.update() # Yakınlaştırma geçmişi yeni görünüm için sıfırlanır
+        tuval = self.canvas.get_tk_widget()
+        if self._bekleyen_cizim is not None: tuval.after_cancel(self._bekleyen_cizim); izleyici.birak(self._cizim_eylemi)
+        self._cizim_eylemi = izleyici.tut(); self._bekleyen_cizim = tuval.after_idle(self._ciz)
+
+    def gizle(self):
+        self.cerceve.pack_forget()
+
+# --- SANAL KAYIT LİSTESİ ---
+class SanalListe:
+    """
+    On binlerce kayıt için sanal liste. Treeview'de yalnızca görünen pencere kadar satır bulunur;
+    kaydırma çubuğu kendi konum hesabıyla veri kaynağındaki kaydırmaya eşlenir.
+    Kaynak: sıralı gün sıraları (TarihDeposu); en yeni kayıt en üstte gösterilir.
+    """
+    def __init__(self, master, kaynak):
+        self.kaynak = kaynak
+        self.ust = 0 # Görünen ilk satırın (yeniden eskiye) sırası
+        self.gorunen = 20
+        self.secili = None # Seçili kaydın gün sırası; pencere kaysa da korunur
+        self.tree = ttk.Treeview(master, columns=('tarih', 'gun'), show='headings', height=self.gorunen, selectmode='browse')
+        self.tree.heading('tarih', text='Tarih'); self.tree.heading('gun', text='Gün')
+        self.tree.column('tarih', width=150, anchor='center'); self.tree.column('gun', width=150, anchor='center')
+        self.sb = ttk.Scrollbar(master, orient=tk.VERTICAL, command=self._kaydirma_cubugu)
+        self.sb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=5)
+        self.tree.bind("<<TreeviewSelect>>", self._secim_degisti)
+        self.tree.bind("<Configure>", self._boyut_degisti)
+        self.tree.bind("<MouseWheel>", lambda e: self._kaydir(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda e: self._kaydir(-3))
+        self.tree.bind("<Button-5>", lambda e: self._kaydir(3))
+        self.tree.bind("<Up>", lambda e: self._ok_tusu(-1))
+        self.tree.bind("<Down>", lambda e: self._ok_tusu(1))
+        self._ciz()
+
+    def _sira(self, satir):
+        return self.kaynak.siralar[len(self.kaynak) - 1 - satir]
+
+    def _konum(self, sira):
+        # Kaydın kaynaktaki indeksi (ikili arama); yoksa None
+        i = bisect_left(self.kaynak.siralar, sira)
+        return i if i < len(self.kaynak) and self.kaynak.siralar[i] == sira else None
+
+    def kaynak_ayarla(self, kaynak):
+        """Ekleme/silme sonrası: yalnızca görünen pencere yeniden yazılır, ağaç baştan kurulmaz."""
+        self.kaynak = kaynak
+        if self.secili is not None and self._konum(self.secili) is None: self.secili = None
+        self._ciz()
+
+    def goster(self, sira):
+        # Verilen kaydı görünür yapıp seçer
+        i = self._konum(sira)
+        if i is not None:
+            satir = len(self.kaynak) - 1 - i
+            if not self.ust <= satir < self.ust + self.gorunen: self.ust = satir - self.gorunen // 2
+            self.secili = sira
+        self._ciz()
+
+    def _ciz(self):
+        n = len(self.kaynak)
+        self.ust = max(0, min(self.ust, n - self.gorunen))
+        self.tree.delete(*self.tree.get_children())
+        for satir in range(self.ust, min(self.ust + self.gorunen, n)):
+            s = self._sira(satir); t = date.fromordinal(s)
+            self.tree.insert('', tk.END, iid=str(s), values=(t.strftime("%d.%m.%Y"), t.strftime("%A")))
+        if self.secili is not None and self.tree.exists(str(self.secili)): self.tree.selection_set(str(self.secili))
+        if n: self.sb.set(self.ust / n, min(self.ust + self.gorunen, n) / n)
+        else: self.sb.set(0, 1)
+
+    def _kaydir(self, adim):
+        self.ust += adim; self._ciz()
+        return "break"
+
+    def _kaydirma_cubugu(self, komut, deger, birim=None):
+        if komut == "moveto": self.ust = int(float(deger) * len(self.kaynak))
+        elif birim == "pages": self.ust += int(deger) * self.gorunen
+        else: self.ust += int(deger)
+        self._ciz()
+
+    def _ok_tusu(self, yon):
+        sec = self.tree.selection()
+        if not sec: return None
+        satir = self.ust + self.tree.index(sec[0]) + yon
+        if not 0 <= satir < len(self.kaynak): return "break"
+        # Pencere kenarındaysa pencere kaydırılır; değilse Treeview kendisi işler
+        if satir < self.ust or satir >= self.ust + self.gorunen:
+            self.secili = self._sira(satir); self.ust += yon; self._ciz()
+            return "break"
+        return None
+
+    def _secim_degisti(self, event):
+        sec = self.tree.selection()
+        if sec: self.secili = int(sec[0])
+
+    def _boyut_degisti(self, event):
+        satir_yuksekligi = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        gorunen = max(1, event.height // satir_yuksekligi - 1) # Başlık satırı düşülür
+        if gorunen != self.gorunen: self.gorunen = gorunen; self._ciz()
+
 class EtkinlikTakipUygulamasi:
     def __init__(self, root, current_user, logout_callback):
         self.root = root
         self.current_user = current_user
         self.logout_callback = logout_callback
         self.json_dosya_adi = os.path.join(DATA_KLASORU, f"{self.current_user}.json")
+        self.depo = veri_deposu_ac(DEPOLAMA_TURU, DATA_KLASORU, self.current_user, SQLITE_DOSYASI)
+        dil_ayarla()
         self.root.title(f"Etkinlik Takip Paneli - Kullanıcı: {self.current_user} ({MEVCUT_SURUM})")
         
         self.main_container = tk.Frame(root)
         self.main_container.pack(fill=tk.BOTH, expand=True)
 
-        self.veriler = {} 
+        self.veriler = {} # Etkinlik adı -> EtkinlikIndeksi (ilk erişime kadar ham tarih metinleri listesi)
         self.aktif_etkinlik_adi = tk.StringVar()
-        self.tarih_listesi = [] 
+        self.tarih_deposu = TarihDeposu()
+        self.analiz_onbellegi = AnalizOnbellegi()
+        from gun_bitmapi import BitmapIndeksi # NumPy giriş ekranında gerekmez
+        self.gun_bitmapleri = BitmapIndeksi() # Etkinlik karşılaştırma için; json_kaydet ile eşzamanlı tutulur
+        self.grafik_alani = None # İlk grafikte kurulur
+        self.zaman_cizelgesi = None
+        self.sanal_liste = None
+        self.lbl_ozet = None # Karşılama ekranındaki seri/aralık özeti
         self.secilen_yil = tk.StringVar()
-
-        self.veri_tabanini_yukle()
+        from gorevler import GorevYoneticisi # concurrent.futures giriş ekranında gerekmez
+        self.gorevler = GorevYoneticisi(root, mesgul_degisti=self.mesgul_goster)
 
         main_pane = tk.PanedWindow(self.main_container, orient=tk.HORIZONTAL)
         main_pane.pack(fill=tk.BOTH, expand=True)
@@ -207,52 +384,93 @@ class EtkinlikTakipUygulamasi:
         self.sidebar = tk.Frame(main_pane, width=280, bg="#f0f0f0", relief=tk.RIDGE, borderwidth=1)
         main_pane.add(self.sidebar)
         self.olustur_sidebar()
+        self.olustur_menu()
 
         self.content_frame = tk.Frame(main_pane, bg="white")
         main_pane.add(self.content_frame)
 
-        self.etkinlik_degistir(None)
         self.karsilama_ekrani()
+        self.veri_tabanini_yukle()
         
-        UpdateManager.kontrol_et(manuel=False)
+        UpdateManager.kontrol_et(self.gorevler, manuel=False)
 
+    @izle
     def veri_tabanini_yukle(self):
-        if os.path.exists(self.json_dosya_adi):
-            with open(self.json_dosya_adi, "r", encoding="utf-8") as f:
-                try: self.veriler = json.load(f)
-                except json.JSONDecodeError: self.veriler = {}
-        if not self.veriler and os.path.exists(ESKI_TXT_DOSYA_ADI):
-            if messagebox.askyesno("Veri Aktarımı", "Eski veriler bulundu. Hesabınıza aktarılsın mı?"):
-                eski = []
-                with open(ESKI_TXT_DOSYA_ADI, "r") as f:
-                    for s in f:
-                        c = s.split(']')[-1].strip() if ']' in s else s.strip()
-                        if c: eski.append(c)
-                self.veriler["Genel Etkinlik"] = eski
-                self.json_kaydet()
+        # Dosya okuma işçide; göç sorusu ve arayüz güncellemesi ana thread'de
+        self.lbl_bilgi.config(text="Veriler yükleniyor...", fg="#333")
+        self.gorevler.calistir("yukle", izleyici.evrede("yukle", self.depo.yukle), bitince=self.veri_tabani_yuklendi)
+
+    def veri_tabani_yuklendi(self, veriler):
+        self.veriler = veriler
+        eskiyi_aktar = (not self.veriler and os.path.exists(ESKI_TXT_DOSYA_ADI)
+                        and messagebox.askyesno("Veri Aktarımı", "Eski veriler bulundu. Hesabınıza aktarılsın mı?"))
         if not self.veriler:
             self.veriler = {"Genel Etkinlik": []}
             self.json_kaydet()
+        self.combo_etkinlik['values'] = list(self.veriler.keys())
+        self.combo_etkinlik.current(0)
+        self.etkinlik_degistir(None)
+        if eskiyi_aktar: self.ice_aktarmayi_baslat(ESKI_TXT_DOSYA_ADI, "Genel Etkinlik")
+
+    @izle
+    def json_kaydet(self, *islemler):
+        # İşlem verilirse yalnızca günlüğe eklenir; verilmezse tüm veri anlık görüntü olarak yazılır
+        if islemler:
+            with izleyici.evre("kaydet"): self.depo.uygula(islemler)
+            self.gun_bitmapleri.uygula(islemler)
+            # Önbellekte yalnızca değişen etkinliklerin türetilmiş verileri düşürülür
+            for islem in islemler:
+                self.analiz_onbellegi.gecersiz_kil(islem[1])
+                if islem[0] == ISLEM_ETKINLIK_ADLANDIR: self.analiz_onbellegi.gecersiz_kil(islem[2])
+        else:
+            with izleyici.evre("kaydet"): self.depo.hepsini_yaz({ad: v if isinstance(v, list) else v.metinler() for ad, v in self.veriler.items()})
+            self.analiz_onbellegi.temizle(); self.gun_bitmapleri.temizle()
+
+    def analiz_getir(self, anahtar, hesapla):
+        etkinlik = self.aktif_etkinlik_adi.get()
+        if self.veriler.get(etkinlik) is not self.tarih_deposu: return hesapla() # Etkinlik henüz ayrıştırılıyor; saklanmaz
+        return self.analiz_onbellegi.getir(etkinlik, anahtar, hesapla)
 
-    def json_kaydet(self):
-        with open(self.json_dosya_adi, "w", encoding="utf-8") as f:
-            json.dump(self.veriler, f, ensure_ascii=False, indent=4)
+    def arka_planda_goster(self, anahtar, hesapla, ciz):
+        """
+        Önbellekte varsa hemen çizer; yoksa hesaplamayı işçiye verir ve sonuç gelince ana thread'de çizer.
+        hesapla Tk'ye ve canlı indekslere dokunmamalıdır (girdileri önceden kopyalanır).
+        Başka bir görünüme geçilirse bekleyen hesaplama iptal edilir.
+        """
+        etkinlik = self.aktif_etkinlik_adi.get(); deposu = self.tarih_deposu; ciz = izleyici.evrede("ciz", ciz)
+        # Sonuç yalnızca hesaplandığı indeks hâlâ bu etkinliğinkiyse bu adla saklanır (ayrıştırma sürerken değildir)
+        gecerli = lambda: self.veriler.get(etkinlik) is deposu
+        if gecerli():
+            bulundu, deger = self.analiz_onbellegi.bul(etkinlik, anahtar)
+            if bulundu: self.gorevler.iptal("gorunum"); ciz(deger); return
+        surum = self.analiz_onbellegi.surum(etkinlik)
+        def bitti(deger):
+            if gecerli(): self.analiz_onbellegi.koy(etkinlik, surum, anahtar, deger)
+            ciz(deger)
+        self.gorevler.calistir("gorunum", izleyici.evrede("hesapla", hesapla), bitince=bitti)
+
+    def mesgul_goster(self, mesgul):
+        if mesgul: self.pb_mesgul.pack(side=tk.BOTTOM, pady=2); self.pb_mesgul.start(15)
+        else: self.pb_mesgul.stop(); self.pb_mesgul.pack_forget()
+
+    def etkinlik_indeksi(self, ad):
+        # Ham metin listesi ilk erişimde bir kez ayrıştırılır; sonrası yerinde güncellenir
+        ind = self.veriler[ad]
+        if not isinstance(ind, EtkinlikIndeksi): ind = self.veriler[ad] = EtkinlikIndeksi.metinlerden(ind)
+        return ind
 
     def aktif_verileri_yukle(self):
         secili = self.aktif_etkinlik_adi.get()
         if not secili or secili not in self.veriler:
             if self.veriler: secili = list(self.veriler.keys())[0]; self.aktif_etkinlik_adi.set(secili)
-            else: self.tarih_listesi = []; return
-        raw = self.veriler[secili]
-        self.tarih_listesi = []
-        for d in raw:
-            try: self.tarih_listesi.append(datetime.strptime(d, "%d.%m.%Y"))
-            except ValueError: continue
-        self.tarih_listesi.sort()
+            else: self.tarih_deposu = TarihDeposu(); return
+        self.tarih_deposu = self.etkinlik_indeksi(secili)
         self.guncelle_yil_combo()
 
     def cikis_yap(self):
         if messagebox.askyesno("Çıkış", "Oturumu kapatmak istiyor musunuz?"):
+            self.gorevler.kapat()
+            izleyici.bildir = None; self.root.config(menu="")
             self.main_container.destroy()
             self.logout_callback()
 
@@ -269,12 +487,13 @@ class EtkinlikTakipUygulamasi:
         tk.Button(self.sidebar, text="⚙️ Etkinlikleri Yönet", command=self.etkinlik_yonetimi_penceresi, bg="#607d8b", fg="white", width=22).pack(pady=5)
         
         ttk.Separator(self.sidebar, orient='horizontal').pack(fill='x', padx=10, pady=10)
-        tk.Label(self.sidebar, text="Çalışma Yılı:", bg="#f0f0f0").pack(pady=(5, 2))
-        self.yil_combo = ttk.Combobox(self.sidebar, textvariable=self.secilen_yil, state="readonly", width=18)
+        tk.Label(self.sidebar, text="Tarih Filtresi:", bg="#f0f0f0").pack(pady=(5, 2))
+        self.yil_combo = ttk.Combobox(self.sidebar, textvariable=self.secilen_yil, state="readonly", width=22)
+        self.yil_combo.bind("<<ComboboxSelected>>", self.filtre_degisti)
         self.yil_combo.pack(pady=2)
         
         tk.Label(self.sidebar, text="Hızlı Tarih Ekle:", bg="#f0f0f0").pack(pady=(15, 2))
-        self.cal_entry = DateEntry(self.sidebar, width=16, background='darkblue', foreground='white', borderwidth=2, date_pattern='dd.mm.yyyy', locale='tr_TR')
+        self.cal_entry = tarih_secici(self.sidebar)
         self.cal_entry.pack(pady=2)
         tk.Button(self.sidebar, text="Ekle", command=self.tarih_ekle, bg="#4CAF50", fg="white", width=22).pack(pady=5)
         
@@ -286,19 +505,72 @@ class EtkinlikTakipUygulamasi:
         tk.Button(self.sidebar, text="📊 Fark Analizi", command=self.fark_grafik_goster, **btn_style).pack(pady=2)
         tk.Button(self.sidebar, text="📊 Alışkanlık Histogramı", command=self.histogram_goster, **btn_style).pack(pady=2)
         tk.Button(self.sidebar, text="📅 Aylık Dağılım", command=self.aylik_ozet_goster, **btn_style).pack(pady=2)
+        tk.Button(self.sidebar, text="🔀 Etkinlik Karşılaştırma", command=self.karsilastirma_goster, **btn_style).pack(pady=2)
         
         ttk.Separator(self.sidebar, orient='horizontal').pack(fill='x', padx=10, pady=10)
-        tk.Button(self.sidebar, text="🔄 Güncellemeleri Kontrol Et", command=lambda: UpdateManager.kontrol_et(manuel=True), bg="#e0f7fa", width=24).pack(pady=5)
+        tk.Button(self.sidebar, text="📥 Dosyadan İçe Aktar (TXT/CSV/ICS)", command=self.dosya_ice_aktar, bg="#e8f5e9", width=24).pack(pady=2)
+        tk.Button(self.sidebar, text="🔄 Güncellemeleri Kontrol Et", command=lambda: UpdateManager.kontrol_et(self.gorevler, manuel=True), bg="#e0f7fa", width=24).pack(pady=5)
 
         tk.Button(self.sidebar, text="🚪 Çıkış Yap", command=self.cikis_yap, bg="#ffab91", width=22).pack(side=tk.BOTTOM, pady=20)
         self.lbl_bilgi = tk.Label(self.sidebar, text="", bg="#f0f0f0", fg="blue", wraplength=200); self.lbl_bilgi.pack(side=tk.BOTTOM, pady=5)
-
+        self.pb_mesgul = ttk.Progressbar(self.sidebar, mode="indeterminate", length=180) # Arka plan işi sürerken görünür
+        self.lbl_sure = tk.Label(self.sidebar, text="", bg="#f0f0f0", fg="#777", font=("Consolas", 8), wraplength=240, justify=tk.LEFT)
+        self.olcum_ayarla(izleyici.acik, izleyici.profil)
+
+    # --- PERFORMANS ÖLÇÜMÜ (isteğe bağlı; ETKINLIK_IZLEME=1|profil veya Araçlar menüsü) ---
+    def olustur_menu(self):
+        menu = tk.Menu(self.root); araclar = tk.Menu(menu, tearoff=0); menu.add_cascade(label="Araçlar", menu=araclar)
+        self.olcum_acik = tk.BooleanVar(value=izleyici.acik); self.profil_acik = tk.BooleanVar(value=izleyici.profil)
+        araclar.add_checkbutton(label="Performans ölçümü", variable=self.olcum_acik, command=lambda: self.olcum_ayarla(self.olcum_acik.get(), self.profil_acik.get()))
+        araclar.add_checkbutton(label="Eylem başına cProfile", variable=self.profil_acik, command=lambda: self.olcum_ayarla(self.olcum_acik.get() or self.profil_acik.get(), self.profil_acik.get()))
+        araclar.add_separator()
+        araclar.add_command(label="Ölçüm özeti", command=self.olcum_ozeti_goster)
+        araclar.add_command(label="İz dosyasını kaydet (Chrome trace)", command=self.iz_kaydet)
+        self.root.config(menu=menu)
+
+    def olcum_ayarla(self, acik, profil=False):
+        izleyici.ayarla("profil" if acik and profil else "1" if acik else "")
+        if hasattr(self, "olcum_acik"): self.olcum_acik.set(izleyici.acik); self.profil_acik.set(izleyici.profil)
+        if izleyici.acik: izleyici.bildir = lambda metin: self.lbl_sure.config(text=metin); self.lbl_sure.pack(side=tk.BOTTOM, before=self.lbl_bilgi)
+        else: izleyici.bildir = None; self.lbl_sure.pack_forget()
+
+    def olcum_ozeti_goster(self):
+        ozet = izleyici.ozet()
+        if not ozet: messagebox.showinfo("Ölçüm Özeti", "Henüz ölçüm yok. Araçlar > Performans ölçümü'nü açın."); return
+        satirlar = [f"{ad:<28}{n:>5}{p50:>9.1f}{p95:>9.1f}" for ad, (n, p50, p95) in ozet.items()]
+        top = tk.Toplevel(self.root); top.title("Ölçüm Özeti (ms)")
+        metin = tk.Text(top, font=("Consolas", 10), width=52, height=min(30, len(satirlar) + 2)); metin.pack(fill=tk.BOTH, expand=True)
+        metin.insert(tk.END, f"{'eylem':<28}{'n':>5}{'p50':>9}{'p95':>9}\n" + "\n".join(satirlar)); metin.config(state=tk.DISABLED)
+
+    def iz_kaydet(self):
+        yol = izleyici.iz_kaydet()
+        if yol: messagebox.showinfo("İz Dosyası", f"Kaydedildi: {os.path.abspath(yol)}\nchrome://tracing veya ui.perfetto.dev ile açın.")
+        else: messagebox.showwarning("İz Dosyası", "Kaydedilecek ölçüm yok.")
+
+    @izle
     def etkinlik_degistir(self, event):
+        self.gorevler.iptal("gorunum") # Önceki etkinlik için bekleyen grafik, ayrıştırma sürerken de çizilmesin
+        secili = self.aktif_etkinlik_adi.get(); ham = self.veriler.get(secili)
+        if isinstance(ham, list) and ham:
+            # İlk kez açılan etkinlik işçide ayrıştırılır; bu sırada kayıt eklenirse o sonuç geçerli kalır
+            def bitti(ind):
+                if self.veriler.get(secili) is ham: self.veriler[secili] = ind
+                if self.aktif_etkinlik_adi.get() == secili: self.etkinlik_degistir(event)
+            self.lbl_bilgi.config(text=f"Yükleniyor: {secili}", fg="#333")
+            # Ayrıştırma bitene kadar önceki etkinliğin indeksi yeni adla gösterilmez
+            self.tarih_deposu = TarihDeposu(); self.kayit_listesini_yenile()
+            def ayristir():
+                from istatistik import istatistikler
+                ind = EtkinlikIndeksi.metinlerden(ham); istatistikler(ind) # Karşılama ekranı özeti de işçide kurulur
+                return ind
+            self.gorevler.calistir("etkinlik", izleyici.evrede("yukle", ayristir), bitince=bitti)
+            return
         self.aktif_verileri_yukle()
         self.lbl_bilgi.config(text=f"Seçili: {self.aktif_etkinlik_adi.get()}", fg="#333")
         self.temizle_sag_panel()
         self.karsilama_ekrani()
 
+    @izle
     def etkinlik_yonetimi_penceresi(self):
         top = tk.Toplevel(self.root); top.title("Etkinlik Yönetimi"); top.geometry("400x400")
         tk.Label(top, text="Kayıtlı Etkinlikler:", font=("Arial", 10, "bold")).pack(pady=10)
@@ -310,13 +582,13 @@ class EtkinlikTakipUygulamasi:
             ad = simpledialog.askstring("Yeni", "Etkinlik Adı:")
             if ad:
                 if ad in self.veriler: messagebox.showerror("Hata", "Mevcut")
-                else: self.veriler[ad]=[]; self.json_kaydet(); listbox.insert(tk.END, ad); self.combo_etkinlik['values']=list(self.veriler.keys()); self.combo_etkinlik.set(ad); self.etkinlik_degistir(None)
+                else: self.veriler[ad]=EtkinlikIndeksi(); self.json_kaydet((ISLEM_ETKINLIK_EKLE, ad)); listbox.insert(tk.END, ad); self.combo_etkinlik['values']=list(self.veriler.keys()); self.combo_etkinlik.set(ad); self.etkinlik_degistir(None)
         def sil():
             sel = listbox.curselection()
             if not sel: return
             ad = listbox.get(sel)
             if len(self.veriler)==1: messagebox.showwarning("Uyarı", "Son etkinlik silinemez."); return
-            if messagebox.askyesno("Sil", f"'{ad}' silinsin mi?"): del self.veriler[ad]; self.json_kaydet(); listbox.delete(sel); self.combo_etkinlik['values']=list(self.veriler.keys()); self.combo_etkinlik.current(0); self.etkinlik_degistir(None)
+            if messagebox.askyesno("Sil", f"'{ad}' silinsin mi?"): del self.veriler[ad]; self.json_kaydet((ISLEM_ETKINLIK_SIL, ad)); listbox.delete(sel); self.combo_etkinlik['values']=list(self.veriler.keys()); self.combo_etkinlik.current(0); self.etkinlik_degistir(None)
         def duzenle():
             sel = listbox.curselection()
             if not sel: return
@@ -324,174 +596,255 @@ class EtkinlikTakipUygulamasi:
             yeni = simpledialog.askstring("Düzenle", "Yeni Ad:", initialvalue=eski)
             if yeni and yeni!=eski:
                 if yeni in self.veriler: messagebox.showerror("Hata", "Mevcut")
-                else: self.veriler[yeni]=self.veriler.pop(eski); self.json_kaydet(); listbox.delete(sel); listbox.insert(sel, yeni); self.combo_etkinlik['values']=list(self.veriler.keys()); self.combo_etkinlik.set(yeni); self.aktif_verileri_yukle()
+                else: self.veriler[yeni]=self.veriler.pop(eski); self.json_kaydet((ISLEM_ETKINLIK_ADLANDIR, eski, yeni)); listbox.delete(sel); listbox.insert(sel, yeni); self.combo_etkinlik['values']=list(self.veriler.keys()); self.combo_etkinlik.set(yeni); self.aktif_verileri_yukle()
 
         tk.Button(btn_frame, text="➕ Yeni", command=yeni, bg="#4CAF50", fg="white").pack(side=tk.LEFT, padx=5)
         tk.Button(btn_frame, text="✏️ Düzenle", command=duzenle, bg="#FFC107").pack(side=tk.LEFT, padx=5)
         tk.Button(btn_frame, text="🗑️ Sil", command=sil, bg="#F44336", fg="white").pack(side=tk.LEFT, padx=5)
 
+    # --- İÇE AKTARMA ---
+    @izle
+    def dosya_ice_aktar(self):
+        from tkinter import filedialog
+        import ice_aktar
+        if "ice_aktar" in self.gorevler.kanallar: messagebox.showwarning("İçe Aktar", "Süren bir içe aktarma var."); return
+        yol = filedialog.askopenfilename(title="İçe aktarılacak dosya", filetypes=[("Tarih dosyaları", "*.txt *.csv *.ics"), ("Tüm dosyalar", "*.*")])
+        if not yol: return
+        hedef = self.aktif_etkinlik_adi.get()
+        kaynak_adlari = ice_aktar.bicim_tahmin(yol) != "txt" and messagebox.askyesno(
+            "İçe Aktar", f"Dosyadaki etkinlik adları kullanılsın mı?\n(Hayır: tüm tarihler '{hedef}' etkinliğine eklenir; adı olmayan kayıtlar her durumda oraya gider.)")
+        self.ice_aktarmayi_baslat(yol, hedef, kaynak_adlari)
+
+    def ice_aktarmayi_baslat(self, yol, hedef, kaynak_adlari=False):
+        # İşçiye canlı indeksler değil kopyaları verilir; sürümler bitişte arada değişiklik olup olmadığını gösterir
+        from ice_aktar import ice_aktar, islemler
+        mevcut = {ad: v.siralar[:] if isinstance(v, EtkinlikIndeksi) else list(v) for ad, v in self.veriler.items()}
+        surumler = {ad: self.analiz_onbellegi.surum(ad) for ad in self.veriler}
+        def is_fonk(bildir):
+            # Depoya yazma ana thread'de (ice_aktarma_bitti); depo bağlantısı/günlüğü thread'ler arasında paylaşılmaz
+            sonuc = ice_aktar(yol, mevcut, hedef, kaynak_adlari, ilerleme=bildir)
+            sonuc["islemler"] = list(islemler(sonuc))
+            return sonuc
+        def ilerleme(okunan, toplam, eklenen):
+            self.lbl_bilgi.config(text=f"İçe aktarılıyor: %{100 * okunan // max(toplam, 1)} ({eklenen} yeni)", fg="#333")
+        self.lbl_bilgi.config(text=f"İçe aktarılıyor: {os.path.basename(yol)}", fg="#333")
+        self.gorevler.calistir("ice_aktar", izleyici.evrede("yukle", is_fonk), bitince=lambda sonuc: self.ice_aktarma_bitti(sonuc, surumler),
+                               hata=lambda e: messagebox.showerror("İçe Aktar", f"İçe aktarılamadı: {e}"), ilerleme=ilerleme)
+
+    def ice_aktarma_bitti(self, sonuc, surumler):
+        if sonuc["islemler"]:
+            # Tek kayıt (günlükte tek yazma / SQLite'ta tek işlem); yazılamazsa bellekteki veri de değiştirilmez
+            try:
+                with izleyici.evre("kaydet"): self.depo.uygula(sonuc["islemler"])
+            except Exception as e: messagebox.showerror("İçe Aktar", f"Kaydedilemedi: {e}"); return
+        for ad, ind in sonuc["indeksler"].items():
+            if ad in self.veriler and self.analiz_onbellegi.surum(ad) != surumler.get(ad):
+                # İçe aktarma sürerken etkinlik değişti: yeni günler güncel indeksle birleştirilir
+                ind = EtkinlikIndeksi(sorted(self.etkinlik_indeksi(ad).kume.union(sonuc["yeni"][ad])))
+            self.veriler[ad] = ind; self.analiz_onbellegi.gecersiz_kil(ad); self.gun_bitmapleri.dusur(ad)
+        self.combo_etkinlik['values'] = list(self.veriler.keys())
+        self.lbl_bilgi.config(text=f"İçe aktarıldı: {sonuc['eklenen']} yeni, {sonuc['tekrar']} tekrar, {sonuc['hatali']} geçersiz satır", fg="green")
+        if self.aktif_etkinlik_adi.get() in sonuc["indeksler"]:
+            self.aktif_verileri_yukle(); self.kayit_listesini_yenile()
+            liste_acik = self.sanal_liste is not None and self.sanal_liste.tree.winfo_exists()
+            if not liste_acik and not (self.grafik_alani and self.grafik_alani.cerceve.winfo_ismapped()): self.karsilama_ekrani()
+
     def karsilama_ekrani(self):
         self.temizle_sag_panel()
         secili = self.aktif_etkinlik_adi.get()
-        sayi = len(self.tarih_listesi)
+        sayi = len(self.tarih_deposu)
         frame = tk.Frame(self.content_frame, bg="white")
         frame.place(relx=0.5, rely=0.5, anchor="center")
         tk.Label(frame, text=f"Hoşgeldin, {self.current_user}!", font=("Arial", 16), bg="white", fg="#607d8b").pack(pady=5)
         tk.Label(frame, text=f"Aktif Etkinlik: {secili}", font=("Arial", 20, "bold"), bg="white", fg="#333").pack(pady=10)
         tk.Label(frame, text=f"Toplam Kayıt: {sayi}", font=("Arial", 14), bg="white", fg="#666").pack(pady=5)
+        self.lbl_ozet = tk.Label(frame, text="", font=("Arial", 11), bg="white", fg="#555", justify=tk.CENTER); self.lbl_ozet.pack(pady=5)
+        self.karsilama_ozetini_yenile()
+
+    def karsilama_ozetini_yenile(self):
+        # Seri/aralık istatistikleri indeksle birlikte güncel tutulur; geçmiş yeniden taranmaz
+        lbl = self.lbl_ozet
+        if lbl is None or not lbl.winfo_exists() or not isinstance(self.tarih_deposu, EtkinlikIndeksi): return
+        from istatistik import istatistikler
+        o = istatistikler(self.tarih_deposu).ozet(self.tarih_deposu.siralar, date.today().toordinal())
+        if not o["kayit"]: lbl.config(text=""); return
+        satirlar = [f"Son kayıttan beri: {o['son_kayittan_beri_gun']} gün" if o["son_kayittan_beri_gun"] is not None else "Yalnızca ileri tarihli kayıt var",
+                    f"🔥 Mevcut seri: {o['mevcut_seri']} gün · En uzun seri: {o['en_uzun_seri']} gün",
+                    f"Bu hafta: {o['bu_hafta']} · Son 30 gün: {o['son_30_gun']} · Haftalık ort. (90 gün): {o['haftalik_ortalama_90']}"]
+        if o["en_sik_aralik"] is not None: satirlar.append(f"En sık ara: {o['en_sik_aralik']} gün · Ortalama ara: {o['ortalama_aralik']} gün")
+        lbl.config(text="\n".join(satirlar))
 
     def temizle_sag_panel(self):
-        for widget in self.content_frame.winfo_children(): widget.destroy()
-    def grafigi_panele_gom(self, fig):
-        self.temizle_sag_panel(); canvas = FigureCanvasTkAgg(fig, master=self.content_frame); canvas.draw()
-        toolbar_frame = tk.Frame(self.content_frame); toolbar_frame.pack(side=tk.BOTTOM, fill=tk.X)
-        toolbar = NavigationToolbar2Tk(canvas, toolbar_frame); toolbar.update()
-        canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.gorevler.iptal("gorunum")
+        # Grafik alanı yok edilmez, yalnızca gizlenir
+        kalici = self.grafik_alani.cerceve if self.grafik_alani else None
+        for widget in self.content_frame.winfo_children():
+            if widget is not kalici: widget.destroy()
+        if self.grafik_alani: self.grafik_alani.gizle()
+    def yeni_sekil(self):
+        if self.grafik_alani is None: self.grafik_alani = GrafikAlani(self.content_frame)
+        self.zaman_cizelgesi = None
+        return self.grafik_alani.yeni_sekil()
+    def grafigi_panele_gom(self):
+        self.temizle_sag_panel(); self.grafik_alani.goster()
     
     def guncelle_yil_combo(self):
         curr = self.secilen_yil.get()
-        yillar = sorted(list(set(t.year for t in self.tarih_listesi)), reverse=True) if self.tarih_listesi else []
-        vals = ["Tümü"] + [str(y) for y in yillar]
+        yillar = self.tarih_deposu.yillar()[::-1]
+        vals = ["Tümü"] + list(SON_GUN_FILTRELERI) + [OZEL_ARALIK] + [str(y) for y in yillar]
+        if " - " in curr: vals.insert(len(SON_GUN_FILTRELERI) + 1, curr) # Seçili özel aralık
         self.yil_combo['values'] = vals
         if curr in vals: self.secilen_yil.set(curr)
         else: self.secilen_yil.set("Tümü")
-    def get_filtrelenmis_tarihler(self):
+    @izle
+    def filtre_degisti(self, event=None):
+        if self.secilen_yil.get() == OZEL_ARALIK: self.ozel_aralik_sor(); return
+        self.kayit_listesini_yenile()
+    def ozel_aralik_sor(self):
+        top = tk.Toplevel(self.root); top.title("Tarih Aralığı"); top.geometry("260x170")
+        tk.Label(top, text="Başlangıç:").pack(pady=(10, 2)); ent_ilk = tarih_secici(top); ent_ilk.pack()
+        tk.Label(top, text="Bitiş:").pack(pady=(5, 2)); ent_son = tarih_secici(top); ent_son.pack()
+        def vazgec():
+            self.secilen_yil.set("Tümü"); self.kayit_listesini_yenile(); top.destroy()
+        def uygula():
+            ilk, son = sorted((ent_ilk.get_date(), ent_son.get_date()))
+            self.secilen_yil.set(f"{ilk.strftime('%d.%m.%Y')} - {son.strftime('%d.%m.%Y')}")
+            self.guncelle_yil_combo(); self.kayit_listesini_yenile(); top.destroy()
+        tk.Button(top, text="Uygula", command=uygula, bg="#4CAF50", fg="white").pack(pady=10)
+        top.protocol("WM_DELETE_WINDOW", vazgec)
+    def secili_aralik(self):
+        """Seçili filtrenin [ilk, son) gün sırası aralığı; "Tümü" için None."""
         sel = self.secilen_yil.get()
-        if sel == "Tümü" or not sel: return sorted(self.tarih_listesi)
-        try: return sorted([t for t in self.tarih_listesi if t.year == int(sel)])
-        except: return sorted(self.tarih_listesi)
+        if sel in SON_GUN_FILTRELERI: bugun = date.today().toordinal(); return bugun - SON_GUN_FILTRELERI[sel] + 1, bugun + 1
+        if sel.isdigit(): return date(int(sel), 1, 1).toordinal(), date(int(sel) + 1, 1, 1).toordinal()
+        ilk, _, son = sel.partition(" - ")
+        try: return gun_sirasi(ilk), gun_sirasi(son) + 1
+        except ValueError: return None
+    def get_filtrelenmis_tarihler(self):
+        # "Tümü" indeksin kendisi; diğerleri ikili aramayla bulunan kopyasız görünüm (TarihGorunumu)
+        ara = self.secili_aralik()
+        return self.tarih_deposu if ara is None else self.tarih_deposu.aralik(*ara)
+    @izle
     def tarih_ekle(self):
-        t_str = self.cal_entry.get_date().strftime("%d.%m.%Y"); akt = self.aktif_etkinlik_adi.get()
-        if t_str in self.veriler[akt]: messagebox.showwarning("Bilgi", "Zaten ekli."); return
-        self.veriler[akt].append(t_str); self.json_kaydet(); self.aktif_verileri_yukle(); self.lbl_bilgi.config(text=f"Eklendi: {t_str} ({akt})", fg="green")
-        if hasattr(self, 'tree_widget') and self.tree_widget.winfo_exists(): self.veri_yonetimi_goster()
-
+        akt = self.aktif_etkinlik_adi.get()
+        if akt not in self.veriler: return # Veriler henüz yüklenmedi
+        t = self.cal_entry.get_date(); t_str = t.strftime("%d.%m.%Y"); ind = self.etkinlik_indeksi(akt)
+        if t.toordinal() in ind: messagebox.showwarning("Bilgi", "Zaten ekli."); return
+        yeni_yil = ind.ekle(t.toordinal()); self.json_kaydet((ISLEM_EKLE, akt, t_str)); self.lbl_bilgi.config(text=f"Eklendi: {t_str} ({akt})", fg="green")
+        if yeni_yil: self.guncelle_yil_combo()
+        self.kayit_listesini_yenile(); self.karsilama_ozetini_yenile()
+
+    @izle
     def veri_yonetimi_goster(self):
         self.temizle_sag_panel()
         fr = tk.Frame(self.content_frame, bg="white"); fr.pack(fill=tk.X, padx=20, pady=10)
-        tk.Label(fr, text=f"Liste: {self.aktif_etkinlik_adi.get()}", font=("Arial", 12, "bold"), bg="white").pack(side=tk.LEFT)
+        tk.Label(fr, text=f"Liste: {self.aktif_etkinlik_adi.get()} ({self.secilen_yil.get() or 'Tümü'})", font=("Arial", 12, "bold"), bg="white").pack(side=tk.LEFT)
         bf = tk.Frame(fr, bg="white"); bf.pack(side=tk.RIGHT)
         tk.Button(bf, text="✏️ Düzenle", command=self.kayit_duzenle, bg="#fff0c2").pack(side=tk.LEFT, padx=5)
         tk.Button(bf, text="🗑️ Sil", command=self.kayit_sil, bg="#ffcccc", fg="red").pack(side=tk.LEFT, padx=5)
         
-        cols = ('tarih', 'gun')
-        self.tree_widget = ttk.Treeview(self.content_frame, columns=cols, show='headings', height=20)
-        self.tree_widget.heading('tarih', text='Tarih'); self.tree_widget.heading('gun', text='Gün')
-        self.tree_widget.column('tarih', width=150, anchor='center'); self.tree_widget.column('gun', width=150, anchor='center')
-        
-        sb = ttk.Scrollbar(self.content_frame, orient=tk.VERTICAL, command=self.tree_widget.yview)
-        self.tree_widget.configure(yscroll=sb.set)
-        sb.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=5)
-        
-        for t in reversed(self.get_filtrelenmis_tarihler()):
-            self.tree_widget.insert('', tk.END, values=(t.strftime("%d.%m.%Y"), t.strftime("%A")))
+        # Yalnızca görünen satırlar oluşturulur; kayıt sayısından bağımsız açılış
+        self.sanal_liste = SanalListe(self.content_frame, self.get_filtrelenmis_tarihler())
+        self.tree_widget = self.sanal_liste.tree
 
+    def kayit_listesini_yenile(self, sira=None):
+        # Liste açıksa yalnızca görünen pencere güncellenir
+        if self.sanal_liste is None or not self.sanal_liste.tree.winfo_exists(): return
+        self.sanal_liste.kaynak_ayarla(self.get_filtrelenmis_tarihler())
+        if sira is not None: self.sanal_liste.goster(sira)
+
+    @izle
     def kayit_sil(self):
         selected = self.tree_widget.selection()
         if not selected: return
         tarih_str = self.tree_widget.item(selected, "values")[0]
         if messagebox.askyesno("Onay", f"{tarih_str} silinsin mi?"):
-            aktif = self.aktif_etkinlik_adi.get()
-            if tarih_str in self.veriler[aktif]:
-                self.veriler[aktif].remove(tarih_str)
-                self.json_kaydet()
-                self.aktif_verileri_yukle()
-                self.veri_yonetimi_goster()
+            aktif = self.aktif_etkinlik_adi.get(); ind = self.etkinlik_indeksi(aktif); sira = gun_sirasi(tarih_str)
+            if sira in ind:
+                yil_gitti = ind.sil(sira)
+                self.json_kaydet((ISLEM_SIL, aktif, tarih_str))
+                if yil_gitti: self.guncelle_yil_combo()
+                self.kayit_listesini_yenile()
                 self.lbl_bilgi.config(text=f"Silindi: {tarih_str}", fg="red")
 
+    @izle
     def kayit_duzenle(self):
         selected = self.tree_widget.selection()
         if not selected: return
         eski_str = self.tree_widget.item(selected, "values")[0]
-        eski_dt = datetime.strptime(eski_str, "%d.%m.%Y")
+        eski_sira = gun_sirasi(eski_str)
         
         top = tk.Toplevel(self.root)
         top.title("Düzenle")
         top.geometry("300x150")
         tk.Label(top, text=f"Eski: {eski_str}").pack(pady=10)
-        ent = DateEntry(top, width=16, background='darkblue', foreground='white', borderwidth=2, date_pattern='dd.mm.yyyy', locale='tr_TR')
-        ent.set_date(eski_dt)
+        ent = tarih_secici(top)
+        ent.set_date(date.fromordinal(eski_sira))
         ent.pack(pady=5)
         
         def kaydet():
-            yeni_str = ent.get_date().strftime("%d.%m.%Y")
-            aktif = self.aktif_etkinlik_adi.get()
-            if eski_str in self.veriler[aktif]:
-                self.veriler[aktif].remove(eski_str)
-                self.veriler[aktif].append(yeni_str)
-                self.json_kaydet()
-                self.aktif_verileri_yukle()
-                self.veri_yonetimi_goster()
+            yeni = ent.get_date(); yeni_str = yeni.strftime("%d.%m.%Y")
+            aktif = self.aktif_etkinlik_adi.get(); ind = self.etkinlik_indeksi(aktif)
+            if yeni_str != eski_str and yeni.toordinal() in ind: messagebox.showwarning("Bilgi", "Zaten ekli."); return
+            if eski_sira in ind:
+                yil_degisti = ind.sil(eski_sira)
+                yil_degisti = ind.ekle(yeni.toordinal()) or yil_degisti
+                self.json_kaydet((ISLEM_SIL, aktif, eski_str), (ISLEM_EKLE, aktif, yeni_str))
+                if yil_degisti: self.guncelle_yil_combo()
+                self.kayit_listesini_yenile(yeni.toordinal())
                 top.destroy()
             else: messagebox.showerror("Hata", "Kayıt bulunamadı.")
         tk.Button(top, text="Kaydet", command=kaydet, bg="#4CAF50", fg="white").pack(pady=10)
 
+    @izle
     def grafik_goster(self):
-        tarih_listesi = self.get_filtrelenmis_tarihler()
-        if not tarih_listesi: messagebox.showerror("Hata", "Veri yok."); return
-        tarih_listesi.sort()
-        sayilar = list(range(1, len(tarih_listesi) + 1))
-        fig = Figure(figsize=(12, 7), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(tarih_listesi, sayilar, marker='o', linestyle='-', zorder=10)
-        ax.set_title(f"Timeline: {self.aktif_etkinlik_adi.get()} ({self.secilen_yil.get()})")
-        ax.set_ylabel("Toplam Sayı"); ax.grid(True, alpha=0.5)
-        ax.text(tarih_listesi[-1], len(tarih_listesi), f"{len(tarih_listesi)}", fontsize=9, ha='right', color='blue', fontweight='bold')
-        
-        secim = self.secilen_yil.get(); bugun = datetime.today()
-        if secim == "Tümü" or not secim: ilk_tarih = min(tarih_listesi); son_gun = bugun
-        else: yil = int(secim); ilk_tarih = datetime(yil, 1, 1); son_gun = min(datetime(yil, 12, 31), bugun)
-        ax.set_xlim(ilk_tarih, son_gun)
-        
-        ilk_pazartesi = ilk_tarih - timedelta(days=ilk_tarih.weekday())
-        son_pazartesi = son_gun - timedelta(days=son_gun.weekday())
-        hafta_durumu = defaultdict(list)
-        for t in tarih_listesi: hafta_durumu[t - timedelta(days=t.weekday())].append(t)
-        
-        cur = ilk_pazartesi
-        y_txt = max(sayilar)/2 if sayilar else 10
-        while cur <= son_pazartesi:
-            cnt = len(hafta_durumu[cur])
-            if cnt==0: c,a,t="red",0.05,"Yok"
-            elif cnt==1: c,a,t="orange",0.05,"1"
-            elif cnt==2: c,a,t="green",0.08,"2"
-            elif cnt==3: c,a,t="blue",0.08,"3"
-            else: c,a,t="purple",0.1,"4+"
-            ax.axvspan(cur, cur+timedelta(days=6), alpha=a, color=c)
-            ax.text(cur+timedelta(days=3.5), y_txt, t, rotation=90, ha='center', fontsize=8, color=c, fontweight='bold', alpha=0.7)
-            cur += timedelta(weeks=1)
-        
-        ax.xaxis.set_major_locator(mdates.MonthLocator())
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%B %Y'))
-        fig.autofmt_xdate(rotation=45, ha='right')
-        self.grafigi_panele_gom(fig)
-
+        from analiz import siralar_dizisi, zaman_cizelgesi_verisi
+        from grafikler import zaman_cizelgesi_ciz
+        tarihler = self.get_filtrelenmis_tarihler()
+        if not tarihler: messagebox.showerror("Hata", "Veri yok."); return
+        secim = self.secilen_yil.get(); bugun = date.today().toordinal(); ara = self.secili_aralik()
+        if ara is None: ilk_gun = tarihler.siralar[0]; son_gun = bugun
+        else: ilk_gun = ara[0]; son_gun = min(ara[1] - 1, bugun)
+        siralar = siralar_dizisi(tarihler).copy()
+        baslik = f"Timeline: {self.aktif_etkinlik_adi.get()} ({secim})"
+
+        def ciz(veri):
+            fig = self.yeni_sekil()
+            # Çizici eksenin xlim_changed olayına bağlı; referansı tutulmazsa olay bağlantısı kaybolur
+            self.zaman_cizelgesi = zaman_cizelgesi_ciz(fig, veri, baslik)
+            self.grafigi_panele_gom()
+        self.arka_planda_goster(("zaman", ara, bugun), lambda: zaman_cizelgesi_verisi(siralar, ilk_gun, son_gun), ciz)
+
+    @izle
     def histogram_goster(self):
-        tarih_listesi = self.get_filtrelenmis_tarihler()
-        if len(tarih_listesi) < 1: messagebox.showwarning("Uyarı", "Veri yok."); return
-        tarih_listesi.sort()
-        gap_pairs = defaultdict(list); farklar = []
-        for i in range(1, len(tarih_listesi)):
-            diff = (tarih_listesi[i] - tarih_listesi[i-1]).days
-            if diff > 0: farklar.append(diff); gap_pairs[diff].append((tarih_listesi[i-1], tarih_listesi[i]))
-        bugun = datetime.today(); son = tarih_listesi[-1]; diff_son = (bugun - son).days
-        if diff_son > 0: farklar.append(diff_son); gap_pairs[diff_son].append((son, bugun))
-        if not farklar: messagebox.showwarning("Bilgi", "Aralık yok."); return
-        
-        counts = Counter(farklar); days = sorted(counts.keys()); freqs = [counts[d] for d in days]
-        fig = Figure(figsize=(10, 6), dpi=100); ax = fig.add_subplot(111)
-        colors = ['#66bb6a' if d<=3 else '#ffa726' if d<=7 else '#ef5350' for d in days]
-        bars = ax.bar(days, freqs, color=colors, edgecolor='black', alpha=0.8, picker=True)
-        ax.set_title(f"Sıklık: {self.aktif_etkinlik_adi.get()}"); ax.set_xticks(days); ax.grid(True, axis='y', alpha=0.3)
-        for bar in bars: ax.text(bar.get_x()+bar.get_width()/2., bar.get_height(), f'{int(bar.get_height())}', ha='center', va='bottom')
+        from analiz import siralar_dizisi, aralik_dagilimi
+        tarihler = self.get_filtrelenmis_tarihler()
+        if len(tarihler) < 1: messagebox.showwarning("Uyarı", "Veri yok."); return
+        bugun = date.today().toordinal()
+        if isinstance(tarihler, EtkinlikIndeksi): # "Tümü": aralık sayaçları hazır, hesaplama gerekmez
+            from istatistik import istatistikler
+            with izleyici.evre("hesapla"): days, freqs = istatistikler(tarihler).aralik_dagilimi(tarihler.siralar, bugun)
+            with izleyici.evre("ciz"): self.histogram_ciz(tarihler, bugun, days, freqs)
+            return
+        siralar = siralar_dizisi(tarihler).copy()
+        self.arka_planda_goster(("aralik", self.secili_aralik(), bugun), lambda: aralik_dagilimi(siralar, bugun),
+                                lambda sonuc: self.histogram_ciz(tarihler, bugun, *sonuc))
+
+    def histogram_ciz(self, tarihler, bugun, days, freqs):
+        from matplotlib.patches import Rectangle
+        from analiz import siralar_dizisi, aralik_ciftleri
+        from grafikler import histogram_ciz
+        if len(days) == 0: messagebox.showwarning("Bilgi", "Aralık yok."); return
+        fig = self.yeni_sekil(); histogram_ciz(fig, days, freqs, f"Sıklık: {self.aktif_etkinlik_adi.get()}")
         
         def on_pick(event):
             if isinstance(event.artist, Rectangle):
                 d = int(round(event.artist.get_x() + event.artist.get_width() / 2))
-                if d in gap_pairs: self.detay_penceresi_goster(d, gap_pairs[d])
-        fig.canvas.mpl_connect('pick_event', on_pick)
-        self.grafigi_panele_gom(fig)
+                # Çiftler yalnızca tıklanan çubuk için, o anki veriden hesaplanır
+                pairs = aralik_ciftleri(siralar_dizisi(tarihler), bugun, d)
+                if pairs: self.detay_penceresi_goster(d, pairs)
+        self.grafik_alani.baglan('pick_event', on_pick)
+        self.grafigi_panele_gom()
 
     def detay_penceresi_goster(self, gun, pairs):
         top = tk.Toplevel(self.root); top.title(f"{gun} Günlük"); top.geometry("400x300")
@@ -499,45 +852,111 @@ class EtkinlikTakipUygulamasi:
         fr = tk.Frame(top); fr.pack(fill=tk.BOTH, expand=True)
         sb = ttk.Scrollbar(fr, orient=tk.VERTICAL); lb = tk.Listbox(fr, yscrollcommand=sb.set, font=("Consolas", 10))
         sb.config(command=lb.yview); sb.pack(side=tk.RIGHT, fill=tk.Y); lb.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        today = datetime.today().date()
-        for i, (t1, t2) in enumerate(pairs, 1):
-            if t2.date() == today: lb.insert(tk.END, f"{i}. {t1.strftime('%d.%m')} -> Bugün (GÜNCEL)"); lb.itemconfig(tk.END, {'bg': '#fff9c4'})
+        today = date.today()
+        for i, (s1, s2) in enumerate(pairs, 1):
+            t1, t2 = date.fromordinal(s1), date.fromordinal(s2)
+            if t2 == today: lb.insert(tk.END, f"{i}. {t1.strftime('%d.%m')} -> Bugün (GÜNCEL)"); lb.itemconfig(tk.END, {'bg': '#fff9c4'})
             else: lb.insert(tk.END, f"{i}. {t1.strftime('%d.%m')} -> {t2.strftime('%d.%m')}")
 
+    @izle
     def isi_haritasi_goster(self):
-        secim = self.secilen_yil.get()
-        hedef = datetime.now().year if secim == "Tümü" or not secim else int(secim)
-        liste = [t for t in self.tarih_listesi if t.year == hedef]
-        counts = Counter(t.date() for t in liste)
-        start = datetime(hedef, 1, 1); end = datetime(hedef, 12, 31)
-        xh, yg, clr = [], [], []
-        def get_color(c): return "#ebedf0" if c==0 else "#9be9a8" if c==1 else "#40c463" if c==2 else "#30a14e" if c==3 else "#216e39"
-        cur = start
-        while cur <= end:
-            xh.append(int(cur.strftime("%W"))); yg.append(6 - cur.weekday()); clr.append(get_color(counts[cur.date()])); cur += timedelta(days=1)
-        fig = Figure(figsize=(12, 5), dpi=100); ax = fig.add_subplot(111)
-        ax.scatter(xh, yg, c=clr, marker='s', s=180)
-        ax.set_title(f"{hedef} Yoğunluk (Top: {len(liste)})"); ax.set_yticks([0, 2, 4, 6]); ax.set_yticklabels(["Paz", "Cum", "Çar", "Pzt"])
-        lbls, tcks = [], []
-        for m in range(1, 13): d=datetime(hedef, m, 1); tcks.append(int(d.strftime("%W"))); lbls.append(d.strftime("%b"))
-        ax.set_xticks(tcks); ax.set_xticklabels(lbls); ax.set_aspect('equal')
-        ax.spines['top'].set_visible(False); ax.spines['right'].set_visible(False); ax.spines['left'].set_visible(False); ax.spines['bottom'].set_visible(False); ax.tick_params(length=0)
-        patches = [Patch(facecolor=get_color(i), label=str(i) if i<4 else "4+") for i in range(5)]
-        ax.legend(handles=patches, loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=5, frameon=False); fig.subplots_adjust(bottom=0.2)
-        self.grafigi_panele_gom(fig)
-
+        from analiz import siralar_dizisi, isi_haritasi_izgarasi
+        from grafikler import ISI_HARITASI_MAKS_YIL
+        ara = self.secili_aralik()
+        # "Tümü" seçiliyse kayıtlı yıllar alt alta (en yeni üstte), değilse filtrenin kapsadığı yıllar
+        if ara is None: yillar = self.tarih_deposu.yillar()[::-1][:ISI_HARITASI_MAKS_YIL] or [date.today().year]
+        else: yillar = list(range(date.fromordinal(ara[1] - 1).year, date.fromordinal(ara[0]).year - 1, -1))[:ISI_HARITASI_MAKS_YIL]
+        siralar = siralar_dizisi(self.get_filtrelenmis_tarihler()).copy() # Filtre dışındaki günler boş kalır
+        self.arka_planda_goster(("isi", ara, tuple(yillar)), lambda: [isi_haritasi_izgarasi(siralar, y) for y in yillar],
+                                lambda izgaralar: self.isi_haritasi_ciz(yillar, izgaralar))
+
+    def isi_haritasi_ciz(self, yillar, izgaralar):
+        from grafikler import isi_haritasi_ciz
+        fig = self.yeni_sekil(); isi_haritasi_ciz(fig, yillar, izgaralar)
+        self.grafigi_panele_gom()
+
+    @izle
     def fark_grafik_goster(self):
         self.histogram_goster() # Basitlik için yönlendirme
 
+    @izle
     def aylik_ozet_goster(self):
-        s=self.secilen_yil.get()
-        if s=="Tümü": messagebox.showwarning("Uyarı","Yıl seç"); return
-        l=self.get_filtrelenmis_tarihler(); c=Counter(t.month for t in l)
-        mn=["Oca","Şub","Mar","Nis","May","Haz","Tem","Ağu","Eyl","Eki","Kas","Ara"]; v=[c[i] for i in range(1,13)]
-        fig=Figure(figsize=(8,6), dpi=100); ax=fig.add_subplot(111); b=ax.bar(mn, v, color='cornflowerblue')
-        for x in b: 
-            if x.get_height()>0: ax.text(x.get_x()+x.get_width()/2, x.get_height(), str(int(x.get_height())), ha='center', va='bottom')
-        self.grafigi_panele_gom(fig)
+        ara=self.secili_aralik()
+        if ara is None: messagebox.showwarning("Uyarı","Yıl seç"); return
+        from grafikler import aylik_ciz
+        # Birden çok yıla yayılan filtrede her yıl ayrı bir katman olarak üst üste yığılır
+        yillar=list(range(date.fromordinal(ara[0]).year, date.fromordinal(ara[1]-1).year+1))
+        with izleyici.evre("hesapla"): v=self.analiz_getir(("aylik", ara), lambda: [self.get_filtrelenmis_tarihler().aylik_sayilar(y) for y in yillar])
+        with izleyici.evre("ciz"): fig=self.yeni_sekil(); aylik_ciz(fig, v[0] if len(yillar)==1 else v, None if len(yillar)==1 else yillar); self.grafigi_panele_gom()
+
+    # --- ETKİNLİK KARŞILAŞTIRMA (gün bitmap'leri) ---
+    @izle
+    def karsilastirma_goster(self):
+        self.temizle_sag_panel()
+        adlar = list(self.veriler)
+        ust = tk.Frame(self.content_frame, bg="white"); ust.pack(side=tk.TOP, fill=tk.X, padx=10, pady=5)
+        lb = tk.Listbox(ust, selectmode=tk.MULTIPLE, exportselection=False, height=6, width=30); lb.pack(side=tk.LEFT)
+        for ad in adlar: lb.insert(tk.END, ad)
+        lb.selection_set(0, tk.END)
+        secili = lambda: [adlar[i] for i in lb.curselection()]
+        kf = tk.Frame(ust, bg="white"); kf.pack(side=tk.LEFT, padx=10)
+        tk.Button(kf, text="🔀 Birliktelik Matrisi", command=lambda: self.karsilastir(secili(), "matris"), width=24).pack(pady=2)
+        tk.Button(kf, text="🟩 Birleşim Yoğunluk Haritası", command=lambda: self.karsilastir(secili(), "birlesim"), width=24).pack(pady=2)
+        ab = tk.Frame(ust, bg="white"); ab.pack(side=tk.LEFT, padx=10)
+        a_var = tk.StringVar(value=adlar[0] if adlar else ""); b_var = tk.StringVar(value=adlar[1] if len(adlar) > 1 else "")
+        for satir, (etiket, var) in enumerate((("A:", a_var), ("B:", b_var))):
+            tk.Label(ab, text=etiket, bg="white").grid(row=satir, column=0)
+            ttk.Combobox(ab, textvariable=var, values=adlar, state="readonly", width=20).grid(row=satir, column=1, pady=2)
+        tk.Button(ab, text="A var, B yok", command=lambda: self.karsilastir([a_var.get(), b_var.get()], "fark")).grid(row=2, column=0, columnspan=2, pady=2)
+        if len(adlar) > 1: self.karsilastir(adlar, "matris")
+
+    @izle
+    def karsilastir(self, adlar, tur):
+        """tur: "matris" (birliktelik), "birlesim" (gün başına etkinlik sayısı ısı haritası) veya "fark" (adlar[0] var, adlar[1] yok)."""
+        if len(adlar) < (1 if tur == "birlesim" else 2) or (tur == "fark" and adlar[0] == adlar[1]):
+            messagebox.showwarning("Uyarı", "Karşılaştırmak için farklı etkinlikler seçin."); return
+        from grafikler import ISI_HARITASI_MAKS_YIL
+        # Ayrıştırılmış etkinliklerin bitmap'leri burada kopyalanır; ham metin listeleri işçide ayrıştırılır
+        hazir = {ad: self.gun_bitmapleri.getir(ad, v).kopya() for ad in adlar if isinstance(v := self.veriler.get(ad), EtkinlikIndeksi)}
+        ham = {ad: self.veriler[ad] for ad in adlar if ad not in hazir and ad in self.veriler}
+        filtre = self.secili_aralik()
+        def hesapla():
+            from gun_bitmapi import GunBitmapi, hizala, kes, birliktelik_matrisi, jaccard, fark_gunleri, birlesim_izgaralari, aralik
+            indeksler = {ad: EtkinlikIndeksi.metinlerden(v) for ad, v in ham.items()}
+            bitmapler = {**hazir, **{ad: GunBitmapi.siralardan(ind.siralar) for ad, ind in indeksler.items()}}
+            bas, matris = hizala([bitmapler.get(ad, GunBitmapi()) for ad in adlar])
+            if filtre is not None: bas, matris = kes(bas, matris, *filtre) # Tarih filtresi dışındaki günler sayılmaz
+            if tur == "matris":
+                birliktelik = birliktelik_matrisi(matris); sonuc = (birliktelik, jaccard(birliktelik))
+            elif tur == "fark": sonuc = fark_gunleri(bas, matris[0], matris[1])
+            else:
+                ara = aralik(bas, matris)
+                if ara is None: sonuc = None
+                else:
+                    # Filtre içinde kayıtlı son yıldan geriye en fazla ISI_HARITASI_MAKS_YIL yıl (en yeni üstte)
+                    ilk_yil, son_yil = date.fromordinal(ara[0]).year, date.fromordinal(ara[1]).year
+                    yillar = list(range(son_yil, max(son_yil - ISI_HARITASI_MAKS_YIL, ilk_yil - 1), -1))
+                    sonuc = (yillar, birlesim_izgaralari(bas, matris, yillar))
+            return indeksler, bitmapler, sonuc
+        def bitti(deger):
+            indeksler, bitmapler, sonuc = deger
+            for ad, ind in indeksler.items():
+                # Bu arada etkinlik açıldıysa veya değiştiyse işçinin ayrıştırdığı kopya atılır
+                if self.veriler.get(ad) is ham[ad]: self.veriler[ad] = ind; self.gun_bitmapleri.bitmapler[ad] = bitmapler[ad]
+            self.karsilastirma_ciz(adlar, tur, sonuc)
+        self.gorevler.calistir("gorunum", izleyici.evrede("hesapla", hesapla), bitince=izleyici.evrede("ciz", bitti))
+
+    def karsilastirma_ciz(self, adlar, tur, sonuc):
+        from grafikler import birliktelik_ciz, isi_haritasi_ciz
+        if tur == "fark":
+            top = tk.Toplevel(self.root); top.title(f"{adlar[0]} var, {adlar[1]} yok"); top.geometry("400x500")
+            tk.Label(top, text=f"'{adlar[0]}' olup '{adlar[1]}' olmayan {len(sonuc)} gün", font=("Arial", 11, "bold")).pack(pady=10)
+            SanalListe(top, TarihDeposu(sonuc.tolist())); return
+        if sonuc is None: messagebox.showwarning("Bilgi", "Seçili etkinliklerde kayıt yok."); return
+        fig = self.yeni_sekil()
+        if tur == "matris": birliktelik_ciz(fig, adlar, *sonuc)
+        else: isi_haritasi_ciz(fig, *sonuc); fig.suptitle(f"Birleşim: {len(adlar)} etkinlik (renk: o gün kaydı olan etkinlik sayısı)")
+        self.grafik_alani.goster() # Üstteki seçim çubuğu kalır; grafigi_panele_gom paneli temizlerdi
 
 def main():
     root = tk.Tk(); root.geometry("400x300")
@@ -549,4 +968,4 @@ def main():
         root.geometry("400x350"); LoginWindow(root, start)
     restart(); root.mainloop()
 
-if __name__ == "__main__": main()
\ No newline at end of file
+if __name__ == "__main__": main()
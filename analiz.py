@@ -0,0 +1,129 @@
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from tarih_deposu import MPL_EPOCH_SIRASI, hafta_basi
+
+ISI_RENKLERI = ["#ebedf0", "#9be9a8", "#40c463", "#30a14e", "#216e39"] # 0, 1, 2, 3, 4+
+HAFTA_SUTUNU = 54 # %W 0..53
+
+
+def siralar_dizisi(tarihler):
+    """TarihDeposu'nun array('i') tamponunu kopyalamadan int32 NumPy dizisi olarak görür."""
+    return np.frombuffer(tarihler.siralar, dtype=np.int32) if len(tarihler) else np.empty(0, dtype=np.int32)
+
+
+@lru_cache(maxsize=64)
+def _yil_tablosu(yil):
+    # Yılın her günü için (satır, sütun): satır = 6 - haftanın günü (Pzt üstte), sütun = strftime("%W")
+    bas = date(yil, 1, 1).toordinal()
+    gun_sayisi = date(yil + 1, 1, 1).toordinal() - bas
+    gun = np.arange(gun_sayisi)
+    hg = (bas + 6 + gun) % 7
+    satir = 6 - hg
+    sutun = (gun + 7 - hg) // 7
+    satir.flags.writeable = False; sutun.flags.writeable = False
+    return bas, gun_sayisi, satir, sutun
+
+
+def isi_haritasi_izgarasi(siralar, yil):
+    """
+    7 x 54 günlük sayı ızgarası. Yıla ait olmayan hücreler -1.
+    Döngü yok: bincount + önceden hesaplanmış hafta tablosu.
+    """
+    bas, gun_sayisi, satir, sutun = _yil_tablosu(yil)
+    sec = siralar[(siralar >= bas) & (siralar < bas + gun_sayisi)] - bas
+    sayilar = np.bincount(sec, minlength=gun_sayisi)
+    izgara = np.full((7, HAFTA_SUTUNU), -1, dtype=np.int32)
+    izgara[satir, sutun] = sayilar
+    return izgara
+
+
+def renk_kovalari(izgara):
+    """Sayıları ISI_RENKLERI indekslerine (0..4) çevirir; yıl dışı hücreler maskelenir."""
+    return np.ma.masked_less(np.minimum(izgara, len(ISI_RENKLERI) - 1), 0)
+
+
+def ay_basi_sutunlari(yil):
+    _, _, _, sutun = _yil_tablosu(yil)
+    bas = date(yil, 1, 1).toordinal()
+    return [int(sutun[date(yil, a, 1).toordinal() - bas]) for a in range(1, 13)]
+
+
+def yil_ay_matrisi(siralar):
+    """(yıllar, yıl x 12 sayı matrisi). Tüm geçmiş tek bincount ile aylara dağıtılır."""
+    if len(siralar) == 0: return [], np.zeros((0, 12), dtype=np.int64)
+    aylar = (siralar - MPL_EPOCH_SIRASI).astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    ilk = int(aylar.min()) // 12 * 12
+    sayilar = np.bincount(aylar - ilk)
+    sayilar = np.pad(sayilar, (0, -len(sayilar) % 12)).reshape(-1, 12)
+    ilk_yil = 1970 + ilk // 12
+    return list(range(ilk_yil, ilk_yil + len(sayilar))), sayilar
+
+
+def haftalik_sayilar(siralar, ilk_pazartesi, son_pazartesi):
+    """ilk_pazartesi..son_pazartesi (dahil) arasındaki her hafta için kayıt sayısı."""
+    hafta_sayisi = max((son_pazartesi - ilk_pazartesi) // 7 + 1, 0)
+    haftalar = (siralar - ilk_pazartesi) // 7
+    haftalar = haftalar[(haftalar >= 0) & (haftalar < hafta_sayisi)]
+    return np.bincount(haftalar, minlength=hafta_sayisi)
+
+
+def zaman_cizelgesi_verisi(siralar, ilk_gun, son_gun):
+    """
+    Zaman çizelgesi için çizime hazır diziler: toplam çizgisi x'i ve haftalık yoğunluk kategorileri (0..4+).
+    Aralık bugünden sonra başlıyorsa (yalnızca ileri tarihli kayıt / gelecek yıl) ilk_gun'den başlayan bir haftalık pencere gösterilir.
+    """
+    if son_gun < ilk_gun: son_gun = ilk_gun + 6
+    ilk_pzt = hafta_basi(ilk_gun)
+    haftalik = haftalik_sayilar(siralar, ilk_pzt, hafta_basi(son_gun))
+    return {"x": siralar.astype(np.float64) - MPL_EPOCH_SIRASI, "ilk_gun": ilk_gun, "son_gun": son_gun,
+            "hafta_x": ilk_pzt - MPL_EPOCH_SIRASI + 7 * np.arange(len(haftalik)), "kategori": np.minimum(haftalik, 4)}
+
+
+def _farklar(siralar, bugun):
+    # Ardışık kayıtlar arası gün farkı; son kayıttan bugüne kadar olan ara da eklenir
+    return np.append(np.diff(siralar), bugun - siralar[-1])
+
+
+def aralik_dagilimi(siralar, bugun):
+    """(gün farkları, her farkın kaç kez görüldüğü) — sıfır ve negatif farklar sayılmaz."""
+    farklar = _farklar(siralar, bugun)
+    return np.unique(farklar[farklar > 0], return_counts=True)
+
+
+def aralik_ciftleri(siralar, bugun, gun):
+    """Tam olarak `gun` gün arayla gelen (önceki, sonraki) kayıt çiftleri; yalnızca istendiğinde hesaplanır."""
+    ciftler = [(int(siralar[i]), int(siralar[i + 1])) for i in np.nonzero(np.diff(siralar) == gun)[0]]
+    if bugun - siralar[-1] == gun: ciftler.append((int(siralar[-1]), bugun))
+    return ciftler
+
+
+def etkinlik_ozeti(siralar, bugun):
+    """
+    Tek etkinliğin GUI'siz özeti (toplu raporlar için). Değerler düz Python türleridir; doğrudan JSON'a yazılabilir.
+    haftanin_gunleri: Pzt..Paz kayıt sayıları (ısı haritasının satır toplamları).
+    """
+    n = len(siralar)
+    if n == 0: return {"kayit": 0}
+    gecmis = int(np.searchsorted(siralar, bugun, side="right")) # İleri tarihli kayıtlar "son kayıttan beri" sayılmaz
+    farklar = np.diff(siralar)
+    gunler, tekrarlar = aralik_dagilimi(siralar, bugun)
+    yillar, aylik = yil_ay_matrisi(siralar)
+    haftalik = haftalik_sayilar(siralar, hafta_basi(int(siralar[0])), hafta_basi(int(siralar[-1])))
+    return {
+        "kayit": n,
+        "ilk": date.fromordinal(int(siralar[0])).isoformat(),
+        "son": date.fromordinal(int(siralar[-1])).isoformat(),
+        "son_kayittan_beri_gun": int(bugun - siralar[gecmis - 1]) if gecmis else None,
+        "ortalama_aralik": round(float(farklar.mean()), 2) if len(farklar) else None,
+        "medyan_aralik": float(np.median(farklar)) if len(farklar) else None,
+        "en_sik_aralik": int(gunler[np.argmax(tekrarlar)]) if len(gunler) else None,
+        "en_uzun_ara": int(farklar.max()) if len(farklar) else None,
+        "haftalik_ortalama": round(float(haftalik.mean()), 3),
+        "en_yogun_hafta": int(haftalik.max()),
+        "haftanin_gunleri": np.bincount((siralar + 6) % 7, minlength=7).tolist(),
+        "yillik": {str(y): int(t) for y, t in zip(yillar, aylik.sum(axis=1)) if t},
+        "aylik": {f"{y}-{a + 1:02d}": int(aylik[i, a]) for i, y in enumerate(yillar) for a in range(12) if aylik[i, a]},
+    }
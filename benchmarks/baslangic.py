@@ -0,0 +1,97 @@
+"""
+Başlangıç süresi ölçümü: giriş ekranına kadar geçen süre ve içe aktarma dökümü.
+
+    python benchmarks/baslangic.py               # 5 soğuk başlatma, medyan
+    python benchmarks/baslangic.py --tekrar 10 --esik-ms 800
+
+1) `python -X importtime -c "import EventTracker"` çıktısındaki modül süreleri üst düzey paketlere göre toplanır.
+2) Yeni bir süreçte Tk kökü + LoginWindow kurulup ilk kez çizilene kadar geçen süre ölçülür.
+3) Giriş ekranı açıkken ağır modüllerin (matplotlib, numpy, requests, tkcalendar) yüklenmemiş olması denetlenir;
+   yüklenmişse veya --esik-ms aşılmışsa çıkış kodu 1 olur (gerileme koruması).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GIRIS_EKRANINDA_YASAK = ("matplotlib", "numpy", "requests", "tkcalendar", "babel")
+
+# Alt süreçte çalışır: başlangıç anı (ebeveynin Popen öncesi saati) ortam değişkeniyle gelir
+_GIRIS_BETIGI = r"""
+import json, os, sys, time
+import tkinter as tk
+import EventTracker
+root = tk.Tk(); root.geometry("400x350")
+EventTracker.LoginWindow(root, lambda u: None)
+root.update()
+bitis = time.time()
+yuklu = sorted({m.split(".")[0] for m in sys.modules} & set(json.loads(os.environ["YASAK"])))
+root.destroy()
+print(json.dumps({"sure": bitis - float(os.environ["BASLANGIC"]), "yuklu": yuklu}))
+"""
+
+
+def _calistir(komut, ortam=None):
+    # EventTracker içe aktarılınca göreli Data/ klasörünü kurar; repo kirlenmesin diye alt süreç geçici klasörde çalışır
+    ortam = dict(ortam or os.environ)
+    ortam["PYTHONPATH"] = os.pathsep.join(filter(None, (KOK, ortam.get("PYTHONPATH"))))
+    with tempfile.TemporaryDirectory(prefix="et_baslangic_") as klasor:
+        return subprocess.run(komut, cwd=klasor, env=ortam, capture_output=True, text=True)
+
+
+def import_dokumu(ilk=15):
+    """(toplam ms, [(üst düzey paket, ms)]) — her modülün kendi süresi ait olduğu üst düzey pakete yazılır."""
+    cikti = _calistir([sys.executable, "-X", "importtime", "-c", "import EventTracker"]).stderr
+    paketler = Counter(); toplam = 0.0
+    for satir in cikti.splitlines():
+        if not satir.startswith("import time:") or satir.count("|") != 2: continue
+        kendi, kumulatif, ad = satir[len("import time:"):].split("|")
+        if not kendi.strip().isdigit(): continue # Başlık satırı
+        paketler[ad.strip().split(".")[0]] += int(kendi) / 1000
+        if ad.strip() == "EventTracker": toplam = int(kumulatif) / 1000
+    return toplam, paketler.most_common(ilk)
+
+
+def giris_ekrani_suresi():
+    ortam = dict(os.environ, YASAK=json.dumps(GIRIS_EKRANINDA_YASAK), BASLANGIC=repr(time.time()))
+    sonuc = _calistir([sys.executable, "-c", _GIRIS_BETIGI], ortam)
+    if sonuc.returncode != 0: raise RuntimeError(sonuc.stderr.strip().splitlines()[-1] if sonuc.stderr else "bilinmeyen hata")
+    return json.loads(sonuc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Giriş ekranına kadar geçen başlangıç süresini ölçer.")
+    ap.add_argument("--tekrar", type=int, default=5)
+    ap.add_argument("--esik-ms", type=float, default=None, help="Medyan bu değeri aşarsa başarısız say")
+    args = ap.parse_args()
+
+    toplam, paketler = import_dokumu()
+    print(f"import EventTracker: {toplam:.1f} ms (paket başına kendi süreleri, ms):")
+    for ad, ms in paketler:
+        print(f"  {ad:<24}{ms:8.1f}")
+
+    basarisiz = False
+    try:
+        olcumler = [giris_ekrani_suresi() for _ in range(args.tekrar)]
+    except RuntimeError as e:
+        print(f"Giriş ekranı ölçülemedi (ekran yok mu?): {e}")
+        return 0
+    sureler = [o["sure"] * 1000 for o in olcumler]
+    medyan = statistics.median(sureler)
+    print(f"Giriş ekranına kadar: medyan {medyan:.0f} ms (en az {min(sureler):.0f}, en çok {max(sureler):.0f}, {args.tekrar} tekrar)")
+    yuklu = sorted({m for o in olcumler for m in o["yuklu"]})
+    if yuklu:
+        print(f"GERİLEME: giriş ekranında yüklenmemesi gereken modüller yüklü: {', '.join(yuklu)}"); basarisiz = True
+    if args.esik_ms is not None and medyan > args.esik_ms:
+        print(f"GERİLEME: medyan {medyan:.0f} ms > eşik {args.esik_ms:.0f} ms"); basarisiz = True
+    return 1 if basarisiz else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Sıcak yolların ölçüm takımı. Arayüz açmaz; uygulama metotlarının çağırdığı gerçek kodu sentetik veriyle zamanlar.
+
+    python benchmarks/calistir.py --olcek kucuk orta --cikti sonuc.json
+    python benchmarks/calistir.py --karsilastir eski.json yeni.json
+
+Her ölçek geçici bir klasörde üretilir (bkz. sentetik_veri.py). Her ölçüm --tekrar kez çalışır
+(göçler bir kez); medyan ve en iyi süre kaydedilir. Sonuç JSON'u iki commit'i karşılaştırmak için saklanır.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+
+from sentetik_veri import OLCEKLER, veri_uret, kullanicilar_uret
+
+
+def olc(sonuclar, ad, fonk, tekrar):
+    sureler = []
+    for _ in range(tekrar):
+        bas = time.perf_counter()
+        fonk()
+        sureler.append((time.perf_counter() - bas) * 1000)
+    sonuclar[ad] = {"min_ms": round(min(sureler), 3), "medyan_ms": round(statistics.median(sureler), 3), "tekrar": tekrar}
+    print(f"  {ad:<40}{sonuclar[ad]['medyan_ms']:12.3f} ms", flush=True)
+
+
+def olcegi_calistir(tarih_sayisi, etkinlik_sayisi, kullanici_sayisi, tekrar):
+    # EventTracker göreli yollar (Data/, users.json) kullandığından çalışma klasörü geçici klasöre alınır
+    import EventTracker as ET
+    from analiz import (siralar_dizisi, zaman_cizelgesi_verisi, aralik_dagilimi, isi_haritasi_izgarasi, yil_ay_matrisi,
+                        etkinlik_ozeti)
+    from depolama import GunlukDepo, SqliteDepo, json_den_sqlite_ye_aktar, ISLEM_EKLE
+    from tarih_deposu import EtkinlikIndeksi, sira_metni
+
+    sonuclar = {}
+    rnd = random.Random(1)
+    json_yolu = veri_uret(ET.DATA_KLASORU, "olcum", tarih_sayisi, etkinlik_sayisi)
+    kullanicilar_uret(ET.USERS_DOSYASI, kullanici_sayisi)
+    bugun = date.today().toordinal()
+
+    # veri_tabanini_yukle: anlık görüntü + günlük
+    olc(sonuclar, "veri_tabanini_yukle", lambda: GunlukDepo(json_yolu).oku(), tekrar)
+    veriler = GunlukDepo(json_yolu).oku()
+    en_buyuk = max(veriler, key=lambda ad: len(veriler[ad]))
+    ham = veriler[en_buyuk]
+
+    # aktif_verileri_yukle: ilk erişimde ayrıştırma + yıl listesi
+    olc(sonuclar, "aktif_verileri_yukle", lambda: EtkinlikIndeksi.metinlerden(ham).yillar(), tekrar)
+    ind = EtkinlikIndeksi.metinlerden(ham)
+    yillar = ind.yillar()
+    orta_yil = yillar[len(yillar) // 2]
+
+    # json_kaydet: tek işlem (günlüğe ekleme) ve tam anlık görüntü
+    depo = GunlukDepo(json_yolu); depo.yukle()
+    olc(sonuclar, "json_kaydet[islem]", lambda: depo.uygula([(ISLEM_EKLE, en_buyuk, "01.01.2000")]), tekrar)
+    olc(sonuclar, "json_kaydet[tam]", lambda: depo.hepsini_yaz(veriler), tekrar)
+
+    # tarih_ekle / kayit_sil: indeks güncellemesi + günlüğe ekleme (100 kayıtlık tur)
+    bos_gunler = [s for s in rnd.sample(range(ind.siralar[0], ind.siralar[-1] + 1), min(1000, len(ind) + 200)) if s not in ind][:100]
+    def ekle_sil():
+        for s in bos_gunler: ind.ekle(s); depo.uygula([(ISLEM_EKLE, en_buyuk, sira_metni(s))])
+        for s in bos_gunler: ind.sil(s)
+    olc(sonuclar, "tarih_ekle+kayit_sil[x100]", ekle_sil, tekrar)
+    depo.bekle()
+
+    # get_filtrelenmis_tarihler: görünüm tembel, len() sınırları (ikili arama) hesaplatır
+    olc(sonuclar, "get_filtrelenmis_tarihler[yil]", lambda: len(ind.yil(orta_yil)), tekrar)
+    olc(sonuclar, "get_filtrelenmis_tarihler[son 90 gun]", lambda: len(ind.son_gunler(90, bugun)), tekrar)
+
+    # Grafiklerin hesaplama kısımları (çizim hariç)
+    siralar = siralar_dizisi(ind).copy()
+    yil_siralari = siralar_dizisi(ind.yil(orta_yil)).copy()
+    olc(sonuclar, "grafik_goster[tumu]", lambda: zaman_cizelgesi_verisi(siralar, int(siralar[0]), bugun), tekrar)
+    olc(sonuclar, "grafik_goster[yil]", lambda: zaman_cizelgesi_verisi(yil_siralari, date(orta_yil, 1, 1).toordinal(), date(orta_yil, 12, 31).toordinal()), tekrar)
+    olc(sonuclar, "histogram_goster[tumu]", lambda: aralik_dagilimi(siralar, bugun), tekrar)
+    son_yillar = yillar[::-1][:10]
+    olc(sonuclar, "isi_haritasi_goster[10 yil]", lambda: [isi_haritasi_izgarasi(siralar, y) for y in son_yillar], tekrar)
+    olc(sonuclar, "aylik_ozet_goster", lambda: ind.aylik_sayilar(orta_yil), tekrar)
+    olc(sonuclar, "yil_ay_matrisi", lambda: yil_ay_matrisi(siralar), tekrar)
+    olc(sonuclar, "etkinlik_ozeti", lambda: etkinlik_ozeti(siralar, bugun), tekrar)
+
+    # UserManager: ilk açılışta users.json göçü (bir kez), giriş ekranı kurulumu, kayıt ve giriş
+    olc(sonuclar, "kullanici_gocu", ET.UserManager, 1)
+    um = ET.UserManager()
+    olc(sonuclar, "UserManager()", ET.UserManager, tekrar)
+    sayac = iter(range(10 ** 9))
+    olc(sonuclar, "UserManager.register", lambda: um.register(f"yeni{next(sayac)}", "parola"), tekrar)
+    olc(sonuclar, "UserManager.login", lambda: um.login("yeni0", "parola"), tekrar)
+
+    # SQLite deposu (kullanıcılar yukarıda parçalı kayda taşındı; oradan aktarılır)
+    db = os.path.join(ET.DATA_KLASORU, "olcum.db")
+    olc(sonuclar, "sqlite_gocu", lambda: json_den_sqlite_ye_aktar(ET.DATA_KLASORU, ET.USERS_DOSYASI, db), 1)
+    olc(sonuclar, "veri_tabanini_yukle[sqlite]", lambda: SqliteDepo(db, "olcum").yukle(), tekrar)
+    return sonuclar
+
+
+def _git_surumu():
+    try: return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=KOK, capture_output=True, text=True).stdout.strip() or None
+    except OSError: return None
+
+
+def karsilastir(eski_yolu, yeni_yolu):
+    with open(eski_yolu, encoding="utf-8") as f: eski = json.load(f)
+    with open(yeni_yolu, encoding="utf-8") as f: yeni = json.load(f)
+    print(f"{eski['ortam'].get('commit')} -> {yeni['ortam'].get('commit')} (medyan ms; oran < 1 daha hızlı)")
+    for olcek, olcumler in yeni["sonuclar"].items():
+        print(f"[{olcek}]")
+        for ad, y in olcumler.items():
+            e = eski["sonuclar"].get(olcek, {}).get(ad)
+            if e is None: print(f"  {ad:<40}{'-':>12}{y['medyan_ms']:12.3f}"); continue
+            oran = y["medyan_ms"] / e["medyan_ms"] if e["medyan_ms"] else float("inf")
+            print(f"  {ad:<40}{e['medyan_ms']:12.3f}{y['medyan_ms']:12.3f}{oran:9.2f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Sentetik veriyle sıcak yolları ölçer ve sonucu JSON olarak kaydeder.")
+    ap.add_argument("--olcek", nargs="+", choices=OLCEKLER, default=["kucuk"])
+    ap.add_argument("--tekrar", type=int, default=5)
+    ap.add_argument("--cikti", default=None, help="Sonuç dosyası (varsayılan: olcum_<commit>.json)")
+    ap.add_argument("--karsilastir", nargs=2, metavar=("ESKI", "YENI"))
+    args = ap.parse_args()
+    if args.karsilastir: karsilastir(*args.karsilastir); return
+
+    commit = _git_surumu()
+    sonuc = {"ortam": {"commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+                       "islemci": os.cpu_count(), "tarih": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "pbkdf2_iterasyon": os.environ.get("ETKINLIK_PBKDF2_ITERASYON")},
+             "olcekler": {ad: dict(zip(("tarih", "etkinlik", "kullanici"), OLCEKLER[ad])) for ad in args.olcek},
+             "sonuclar": {}}
+    cikti = os.path.abspath(args.cikti or f"olcum_{commit or 'yerel'}.json")
+    eski_klasor = os.getcwd()
+    for ad in args.olcek:
+        klasor = tempfile.mkdtemp(prefix=f"et_olcum_{ad}_")
+        print(f"[{ad}] {OLCEKLER[ad][0]} tarih / {OLCEKLER[ad][1]} etkinlik / {OLCEKLER[ad][2]} kullanıcı -> {klasor}")
+        try:
+            os.chdir(klasor)
+            sonuc["sonuclar"][ad] = olcegi_calistir(*OLCEKLER[ad], args.tekrar)
+        finally:
+            os.chdir(eski_klasor)
+            shutil.rmtree(klasor, ignore_errors=True)
+    with open(cikti, "w", encoding="utf-8") as f: json.dump(sonuc, f, ensure_ascii=False, indent=2)
+    print(f"Sonuç: {cikti}")
+
+
+if __name__ == "__main__":
+    main()
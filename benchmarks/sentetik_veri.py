@@ -0,0 +1,71 @@
+"""
+Ölçümler için sentetik veri üretici. Aynı tohumla her zaman aynı dosyalar üretilir.
+
+    python benchmarks/sentetik_veri.py --klasor /tmp/et --tarih 100000 --etkinlik 100 --kullanici 10000
+
+<klasor>/Data/<kullanici>.json : tarihleri etkinliklere bölünmüş tek kullanıcı (uygulamanın biçimiyle, dd.mm.YYYY)
+<klasor>/users.json            : eski tek dosyalık kullanıcı kaydı (ilk açılışta parçalı kayda taşınır)
+"""
+import argparse
+import json
+import os
+import random
+from datetime import date
+
+OLCEKLER = {
+    # ad: (toplam tarih, etkinlik, kullanıcı)
+    "kucuk": (1_000, 1, 10),
+    "orta": (100_000, 100, 10_000),
+    "buyuk": (1_000_000, 1_000, 10_000),
+    "tek_buyuk": (1_000_000, 1, 10), # Tek etkinlikte uzun geçmiş
+}
+BASLANGIC_SIRASI = date(1900, 1, 1).toordinal()
+SON_SIRA = date(9999, 12, 31).toordinal()
+REFERANS_SIRASI = date(2025, 1, 1).toordinal() # Sabit; üretim günden güne değişmesin
+
+
+def etkinlik_tarihleri(rnd, adet):
+    # Benzersiz günler; yoğunluk ~%50 olacak kadar geniş, en az 10 yıllık bir aralıktan, REFERANS_SIRASI'nda biter
+    aralik = min(max(adet * 2, 3650), SON_SIRA - BASLANGIC_SIRASI)
+    bas = max(BASLANGIC_SIRASI, REFERANS_SIRASI - aralik)
+    siralar = rnd.sample(range(bas, bas + aralik), adet)
+    return [date.fromordinal(s).strftime("%d.%m.%Y") for s in siralar] # Dosyada sırasız, uygulamadaki gibi
+
+
+def veri_uret(veri_klasoru, kullanici, tarih_sayisi, etkinlik_sayisi, tohum=0):
+    """Toplam tarih_sayisi tarihi etkinlik_sayisi etkinliğe eşit böler; dosya yolunu döner."""
+    rnd = random.Random(tohum)
+    os.makedirs(veri_klasoru, exist_ok=True)
+    veriler = {}
+    for i in range(etkinlik_sayisi):
+        adet = tarih_sayisi // etkinlik_sayisi + (i < tarih_sayisi % etkinlik_sayisi)
+        veriler[f"Etkinlik {i + 1}"] = etkinlik_tarihleri(rnd, adet)
+    yol = os.path.join(veri_klasoru, f"{kullanici}.json")
+    with open(yol, "w", encoding="utf-8") as f: json.dump(veriler, f, ensure_ascii=False, indent=4)
+    return yol
+
+
+def kullanicilar_uret(users_dosyasi, kullanici_sayisi, tohum=0):
+    """Eski "tuz:özet" biçiminde sahte kayıtlar; parola doğrulaması ölçümlerde ayrıca kaydedilen kullanıcıyla yapılır."""
+    rnd = random.Random(tohum)
+    users = {f"kullanici{i}": f"{rnd.randbytes(16).hex()}:{rnd.randbytes(32).hex()}" for i in range(kullanici_sayisi)}
+    with open(users_dosyasi, "w", encoding="utf-8") as f: json.dump(users, f, indent=4)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Sentetik Data/<kullanici>.json ve users.json üretir.")
+    ap.add_argument("--klasor", required=True)
+    ap.add_argument("--olcek", choices=OLCEKLER, default=None, help="Hazır ölçek; verilirse diğer sayıları ezer")
+    ap.add_argument("--tarih", type=int, default=1_000)
+    ap.add_argument("--etkinlik", type=int, default=1)
+    ap.add_argument("--kullanici", type=int, default=10)
+    ap.add_argument("--tohum", type=int, default=0)
+    args = ap.parse_args()
+    tarih, etkinlik, kullanici = OLCEKLER[args.olcek] if args.olcek else (args.tarih, args.etkinlik, args.kullanici)
+    yol = veri_uret(os.path.join(args.klasor, "Data"), "olcum", tarih, etkinlik, args.tohum)
+    kullanicilar_uret(os.path.join(args.klasor, "users.json"), kullanici, args.tohum)
+    print(f"{yol}: {tarih} tarih / {etkinlik} etkinlik; users.json: {kullanici} kullanıcı")
+
+
+if __name__ == "__main__":
+    main()
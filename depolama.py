@@ -0,0 +1,466 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+# --- İŞLEM TÜRLERİ ---
+# Günlüğe her satırda bir işlem yazılır: ["ekle", "Spor", "01.02.2024"]
+ISLEM_EKLE = "ekle"
+ISLEM_SIL = "sil"
+ISLEM_ETKINLIK_EKLE = "etkinlik_ekle"
+ISLEM_ETKINLIK_SIL = "etkinlik_sil"
+ISLEM_ETKINLIK_ADLANDIR = "etkinlik_adlandir"
+
+# --- DEPOLAMA TÜRLERİ ---
+DEPO_JSON = "json"
+DEPO_SQLITE = "sqlite"
+KULLANICI_KLASORU = "kullanicilar" # Veri klasörü altında, parçalı kullanıcı kaydı
+
+
+def islemleri_uygula(veriler, islemler):
+    """
+    İşlemleri sırayla sözlüğe uygular.
+    Her işlem tam olarak bir kez uygulanmalıdır: tek tek ekle/sil zararsızca tekrarlanabilir ama
+    silme/adlandırma dizileri tekrar oynatılınca farklı sonuç verir (GunlukDepo bu yüzden hiçbir günlüğü iki kez oynatmaz).
+    """
+    for islem in islemler:
+        tur = islem[0]
+        if tur == ISLEM_EKLE:
+            liste = veriler.setdefault(islem[1], [])
+            if islem[2] not in liste: liste.append(islem[2])
+        elif tur == ISLEM_SIL:
+            liste = veriler.get(islem[1])
+            # Eski listelerde aynı tarih birden çok kez geçebilir; indeks bunları tek kayıt sayar, hepsi silinir
+            if liste and islem[2] in liste: liste[:] = [t for t in liste if t != islem[2]]
+        elif tur == ISLEM_ETKINLIK_EKLE:
+            veriler.setdefault(islem[1], [])
+        elif tur == ISLEM_ETKINLIK_SIL:
+            veriler.pop(islem[1], None)
+        elif tur == ISLEM_ETKINLIK_ADLANDIR:
+            eski, yeni = islem[1], islem[2]
+            if eski in veriler and yeni not in veriler: veriler[yeni] = veriler.pop(eski)
+    return veriler
+
+
+def _atomik_json_yaz(yol, veri):
+    # Önce geçici dosyaya yaz, diske indir, sonra tek adımda yer değiştir
+    # Geçici ad süreç kimliğini içerir; aynı dosyayı yazan iki uygulama örneği birbirinin geçicisini ezmez
+    gecici = f"{yol}.{os.getpid()}.tmp"
+    with open(gecici, "w", encoding="utf-8") as f:
+        json.dump(veri, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(gecici, yol)
+
+
+# --- GÜNLÜKLÜ DEPO ---
+class GunlukDepo:
+    """
+    Kullanıcı verisi = anlık görüntü (<kullanici>.json) + yalnızca-ekleme işlem günlüğü (<kullanici>.log).
+    Her değişiklik günlüğe tek satır olarak eklenir; geçmişin boyutundan bağımsız O(1) yazma.
+    Günlük büyüyünce arka planda sıkıştırılır ve anlık görüntü atomik olarak değiştirilir.
+
+    Sıkıştırma: <kullanici>.log -> .log.eski olarak döndürülür, katlanmış görüntü <kullanici>.json.yeni'ye yazılır,
+    .log.eski silinir (geçiş anı), sonra .yeni yerine konur. Okurken .log.eski varsa geçerli görüntü .json, yoksa
+    (varsa) .json.yeni'dir; arada çökülse de eski günlük hiçbir zaman katlandığı görüntünün üstüne oynatılmaz.
+    """
+    SIKISTIRMA_ESIGI = 1000  # Bu kadar işlemden sonra arka plan sıkıştırması başlar
+
+    def __init__(self, json_yolu):
+        self.json_yolu = json_yolu
+        self.gunluk_yolu = os.path.splitext(json_yolu)[0] + ".log"
+        # Sıkıştırma sırasında döndürülen günlük; çökme olursa açılışta yeniden oynatılır
+        self.eski_gunluk_yolu = self.gunluk_yolu + ".eski"
+        self.yeni_json_yolu = json_yolu + ".yeni" # Sıkıştırmanın henüz yerine konmamış görüntüsü
+        self._kilit = threading.Lock()
+        self._islem_sayisi = 0
+        self._sikistirma = None
+
+    def yukle(self):
+        veriler, self._islem_sayisi = self._oku()
+        if os.path.exists(self.eski_gunluk_yolu) or os.path.exists(self.yeni_json_yolu) or self._islem_sayisi >= self.SIKISTIRMA_ESIGI:
+            self.sikistir()
+        return veriler
+
+    def oku(self):
+        """yukle ile aynı sonuç, ama sıkıştırma tetiklemez ve dosyalara yazmaz (toplu raporlar için)."""
+        return self._oku()[0]
+
+    def _oku(self):
+        veriler = self._goruntu_oku(self.json_yolu)
+        eski = self._gunlugu_oku(self.eski_gunluk_yolu)
+        if eski is None:
+            # Eski günlük katlanıp silinmiş ama .yeni henüz yerine konmamış olabilir
+            yeni = self._goruntu_oku(self.yeni_json_yolu)
+            if yeni is not None: veriler = yeni
+        veriler = veriler or {}
+        islemleri_uygula(veriler, eski or [])
+        islemler = self._gunlugu_oku(self.gunluk_yolu) or []
+        islemleri_uygula(veriler, islemler)
+        return veriler, len(islemler)
+
+    def _goruntu_oku(self, yol):
+        # Dosya yoksa None; bozuksa boş sözlük
+        try:
+            with open(yol, "r", encoding="utf-8") as f:
+                try: return json.load(f)
+                except json.JSONDecodeError: return {}
+        except FileNotFoundError: return None
+
+    def _gunlugu_oku(self, yol):
+        # Dosya yoksa None
+        islemler = []
+        if not os.path.exists(yol): return None
+        with open(yol, "r", encoding="utf-8") as f:
+            for satir in f:
+                # Çökme anında yarım kalmış son satır atlanır
+                try: islemler.append(json.loads(satir))
+                except json.JSONDecodeError: continue
+        return islemler
+
+    def uygula(self, islemler):
+        """İşlemleri günlüğün sonuna ekler."""
+        satirlar = "".join(json.dumps(list(i), ensure_ascii=False) + "\n" for i in islemler)
+        with self._kilit:
+            with open(self.gunluk_yolu, "a", encoding="utf-8") as f:
+                f.write(satirlar)
+                f.flush()
+                os.fsync(f.fileno())
+            self._islem_sayisi += len(islemler)
+            esik_asildi = self._islem_sayisi >= self.SIKISTIRMA_ESIGI
+        if esik_asildi: self.sikistir()
+
+    def hepsini_yaz(self, veriler):
+        """Tüm veriyi anlık görüntü olarak yazar ve günlükleri temizler (göç, ilk kurulum)."""
+        self.bekle()
+        with self._kilit:
+            self._yeniyi_yerine_koy()
+            # Günlük önce eski günlük olarak döndürülür; silinmesi yeni görüntüye geçiş anıdır
+            if os.path.exists(self.gunluk_yolu):
+                if os.path.exists(self.eski_gunluk_yolu): self._sikistirmayi_calistir()
+                os.replace(self.gunluk_yolu, self.eski_gunluk_yolu)
+            self._sikistirmayi_calistir(veriler)
+            self._islem_sayisi = 0
+
+    def sikistir(self, arka_planda=True):
+        """Günlüğü anlık görüntüye katlar. Varsayılan olarak arka plan thread'inde çalışır."""
+        with self._kilit:
+            if self._sikistirma is not None and self._sikistirma.is_alive(): return
+            self._yeniyi_yerine_koy()
+            # Önceki sıkıştırma yarım kaldıysa eski günlük hâlâ duruyordur; önce o katlanır
+            if not os.path.exists(self.eski_gunluk_yolu):
+                if not os.path.exists(self.gunluk_yolu): return
+                os.replace(self.gunluk_yolu, self.eski_gunluk_yolu)
+            self._islem_sayisi = 0
+            if arka_planda:
+                self._sikistirma = threading.Thread(target=self._sikistirmayi_calistir, daemon=True)
+                self._sikistirma.start()
+                return
+        self._sikistirmayi_calistir()
+
+    def _yeniyi_yerine_koy(self):
+        # Eski günlük silindikten sonra yarım kalmış sıkıştırmayı tamamlar (kilit tutulurken çağrılır)
+        if not os.path.exists(self.eski_gunluk_yolu) and os.path.exists(self.yeni_json_yolu):
+            os.replace(self.yeni_json_yolu, self.json_yolu)
+
+    def _sikistirmayi_calistir(self, veriler=None):
+        # Bellekteki veriye dokunmaz; yalnızca dosyalardan yeniden kurar (veriler verilirse onu yazar)
+        if veriler is None:
+            veriler = self._goruntu_oku(self.json_yolu) or {}
+            islemleri_uygula(veriler, self._gunlugu_oku(self.eski_gunluk_yolu) or [])
+        _atomik_json_yaz(self.yeni_json_yolu, veriler)
+        if os.path.exists(self.eski_gunluk_yolu): os.remove(self.eski_gunluk_yolu)
+        os.replace(self.yeni_json_yolu, self.json_yolu)
+
+    def bekle(self):
+        if self._sikistirma is not None: self._sikistirma.join()
+
+
+# --- SQLITE ---
+_SEMA = """
+CREATE TABLE IF NOT EXISTS kullanicilar (ad TEXT PRIMARY KEY, sifre TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS etkinlikler (kullanici TEXT NOT NULL, ad TEXT NOT NULL, sira INTEGER NOT NULL, PRIMARY KEY (kullanici, ad));
+CREATE TABLE IF NOT EXISTS kayitlar (kullanici TEXT NOT NULL, etkinlik TEXT NOT NULL, tarih TEXT NOT NULL, PRIMARY KEY (kullanici, etkinlik, tarih)) WITHOUT ROWID;
+"""
+
+
+def _sqlite_baglan(yol):
+    # İlk yükleme işçi thread'inde yapılır, sonraki yazmalar ana thread'de; erişim hiçbir zaman eşzamanlı değildir
+    baglanti = sqlite3.connect(yol, check_same_thread=False)
+    baglanti.execute("PRAGMA journal_mode=WAL")  # Birden fazla uygulama örneği aynı dosyayı okuyabilsin
+    baglanti.execute("PRAGMA synchronous=NORMAL")
+    baglanti.executescript(_SEMA)
+    return baglanti
+
+
+def _iso(t_str):
+    # "dd.mm.YYYY" -> "YYYY-MM-DD"; indeksli aralık sorguları için sıralanabilir biçim
+    if len(t_str) != 10 or t_str[2] != "." or t_str[5] != ".": return None
+    return f"{t_str[6:10]}-{t_str[3:5]}-{t_str[0:2]}"
+
+
+def _gmy(iso):
+    return f"{iso[8:10]}.{iso[5:7]}.{iso[0:4]}"
+
+
+class SqliteDepo:
+    """
+    Kullanıcı verisinin SQLite karşılığı. Kayıtlar (kullanici, etkinlik, tarih) birincil anahtarıyla
+    indekslidir; ekleme/silme tek satırlık yazmadır ve yıl filtresi, tekrar kontrolü ve aylık sayım
+    tam tarama yapmadan yanıtlanır (uygulama bunları bellekteki EtkinlikIndeksi'nden okur; toplu araçlar için).
+    """
+
+    def __init__(self, db_yolu, kullanici):
+        self.kullanici = kullanici
+        self.baglanti = _sqlite_baglan(db_yolu)
+
+    def yukle(self):
+        veriler = {}
+        for (ad,) in self.baglanti.execute("SELECT ad FROM etkinlikler WHERE kullanici=? ORDER BY sira", (self.kullanici,)):
+            veriler[ad] = []
+        for etkinlik, tarih in self.baglanti.execute("SELECT etkinlik, tarih FROM kayitlar WHERE kullanici=?", (self.kullanici,)):
+            veriler.setdefault(etkinlik, []).append(_gmy(tarih))
+        return veriler
+
+    def uygula(self, islemler):
+        k = self.kullanici
+        with self.baglanti as c:
+            for islem in islemler:
+                tur = islem[0]
+                if tur == ISLEM_EKLE:
+                    iso = _iso(islem[2])
+                    if iso is None: continue
+                    self._etkinlik_ekle(c, islem[1])
+                    c.execute("INSERT OR IGNORE INTO kayitlar VALUES (?, ?, ?)", (k, islem[1], iso))
+                elif tur == ISLEM_SIL:
+                    c.execute("DELETE FROM kayitlar WHERE kullanici=? AND etkinlik=? AND tarih=?", (k, islem[1], _iso(islem[2])))
+                elif tur == ISLEM_ETKINLIK_EKLE:
+                    self._etkinlik_ekle(c, islem[1])
+                elif tur == ISLEM_ETKINLIK_SIL:
+                    c.execute("DELETE FROM kayitlar WHERE kullanici=? AND etkinlik=?", (k, islem[1]))
+                    c.execute("DELETE FROM etkinlikler WHERE kullanici=? AND ad=?", (k, islem[1]))
+                elif tur == ISLEM_ETKINLIK_ADLANDIR:
+                    eski, yeni = islem[1], islem[2]
+                    if c.execute("SELECT 1 FROM etkinlikler WHERE kullanici=? AND ad=?", (k, yeni)).fetchone(): continue
+                    # JSON'daki pop/ekle davranışıyla aynı: yeniden adlandırılan etkinlik sona taşınır
+                    c.execute("UPDATE etkinlikler SET ad=?, sira=(SELECT COALESCE(MAX(sira), 0) + 1 FROM etkinlikler WHERE kullanici=?) WHERE kullanici=? AND ad=?", (yeni, k, k, eski))
+                    c.execute("UPDATE kayitlar SET etkinlik=? WHERE kullanici=? AND etkinlik=?", (yeni, k, eski))
+
+    def _etkinlik_ekle(self, c, ad):
+        c.execute("INSERT OR IGNORE INTO etkinlikler VALUES (?, ?, (SELECT COALESCE(MAX(sira), 0) + 1 FROM etkinlikler WHERE kullanici=?))", (self.kullanici, ad, self.kullanici))
+
+    def hepsini_yaz(self, veriler):
+        k = self.kullanici
+        with self.baglanti as c:
+            c.execute("DELETE FROM kayitlar WHERE kullanici=?", (k,))
+            c.execute("DELETE FROM etkinlikler WHERE kullanici=?", (k,))
+            c.executemany("INSERT INTO etkinlikler VALUES (?, ?, ?)", [(k, ad, i) for i, ad in enumerate(veriler, 1)])
+            c.executemany("INSERT OR IGNORE INTO kayitlar VALUES (?, ?, ?)",
+                          ((k, ad, iso) for ad, liste in veriler.items() for iso in map(_iso, liste) if iso is not None))
+
+    def bekle(self):
+        pass
+
+    def kapat(self):
+        self.baglanti.close()
+
+    # --- İndeksli sorgular ---
+    def tarih_var_mi(self, etkinlik, t_str):
+        return self.baglanti.execute("SELECT 1 FROM kayitlar WHERE kullanici=? AND etkinlik=? AND tarih=?",
+                                     (self.kullanici, etkinlik, _iso(t_str))).fetchone() is not None
+
+    def yillar(self, etkinlik):
+        sql = "SELECT DISTINCT substr(tarih, 1, 4) FROM kayitlar WHERE kullanici=? AND etkinlik=? ORDER BY 1 DESC"
+        return [int(y) for (y,) in self.baglanti.execute(sql, (self.kullanici, etkinlik))]
+
+    def yil_tarihleri(self, etkinlik, yil):
+        sql = "SELECT tarih FROM kayitlar WHERE kullanici=? AND etkinlik=? AND tarih BETWEEN ? AND ? ORDER BY tarih"
+        return [_gmy(t) for (t,) in self.baglanti.execute(sql, (self.kullanici, etkinlik, f"{yil}-01-01", f"{yil}-12-31"))]
+
+    def aylik_sayilar(self, etkinlik, yil):
+        sql = ("SELECT CAST(substr(tarih, 6, 2) AS INTEGER), COUNT(*) FROM kayitlar "
+               "WHERE kullanici=? AND etkinlik=? AND tarih BETWEEN ? AND ? GROUP BY 1")
+        sayilar = [0] * 12
+        for ay, adet in self.baglanti.execute(sql, (self.kullanici, etkinlik, f"{yil}-01-01", f"{yil}-12-31")):
+            sayilar[ay - 1] = adet
+        return sayilar
+
+
+# --- KULLANICI DEPOLARI ---
+class JsonKullaniciDeposu:
+    # Eski tek dosyalık users.json; yalnızca göç sırasında okunur
+    def __init__(self, yol):
+        self.yol = yol
+
+    def yukle(self):
+        if os.path.exists(self.yol):
+            with open(self.yol, "r", encoding="utf-8") as f:
+                try: return json.load(f)
+                except json.JSONDecodeError: return {}
+        return {}
+
+
+class ParcaliKullaniciDeposu:
+    """
+    Her hesap ayrı bir dosya: <klasor>/<sha256(ad)[:2]>/<sha256(ad)>.json = {"ad": ..., "sifre": ...}
+    Giriş tek dosya okur, kayıt tek dosya yazar; hesap sayısı arttıkça diğer hesaplara dokunulmaz.
+    Yeni hesap önce geçici dosyaya eksiksiz yazılır, sonra os.link ile son adına bağlanır: bağlama atomiktir ve ad
+    alınmışsa başarısız olur; aynı adı aynı anda kaydeden iki uygulama örneğinden yalnızca biri başarır, yarıda kalan
+    bir kayıt da boş bir hesap dosyası bırakmaz.
+    Açılışta eski users.json varsa bir kez aktarılır ve users.json.tasindi olarak yeniden adlandırılır.
+    """
+    def __init__(self, klasor, eski_users_dosyasi=None):
+        self.klasor = klasor
+        os.makedirs(klasor, exist_ok=True)
+        if eski_users_dosyasi and os.path.exists(eski_users_dosyasi): self._gocet(eski_users_dosyasi)
+
+    def _yol(self, ad):
+        ozet = hashlib.sha256(ad.encode("utf-8")).hexdigest()
+        return os.path.join(self.klasor, ozet[:2], ozet + ".json")
+
+    def getir(self, ad):
+        try:
+            with open(self._yol(ad), "r", encoding="utf-8") as f: kayit = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError): return None # Yarım kalmış oluşturma da yok sayılır
+        return kayit["sifre"] if kayit.get("ad") == ad else None
+
+    def ekle(self, ad, sifre):
+        """Hesap zaten varsa False."""
+        yol = self._yol(ad)
+        os.makedirs(os.path.dirname(yol), exist_ok=True)
+        if os.path.exists(yol): return False
+        gecici = f"{yol}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with os.fdopen(os.open(gecici, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as f:
+                json.dump({"ad": ad, "sifre": sifre}, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.link(gecici, yol)
+        except FileExistsError: return False
+        finally:
+            if os.path.exists(gecici): os.remove(gecici)
+        return True
+
+    def guncelle(self, ad, sifre):
+        _atomik_json_yaz(self._yol(ad), {"ad": ad, "sifre": sifre})
+
+    def hepsi(self):
+        # (ad, şifre) çiftleri; yalnızca toplu aktarım için, giriş/kayıt yolunda kullanılmaz
+        return _parcali_hesaplar(self.klasor)
+
+    def _gocet(self, eski_users_dosyasi):
+        for ad, sifre in JsonKullaniciDeposu(eski_users_dosyasi).yukle().items(): self.ekle(ad, sifre)
+        try: os.replace(eski_users_dosyasi, eski_users_dosyasi + ".tasindi")
+        except FileNotFoundError: pass # Başka bir örnek aynı anda aktarıp taşımış
+
+
+def _parcali_hesaplar(klasor):
+    for parca in sorted(os.listdir(klasor)) if os.path.isdir(klasor) else []:
+        parca_yolu = os.path.join(klasor, parca)
+        if not os.path.isdir(parca_yolu): continue
+        for dosya in sorted(os.listdir(parca_yolu)):
+            if not dosya.endswith(".json"): continue
+            try:
+                with open(os.path.join(parca_yolu, dosya), "r", encoding="utf-8") as f: kayit = json.load(f)
+            except json.JSONDecodeError: continue
+            yield kayit["ad"], kayit["sifre"]
+
+
+def kayitli_hesaplar(klasor, eski_users_dosyasi=None):
+    """
+    Parçalı kayıttaki ve (henüz taşınmamışsa) eski users.json'daki hesaplar: {ad: şifre}.
+    Yalnızca okur; ParcaliKullaniciDeposu'nun aksine klasör oluşturmaz, users.json'u taşımaz. Çakışmada parçalı kayıt geçerlidir.
+    """
+    hesaplar = JsonKullaniciDeposu(eski_users_dosyasi).yukle() if eski_users_dosyasi else {}
+    hesaplar.update(_parcali_hesaplar(klasor))
+    return hesaplar
+
+
+class SqliteKullaniciDeposu:
+    def __init__(self, db_yolu):
+        self.baglanti = _sqlite_baglan(db_yolu)
+
+    def getir(self, ad):
+        satir = self.baglanti.execute("SELECT sifre FROM kullanicilar WHERE ad = ?", (ad,)).fetchone()
+        return satir[0] if satir else None
+
+    def ekle(self, ad, sifre):
+        """Hesap zaten varsa False; birincil anahtar eşzamanlı kayıtları da ayırır."""
+        try:
+            with self.baglanti as c: c.execute("INSERT INTO kullanicilar VALUES (?, ?)", (ad, sifre))
+        except sqlite3.IntegrityError: return False
+        return True
+
+    def guncelle(self, ad, sifre):
+        with self.baglanti as c:
+            c.execute("UPDATE kullanicilar SET sifre = ? WHERE ad = ?", (sifre, ad))
+
+    def kaydet(self, users):
+        with self.baglanti as c:
+            c.executemany("INSERT OR REPLACE INTO kullanicilar VALUES (?, ?)", users)
+
+    def kapat(self):
+        self.baglanti.close()
+
+
+# --- GÖÇ ---
+def kullanici_verisi_mi(veriler):
+    # Data/ altındaki bir JSON'un kullanıcı verisi biçiminde ({etkinlik: [tarih metni, ...]}) olup olmadığı
+    return isinstance(veriler, dict) and all(isinstance(v, list) and all(isinstance(t, str) for t in v) for v in veriler.values())
+
+
+def json_den_sqlite_ye_aktar(veri_klasoru, users_dosyasi, db_yolu):
+    """
+    Kullanıcı kaydı (parçalı klasör veya eski users.json) ve Data/<kullanici>.json (+ günlükleri) dosyalarını tek seferde SQLite'a aktarır.
+    Kaynak dosyalar yalnızca okunur (günlük sıkıştırılmaz, users.json taşınmaz); kullanıcı verisi biçiminde olmayan JSON'lar atlanır.
+    """
+    kullanicilar = SqliteKullaniciDeposu(db_yolu)
+    kullanicilar.kaydet(kayitli_hesaplar(os.path.join(veri_klasoru, KULLANICI_KLASORU), users_dosyasi).items())
+    kullanicilar.kapat()
+    aktarilan = 0
+    for dosya in sorted(os.listdir(veri_klasoru)) if os.path.isdir(veri_klasoru) else []:
+        if not dosya.endswith(".json"): continue
+        veriler = GunlukDepo(os.path.join(veri_klasoru, dosya)).oku()
+        if not kullanici_verisi_mi(veriler): continue
+        depo = SqliteDepo(db_yolu, dosya[:-len(".json")])
+        depo.hepsini_yaz(veriler); depo.kapat()
+        aktarilan += 1
+    return aktarilan
+
+
+def _ilk_gocu_yap(veri_klasoru, users_dosyasi, db_yolu):
+    # Veritabanı geçici dosyada kurulur ve yalnızca aktarım bitince yerine konur;
+    # yarıda kalan bir göç yarım bir veritabanı bırakmaz, sonraki açılışta baştan yapılır
+    gecici = f"{db_yolu}.{os.getpid()}.gocu"
+    for ek in ("", "-wal", "-shm"):
+        if os.path.exists(gecici + ek): os.remove(gecici + ek)
+    try:
+        json_den_sqlite_ye_aktar(veri_klasoru, users_dosyasi, gecici)
+        os.replace(gecici, db_yolu)
+    finally:
+        for ek in ("", "-wal", "-shm"):
+            if os.path.exists(gecici + ek): os.remove(gecici + ek)
+
+
+def veri_deposu_ac(tur, veri_klasoru, kullanici, db_yolu):
+    if tur == DEPO_SQLITE: return SqliteDepo(db_yolu, kullanici)
+    return GunlukDepo(os.path.join(veri_klasoru, f"{kullanici}.json"))
+
+
+def kullanici_deposu_ac(tur, veri_klasoru, users_dosyasi, db_yolu):
+    if tur == DEPO_SQLITE:
+        # İlk açılışta mevcut JSON verileri bir kez aktarılır
+        if not os.path.exists(db_yolu): _ilk_gocu_yap(veri_klasoru, users_dosyasi, db_yolu)
+        return SqliteKullaniciDeposu(db_yolu)
+    return ParcaliKullaniciDeposu(os.path.join(veri_klasoru, KULLANICI_KLASORU), users_dosyasi)
+
+
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="JSON verilerini SQLite veritabanına aktarır.")
+    ap.add_argument("--veri-klasoru", default="Data")
+    ap.add_argument("--users", default="users.json")
+    ap.add_argument("--db", default=os.path.join("Data", "eventtracker.db"))
+    args = ap.parse_args()
+    print(f"{json_den_sqlite_ye_aktar(args.veri_klasoru, args.users, args.db)} kullanıcı aktarıldı -> {args.db}")
@@ -0,0 +1,188 @@
+"""
+Grafikleri arayüz açmadan PNG/SVG olarak dışa aktarır (Agg, etkileşimsiz):
+
+    python disa_aktar.py --grafik isi --yil 2024 --bicim png --cikti Grafikler
+    python disa_aktar.py --kullanici ali --etkinlik Spor --grafik zaman histogram aylik --bicim png svg
+
+Çıktı: <cikti>/<kullanici>/<etkinlik>/<grafik>_<yil|tumu>.<bicim>
+Kullanıcılar süreç havuzunda paralel çizilir; her süreç tek bir Figure şablonunu temizleyip yeniden kullanır.
+Her grafiğin girdi verisinin özeti <cikti>/surumler.json'da tutulur; veri değişmemiş ve dosya duruyorsa yeniden çizilmez.
+"""
+import argparse
+import hashlib
+import json
+import locale
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+
+from analiz import siralar_dizisi, zaman_cizelgesi_verisi, aralik_dagilimi, isi_haritasi_izgarasi
+from depolama import GunlukDepo
+from tarih_deposu import EtkinlikIndeksi
+
+GRAFIKLER = ("isi", "zaman", "histogram", "aylik")
+BICIMLER = ("png", "svg")
+TUMU = "tumu"
+SURUM_DOSYASI = "surumler.json"
+CIZIM_SURUMU = 1 # Çizim kodu değişince artırılır; eski çıktıların hepsi yeniden üretilir
+
+_sablon = None # Süreç başına tek Figure + Agg tuvali
+
+
+def _sekil():
+    global _sablon
+    from grafikler import sekli_sifirla
+    if _sablon is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        _sablon = Figure(figsize=(12, 7), dpi=100)
+        FigureCanvasAgg(_sablon)
+    return sekli_sifirla(_sablon)
+
+
+def _isci_baslat():
+    locale.setlocale(locale.LC_ALL, "") # Ay adları ortamın diliyle
+
+
+def _dosya_adi(ad):
+    return re.sub(r"[^\w\-. ]", "_", ad).strip(" .") or "_"
+
+
+def _surum(*parcalar):
+    # Grafiğin girdi verisinin özeti: diziler bayt olarak, diğerleri repr ile
+    h = hashlib.sha1(str(CIZIM_SURUMU).encode())
+    for p in parcalar:
+        h.update(p.tobytes() if hasattr(p, "tobytes") else repr(p).encode("utf-8"))
+    return h.hexdigest()
+
+
+def grafik_girdisi(tur, etkinlik, ind, yil, bugun):
+    """
+    (sürüm, çiz(fig)) döner; çizilecek bir şey yoksa None. Girdiler uygulamadaki görünümlerle aynı şekilde hesaplanır.
+    yil: int veya TUMU.
+    """
+    from grafikler import (zaman_cizelgesi_ciz, histogram_ciz, isi_haritasi_ciz, aylik_ciz, ISI_HARITASI_MAKS_YIL)
+    tarihler = ind if yil == TUMU else ind.yil(yil)
+    secim = "Tümü" if yil == TUMU else str(yil)
+    if tur == "isi":
+        yillar = ind.yillar()[::-1][:ISI_HARITASI_MAKS_YIL] if yil == TUMU else [yil]
+        if not yillar: return None
+        siralar = siralar_dizisi(ind)
+        izgaralar = [isi_haritasi_izgarasi(siralar, y) for y in yillar]
+        return _surum(tur, yillar, *izgaralar), lambda fig: isi_haritasi_ciz(fig, yillar, izgaralar)
+    if not tarihler: return None
+    if tur == "zaman":
+        if yil == TUMU: ilk_gun, son_gun = tarihler.siralar[0], bugun
+        elif date(yil, 1, 1).toordinal() > bugun: return None # Henüz başlamamış yılın bugüne kadarki çizelgesi boş
+        else: ilk_gun, son_gun = date(yil, 1, 1).toordinal(), min(date(yil, 12, 31).toordinal(), bugun)
+        veri = zaman_cizelgesi_verisi(siralar_dizisi(tarihler), ilk_gun, son_gun)
+        baslik = f"Timeline: {etkinlik} ({secim})"
+        return _surum(tur, baslik, veri["x"], ilk_gun, son_gun), lambda fig: zaman_cizelgesi_ciz(fig, veri, baslik)
+    if tur == "histogram":
+        days, freqs = aralik_dagilimi(siralar_dizisi(tarihler), bugun)
+        if len(days) == 0: return None
+        baslik = f"Sıklık: {etkinlik}"
+        return _surum(tur, baslik, days, freqs), lambda fig: histogram_ciz(fig, days, freqs, baslik)
+    if tur == "aylik":
+        if yil == TUMU: return None # Uygulamada da yıl seçimi gerektirir
+        sayilar = ind.aylik_sayilar(yil)
+        return _surum(tur, sayilar), lambda fig: aylik_ciz(fig, sayilar)
+    raise ValueError(tur)
+
+
+def kullanici_disa_aktar(ayarlar, json_yolu, eski_surumler):
+    """
+    Bir kullanıcının istenen tüm grafikleri. Süreç havuzunda çalışır.
+    [(göreli yol, sürüm, "yazildi"|"atlandi")] döner; surumler.json'u yalnızca ana süreç yazar.
+    """
+    kullanici = os.path.splitext(os.path.basename(json_yolu))[0]
+    sonuc = []
+    for etkinlik, tarihler in GunlukDepo(json_yolu).oku().items():
+        if not isinstance(tarihler, list): continue
+        if ayarlar["etkinlikler"] and etkinlik not in ayarlar["etkinlikler"]: continue
+        ind = EtkinlikIndeksi.metinlerden(tarihler)
+        yillar = ayarlar["yillar"] or ind.yillar()
+        for yil in yillar:
+            for tur in ayarlar["grafikler"]:
+                girdi = grafik_girdisi(tur, etkinlik, ind, yil, ayarlar["bugun"])
+                if girdi is None: continue
+                surum, ciz = girdi
+                cizildi = False
+                for bicim in ayarlar["bicimler"]:
+                    goreli = f"{_dosya_adi(kullanici)}/{_dosya_adi(etkinlik)}/{tur}_{yil}.{bicim}" # surumler.json işletim sisteminden bağımsız
+                    yol = os.path.join(ayarlar["cikti"], *goreli.split("/"))
+                    if eski_surumler.get(goreli) == surum and os.path.exists(yol):
+                        sonuc.append((goreli, surum, "atlandi")); continue
+                    if not cizildi: fig = _sekil(); ciz(fig); cizildi = True # Aynı çizim tüm biçimlere yazılır
+                    os.makedirs(os.path.dirname(yol), exist_ok=True)
+                    fig.savefig(yol, format=bicim, dpi=ayarlar["dpi"], bbox_inches="tight")
+                    sonuc.append((goreli, surum, "yazildi"))
+    return sonuc
+
+
+def disa_aktar(veri_klasoru, cikti, grafikler=GRAFIKLER, bicimler=("png",), kullanicilar=None, etkinlikler=None,
+               yillar=None, bugun=None, dpi=100, isci=None):
+    """Sayaç döner: {"yazildi": n, "atlandi": m}. isci=1 ise havuz kurulmaz."""
+    yollar = sorted(os.path.join(veri_klasoru, d) for d in os.listdir(veri_klasoru) if d.endswith(".json"))
+    if kullanicilar: yollar = [y for y in yollar if os.path.splitext(os.path.basename(y))[0] in kullanicilar]
+    ayarlar = {"grafikler": list(grafikler), "bicimler": list(bicimler), "etkinlikler": set(etkinlikler or ()),
+               "yillar": list(yillar or ()), "bugun": (bugun or date.today()).toordinal(), "cikti": cikti, "dpi": dpi}
+    surum_yolu = os.path.join(cikti, SURUM_DOSYASI)
+    try:
+        with open(surum_yolu, "r", encoding="utf-8") as f: surumler = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError): surumler = {}
+
+    # Her kullanıcıya yalnızca kendi klasörünün sürümleri gönderilir
+    onekler = {y: _dosya_adi(os.path.splitext(os.path.basename(y))[0]) + "/" for y in yollar}
+    eski = [{k: v for k, v in surumler.items() if k.startswith(onekler[y])} for y in yollar]
+    is_fonk = partial(kullanici_disa_aktar, ayarlar)
+    sayac = {"yazildi": 0, "atlandi": 0}
+    if isci == 1 or len(yollar) <= 1:
+        _isci_baslat(); sonuclar = map(is_fonk, yollar, eski)
+        havuz = None
+    else:
+        havuz = ProcessPoolExecutor(max_workers=isci, initializer=_isci_baslat)
+        sonuclar = havuz.map(is_fonk, yollar, eski)
+    try:
+        for yol, sonuc in zip(yollar, sonuclar):
+            for goreli, surum, durum in sonuc:
+                surumler[goreli] = surum; sayac[durum] += 1
+            print(f"{os.path.basename(yol)}: {sum(d == 'yazildi' for *_, d in sonuc)} yazıldı, "
+                  f"{sum(d == 'atlandi' for *_, d in sonuc)} atlandı", file=sys.stderr)
+    finally:
+        if havuz is not None: havuz.shutdown()
+        # Yarıda kesilse bile o ana kadar yazılanların sürümleri saklanır
+        os.makedirs(cikti, exist_ok=True)
+        gecici = f"{surum_yolu}.{os.getpid()}.tmp"
+        with open(gecici, "w", encoding="utf-8") as f: json.dump(surumler, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(gecici, surum_yolu)
+    return sayac
+
+
+def _yil(deger):
+    return TUMU if deger in (TUMU, "Tümü") else int(deger)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Grafikleri arayüzsüz PNG/SVG olarak dışa aktarır.")
+    ap.add_argument("--veri-klasoru", default="Data")
+    ap.add_argument("--cikti", default="Grafikler")
+    ap.add_argument("--grafik", nargs="+", choices=GRAFIKLER, default=["isi"])
+    ap.add_argument("--bicim", nargs="+", choices=BICIMLER, default=["png"])
+    ap.add_argument("--kullanici", nargs="+", default=None)
+    ap.add_argument("--etkinlik", nargs="+", default=None)
+    ap.add_argument("--yil", nargs="+", type=_yil, default=None, help=f"Yıllar veya '{TUMU}' (varsayılan: kayıt bulunan her yıl)")
+    ap.add_argument("--bugun", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    ap.add_argument("--dpi", type=int, default=100)
+    ap.add_argument("--isci", type=int, default=None, help="Süreç sayısı (varsayılan: işlemci sayısı)")
+    args = ap.parse_args()
+    sayac = disa_aktar(args.veri_klasoru, args.cikti, args.grafik, args.bicim, args.kullanici, args.etkinlik,
+                       args.yil, args.bugun, args.dpi, args.isci)
+    print(f"{sayac['yazildi']} dosya yazıldı, {sayac['atlandi']} dosya değişmediği için atlandı -> {args.cikti}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import contextvars
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from izleme import izleyici
+
+
+class GorevYoneticisi:
+    """
+    Ağır işleri (veri yükleme, ayrıştırma, analiz) Tk ana döngüsü dışında, bir thread havuzunda çalıştırır.
+    Sonuçlar kuyruğa konur ve root.after ile ana thread'de yoklanır; Tk'ye yalnızca ana thread dokunur.
+    Her iş bir kanala aittir: aynı kanala yeni iş gelince önceki iş iptal edilir
+    (henüz başlamadıysa hiç çalışmaz, bittiyse sonucu atılır).
+    root None ise (ör. ölçüm betikleri) işler çağrıldığı anda satır içinde çalışır.
+    ilerleme verilirse is_fonk bir bildir(*bilgi) fonksiyonu alır; bildirimler ana thread'de ilerleme(*bilgi) olarak iletilir.
+    İş, calistir anındaki bağlamla (contextvars) çalışır; izleme açıksa başlatan eylem, bitince dönene kadar açık kalır.
+    """
+    YOKLAMA_MS = 30
+
+    def __init__(self, root, isci_sayisi=2, mesgul_degisti=None):
+        self.root = root
+        self.mesgul_degisti = mesgul_degisti # Meşguliyet değişince ana thread'de çağrılır (True/False)
+        self.havuz = ThreadPoolExecutor(max_workers=isci_sayisi, thread_name_prefix="gorev") if root is not None else None
+        self.kuyruk = queue.Queue()
+        self.kanallar = {} # kanal -> (nesil, future)
+        self._izler = {} # nesil -> izleme eylemi (izleme kapalıyken boş)
+        self._nesil = 0
+        self._bekleyen = 0
+        self._yoklama = None
+
+    def calistir(self, kanal, is_fonk, bitince=None, hata=None, ilerleme=None):
+        self._nesil += 1
+        nesil = self._nesil
+        if self.havuz is None:
+            try: sonuc = is_fonk(ilerleme) if ilerleme else is_fonk()
+            except Exception as e:
+                if hata: hata(e)
+                else: raise
+                return
+            if bitince: bitince(sonuc)
+            return
+        self.iptal(kanal)
+        eylem = izleyici.tut()
+        if eylem is not None: self._izler[nesil] = eylem
+        if ilerleme: is_fonk = partial(is_fonk, lambda *bilgi: self.kuyruk.put((kanal, nesil, None, bilgi)))
+        gelecek = self.havuz.submit(contextvars.copy_context().run, self._sar, kanal, nesil, is_fonk)
+        self.kanallar[kanal] = (nesil, gelecek, bitince, hata, ilerleme)
+        self._bekleyen += 1
+        if self._bekleyen == 1 and self.mesgul_degisti: self.mesgul_degisti(True)
+        if self._yoklama is None: self._yoklama = self.root.after(self.YOKLAMA_MS, self._yokla)
+
+    def _sar(self, kanal, nesil, is_fonk):
+        # İşçi thread'i: Tk'ye dokunmaz, sonucu kuyruğa bırakır (basarili None: ara bildirim)
+        try: self.kuyruk.put((kanal, nesil, True, is_fonk()))
+        except Exception as e: self.kuyruk.put((kanal, nesil, False, e))
+
+    def iptal(self, kanal):
+        kayit = self.kanallar.pop(kanal, None)
+        if kayit is None: return
+        if kayit[1].cancel(): # Başlamamıştı; kuyruğa hiç sonuç gelmeyecek
+            self._azalt(); izleyici.birak(self._izler.pop(kayit[0], None))
+
+    def _azalt(self):
+        self._bekleyen -= 1
+        if self._bekleyen == 0 and self.mesgul_degisti: self.mesgul_degisti(False)
+
+    def _yokla(self):
+        self._yoklama = None
+        while True:
+            try: kanal, nesil, basarili, sonuc = self.kuyruk.get_nowait()
+            except queue.Empty: break
+            if basarili is None:
+                kayit = self.kanallar.get(kanal)
+                if kayit is not None and kayit[0] == nesil: kayit[4](*sonuc)
+                continue
+            self._azalt()
+            eylem = self._izler.pop(nesil, None)
+            kayit = self.kanallar.get(kanal)
+            if kayit is None or kayit[0] != nesil: izleyici.birak(eylem); continue # Yerine yenisi gelmiş; sonuç atılır
+            del self.kanallar[kanal]
+            _, _, bitince, hata, _ = kayit
+            with izleyici.devam(eylem):
+                if basarili:
+                    if bitince: bitince(sonuc)
+                elif hata: hata(sonuc)
+                else: self.root.report_callback_exception(type(sonuc), sonuc, sonuc.__traceback__)
+        if self._bekleyen > 0: self._yoklama = self.root.after(self.YOKLAMA_MS, self._yokla)
+
+    def kapat(self):
+        if self._yoklama is not None: self.root.after_cancel(self._yoklama); self._yoklama = None
+        if self.havuz is not None: self.havuz.shutdown(wait=False, cancel_futures=True)
+        self._izler.clear()
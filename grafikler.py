@@ -0,0 +1,156 @@
+from datetime import date
+
+import numpy as np
+import matplotlib as mpl
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba, ListedColormap
+from matplotlib.patches import Patch
+import matplotlib.dates as mdates
+import matplotlib.transforms as mtransforms
+
+from tarih_deposu import MPL_EPOCH_SIRASI
+from analiz import ISI_RENKLERI, HAFTA_SUTUNU, renk_kovalari, ay_basi_sutunlari
+
+# Çizim fonksiyonları yalnızca bir Figure alır; Tk paneli de Agg ile dosyaya aktarım da aynılarını kullanır
+ISI_HARITASI_MAKS_YIL = 10 # "Tümü" seçiliyken alt alta çizilecek en fazla yıl
+AY_KISALTMALARI = ["Oca", "Şub", "Mar", "Nis", "May", "Haz", "Tem", "Ağu", "Eyl", "Eki", "Kas", "Ara"]
+
+# Haftalık kayıt sayısına göre bant rengi, saydamlığı ve etiketi (0, 1, 2, 3, 4+)
+HAFTA_RENKLERI = [("red", 0.05, "Yok"), ("orange", 0.05, "1"), ("green", 0.08, "2"), ("blue", 0.08, "3"), ("purple", 0.1, "4+")]
+
+
+class ZamanCizelgesi:
+    """
+    Uzun geçmişler için zaman çizelgesi çizici.
+    Haftalık bantlar tek bir PolyCollection; hafta etiketleri yalnızca yeterince yakınlaşınca
+    ve yalnızca görünen haftalar için çizilir; toplam çizgisi piksel genişliğine indirgenir.
+    Ayrıntı, eksenin xlim_changed olayında yeniden hesaplanır.
+    """
+    ETIKET_ESIGI = 80 # Görünen hafta sayısı bunun altındaysa hafta etiketleri gösterilir
+    ISARET_ESIGI = 400 # Görünen nokta sayısı bunun altındaysa 'o' işaretleri gösterilir
+
+    def __init__(self, ax, veri):
+        # veri: analiz.zaman_cizelgesi_verisi çıktısı; önbellekte paylaşıldığı için değiştirilmez
+        self.ax = ax
+        self.x = veri["x"]
+        self.y = np.arange(1, len(self.x) + 1)
+        self.hafta_x, self.kategori = veri["hafta_x"], veri["kategori"]
+        self.etiketler = []
+
+        renkler = np.array([to_rgba(c, a) for c, a, _ in HAFTA_RENKLERI])
+        # Bantlar x'te veri, y'de eksen koordinatında: yakınlaşınca yeniden hesaplanmaz
+        self.karisik = mtransforms.blended_transform_factory(ax.transData, ax.transAxes)
+        koseler = np.empty((len(self.hafta_x), 4, 2))
+        koseler[:, 0, 0] = koseler[:, 1, 0] = self.hafta_x
+        koseler[:, 2, 0] = koseler[:, 3, 0] = self.hafta_x + 6
+        koseler[:, :, 1] = (0, 1, 1, 0)
+        ax.add_collection(PolyCollection(koseler, facecolors=renkler[self.kategori], edgecolors="none", transform=self.karisik), autolim=False)
+
+        self.cizgi, = ax.plot(self.x, self.y, marker='o', linestyle='-', zorder=10)
+        ax.text(self.x[-1], self.y[-1], f"{len(self.y)}", fontsize=9, ha='right', color='blue', fontweight='bold')
+        ax.xaxis_date()
+        konum = mdates.AutoDateLocator(minticks=4, maxticks=16)
+        bicim = mdates.AutoDateFormatter(konum); bicim.scaled[30.] = '%B %Y'; bicim.scaled[365.] = '%Y'
+        ax.xaxis.set_major_locator(konum); ax.xaxis.set_major_formatter(bicim)
+        ax.set_ylim(0, len(self.y) * 1.05 + 1)
+        ax.callbacks.connect('xlim_changed', self._xlim_degisti)
+        ax.set_xlim(veri["ilk_gun"] - MPL_EPOCH_SIRASI, veri["son_gun"] - MPL_EPOCH_SIRASI)
+
+    def _xlim_degisti(self, ax):
+        x0, x1 = ax.get_xlim()
+        self._cizgiyi_indirge(x0, x1)
+        self._etiketleri_guncelle(x0, x1)
+
+    def _cizgiyi_indirge(self, x0, x1):
+        # Görünen aralığın bir dışındaki noktalar da alınır ki çizgi kenarda kopmasın
+        lo = max(np.searchsorted(self.x, x0) - 1, 0)
+        hi = min(np.searchsorted(self.x, x1, side='right') + 1, len(self.x))
+        x, y = self.x[lo:hi], self.y[lo:hi]
+        genislik = max(int(self.ax.bbox.width), 1)
+        if len(x) > 2 * genislik and x1 > x0:
+            # Toplam çizgisi monoton artan: her piksel sütununda ilk ve son nokta yeterli
+            sutun = ((x - x0) * (genislik / (x1 - x0))).astype(np.int64)
+            _, ilkler = np.unique(sutun, return_index=True)
+            sonlar = np.append(ilkler[1:] - 1, len(x) - 1)
+            sec = np.unique(np.concatenate((ilkler, sonlar)))
+            x, y = x[sec], y[sec]
+        self.cizgi.set_data(x, y)
+        self.cizgi.set_marker('o' if len(x) < self.ISARET_ESIGI else '')
+
+    def _etiketleri_guncelle(self, x0, x1):
+        for t in self.etiketler: t.remove()
+        self.etiketler = []
+        lo = max(int(np.searchsorted(self.hafta_x, x0 - 7)), 0)
+        hi = int(np.searchsorted(self.hafta_x, x1, side='right'))
+        if hi - lo > self.ETIKET_ESIGI: return
+        for hx, k in zip(self.hafta_x[lo:hi], self.kategori[lo:hi]):
+            c, _, t = HAFTA_RENKLERI[k]
+            self.etiketler.append(self.ax.text(hx + 3.5, 0.5, t, rotation=90, ha='center', fontsize=8, color=c, fontweight='bold', alpha=0.7, transform=self.karisik, clip_on=True))
+
+
+def sekli_sifirla(fig):
+    """Figure'ı yeniden kullanıma hazırlar: clf() kenar boşluklarını (subplotpars) sıfırlamaz."""
+    fig.clf()
+    fig.subplots_adjust(**{k: mpl.rcParams[f"figure.subplot.{k}"] for k in ("left", "right", "bottom", "top", "wspace", "hspace")})
+    return fig
+
+
+def zaman_cizelgesi_ciz(fig, veri, baslik):
+    ax = fig.add_subplot(111)
+    ax.set_title(baslik)
+    ax.set_ylabel("Toplam Sayı"); ax.grid(True, alpha=0.5)
+    cizelge = ZamanCizelgesi(ax, veri)
+    fig.autofmt_xdate(rotation=45, ha='right')
+    return cizelge
+
+
+def histogram_ciz(fig, days, freqs, baslik):
+    ax = fig.add_subplot(111)
+    colors = ['#66bb6a' if d<=3 else '#ffa726' if d<=7 else '#ef5350' for d in days]
+    bars = ax.bar(days, freqs, color=colors, edgecolor='black', alpha=0.8, picker=True)
+    ax.set_title(baslik); ax.set_xticks(days); ax.grid(True, axis='y', alpha=0.3)
+    for bar in bars: ax.text(bar.get_x()+bar.get_width()/2., bar.get_height(), f'{int(bar.get_height())}', ha='center', va='bottom')
+    return bars
+
+
+def isi_haritasi_ciz(fig, yillar, izgaralar):
+    cmap = ListedColormap(ISI_RENKLERI); cmap.set_bad("white")
+    axes = fig.subplots(len(yillar), 1, squeeze=False)[:, 0]
+    for ax, hedef, izgara in zip(axes, yillar, izgaralar):
+        # Tek QuadMesh: 365 ayrı nokta/renk yerine tek dizi
+        ax.pcolormesh(np.arange(HAFTA_SUTUNU + 1) - 0.5, np.arange(8) - 0.5, renk_kovalari(izgara), cmap=cmap, vmin=-0.5, vmax=4.5, edgecolors="white", linewidth=1.5)
+        ax.set_title(f"{hedef} Yoğunluk (Top: {int(izgara.clip(min=0).sum())})"); ax.set_yticks([0, 2, 4, 6]); ax.set_yticklabels(["Paz", "Cum", "Çar", "Pzt"])
+        ax.set_xticks(ay_basi_sutunlari(hedef)); ax.set_xticklabels([date(hedef, m, 1).strftime("%b") for m in range(1, 13)]); ax.set_aspect('equal')
+        ax.set_xlim(-0.5, HAFTA_SUTUNU - 0.5); ax.set_ylim(-0.5, 6.5)
+        for sp in ax.spines.values(): sp.set_visible(False)
+        ax.tick_params(length=0)
+    patches = [Patch(facecolor=ISI_RENKLERI[i], label=str(i) if i<4 else "4+") for i in range(5)]
+    axes[-1].legend(handles=patches, loc='upper center', bbox_to_anchor=(0.5, -0.1 if len(yillar) == 1 else -0.3), ncol=5, frameon=False); fig.subplots_adjust(bottom=0.2) if len(yillar) == 1 else fig.subplots_adjust(bottom=0.08, hspace=0.6)
+
+
+def aylik_ciz(fig, sayilar, yillar=None):
+    """sayilar: 12 aylık sayı; yillar verilirse yıl başına 12'lik satırlar, her yıl üst üste yığılır."""
+    ax=fig.add_subplot(111)
+    if yillar is None: b=ax.bar(AY_KISALTMALARI, sayilar, color='cornflowerblue'); toplam=sayilar
+    else:
+        taban=np.zeros(12, dtype=np.int64); renkler=mpl.colormaps["tab20"]
+        for i, (yil, satir) in enumerate(zip(yillar, sayilar)):
+            b=ax.bar(AY_KISALTMALARI, satir, bottom=taban, color=renkler(i % 20), label=str(yil)); taban=taban + np.asarray(satir)
+        toplam=taban; ax.legend(ncol=min(len(yillar), 6), fontsize=8)
+    for x, t in zip(b, toplam):
+        if t>0: ax.text(x.get_x()+x.get_width()/2, x.get_y()+x.get_height(), str(int(t)), ha='center', va='bottom')
+
+
+def birliktelik_ciz(fig, adlar, birliktelik, oranlar):
+    """Etkinlikler arası aynı gün birlikte görülme: renk Jaccard oranı, az etkinlikte hücrelerde gün sayısı."""
+    ax = fig.add_subplot(111)
+    n = len(adlar)
+    im = ax.imshow(oranlar, cmap="Greens", vmin=0, vmax=1, interpolation="nearest")
+    ax.set_xticks(range(n)); ax.set_yticks(range(n))
+    yazi = max(5, 10 - n // 10)
+    ax.set_xticklabels(adlar, rotation=60, ha="right", fontsize=yazi); ax.set_yticklabels(adlar, fontsize=yazi)
+    if n <= 15:
+        for i in range(n):
+            for j in range(n): ax.text(j, i, str(birliktelik[i, j]), ha="center", va="center", fontsize=8, color="white" if oranlar[i, j] > 0.6 else "black")
+    ax.set_title("Aynı Gün Birlikte Görülme (renk: Jaccard, sayı: gün)")
+    fig.colorbar(im, ax=ax, fraction=0.03)
@@ -0,0 +1,185 @@
+"""
+Etkinlik başına gün bitmap'i: her takvim günü için bir bit, 64 günlük np.uint64 kelimelerde.
+Etkinlikler arası karşılaştırmalar (aynı gün birlikte görülme, "A var B yok", birleşim) kelime kelime
+AND / OR / ANDNOT ve popcount ile hesaplanır; gün ya da etkinlik çifti başına Python döngüsü yoktur.
+"""
+from datetime import date
+
+import numpy as np
+
+from depolama import ISLEM_EKLE, ISLEM_SIL, ISLEM_ETKINLIK_SIL, ISLEM_ETKINLIK_ADLANDIR
+from tarih_deposu import gun_sirasi
+
+KELIME = 64
+PAY = 16 # Aralık dışına eklemede bir seferde açılan fazladan kelime (~3 yıl); her eklemede kopyalama olmasın
+
+if hasattr(np, "bitwise_count"): # NumPy >= 2.0
+    def bit_sayisi(kelimeler, eksen=-1):
+        return np.bitwise_count(kelimeler).sum(axis=eksen, dtype=np.int64)
+else:
+    _BIT_TABLOSU = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    def bit_sayisi(kelimeler, eksen=-1):
+        bayt = np.ascontiguousarray(kelimeler).view(np.uint8)
+        return _BIT_TABLOSU[bayt].sum(axis=eksen, dtype=np.int64)
+
+
+def _bitler(kelimeler):
+    # Kelime dizisini gün başına 0/1 dizisine açar (bit i = bas + i. gün)
+    return np.unpackbits(np.ascontiguousarray(kelimeler, dtype="<u8").view(np.uint8), bitorder="little", axis=-1)
+
+
+class GunBitmapi:
+    """bas: ilk kelimenin ilk gününün sırası (64'ün katı). Boş bitmap'te kelime yoktur."""
+    __slots__ = ("bas", "kelimeler")
+
+    def __init__(self, bas=0, kelimeler=None):
+        self.bas = bas
+        self.kelimeler = np.zeros(0, dtype="<u8") if kelimeler is None else kelimeler
+
+    @classmethod
+    def siralardan(cls, siralar):
+        """Sıralı gün sıralarından (array('i') / NumPy) kurar."""
+        s = np.asarray(siralar, dtype=np.int64)
+        if len(s) == 0: return cls()
+        bas = int(s[0]) // KELIME * KELIME
+        bitler = np.zeros((int(s[-1]) - bas) // KELIME * KELIME + KELIME, dtype=np.uint8)
+        bitler[s - bas] = 1
+        return cls(bas, np.packbits(bitler, bitorder="little").view("<u8"))
+
+    def kopya(self):
+        return GunBitmapi(self.bas, self.kelimeler.copy())
+
+    def __len__(self):
+        return int(bit_sayisi(self.kelimeler)) if len(self.kelimeler) else 0
+
+    def _kapsa(self, sira):
+        # sira'yı içerecek şekilde kelime dizisini genişletir; sira'nın kelime indeksini döner
+        k = sira // KELIME - self.bas // KELIME
+        n = len(self.kelimeler)
+        if n == 0:
+            self.bas = sira // KELIME * KELIME; self.kelimeler = np.zeros(1, dtype="<u8"); return 0
+        if k < 0:
+            ek = -k + PAY
+            self.kelimeler = np.concatenate([np.zeros(ek, dtype="<u8"), self.kelimeler]); self.bas -= ek * KELIME; k += ek
+        elif k >= n:
+            self.kelimeler = np.concatenate([self.kelimeler, np.zeros(k - n + 1 + PAY, dtype="<u8")])
+        return k
+
+    def ekle(self, sira):
+        k = self._kapsa(sira)
+        self.kelimeler[k] |= np.uint64(1) << np.uint64(sira % KELIME)
+
+    def sil(self, sira):
+        k = sira // KELIME - self.bas // KELIME
+        if 0 <= k < len(self.kelimeler): self.kelimeler[k] &= ~(np.uint64(1) << np.uint64(sira % KELIME))
+
+    def siralar(self):
+        return np.flatnonzero(_bitler(self.kelimeler)).astype(np.int32) + np.int32(self.bas)
+
+
+class BitmapIndeksi:
+    """
+    Etkinlik adı -> GunBitmapi. Bitmap ilk istendiğinde indeksten kurulur; sonrasında json_kaydet'e giden
+    işlemler uygula() ile bit bit yansıtılır. Henüz kurulmamış etkinliklerin işlemleri yok sayılır (kurulunca güncel olur).
+    """
+    def __init__(self):
+        self.bitmapler = {}
+
+    def getir(self, ad, indeks):
+        bm = self.bitmapler.get(ad)
+        if bm is None: bm = self.bitmapler[ad] = GunBitmapi.siralardan(indeks.siralar)
+        return bm
+
+    def uygula(self, islemler):
+        for islem in islemler:
+            tur = islem[0]
+            if tur in (ISLEM_EKLE, ISLEM_SIL):
+                bm = self.bitmapler.get(islem[1])
+                if bm is None: continue
+                try: sira = gun_sirasi(islem[2])
+                except ValueError: continue
+                if tur == ISLEM_EKLE: bm.ekle(sira)
+                else: bm.sil(sira)
+            elif tur == ISLEM_ETKINLIK_SIL: self.bitmapler.pop(islem[1], None)
+            elif tur == ISLEM_ETKINLIK_ADLANDIR:
+                bm = self.bitmapler.pop(islem[1], None)
+                if bm is not None: self.bitmapler[islem[2]] = bm
+
+    def dusur(self, ad):
+        self.bitmapler.pop(ad, None)
+
+    def temizle(self):
+        self.bitmapler.clear()
+
+
+# --- KARŞILAŞTIRMALAR (saf fonksiyonlar; işçi thread'inde kopyalar üzerinde çalışır) ---
+def hizala(bitmapler):
+    """Bitmap listesini ortak gün aralığında E x W kelime matrisine yerleştirir: (bas, matris)."""
+    dolu = [b for b in bitmapler if len(b.kelimeler)]
+    if not dolu: return 0, np.zeros((len(bitmapler), 0), dtype="<u8")
+    bas = min(b.bas for b in dolu)
+    son = max(b.bas + len(b.kelimeler) * KELIME for b in dolu)
+    matris = np.zeros((len(bitmapler), (son - bas) // KELIME), dtype="<u8")
+    for i, b in enumerate(bitmapler):
+        k = (b.bas - bas) // KELIME
+        matris[i, k:k + len(b.kelimeler)] = b.kelimeler
+    return bas, matris
+
+
+def kes(bas, matris, ilk, son):
+    """Hizalanmış matrisi [ilk, son) gün aralığına indirger; kenar kelimelerde aralık dışı bitler sıfırlanır: (bas, matris)."""
+    k0 = max(0, (ilk - bas) // KELIME); k1 = min(matris.shape[1], -(-(son - bas) // KELIME))
+    if k1 <= k0: return bas, matris[:, :0]
+    matris = matris[:, k0:k1].copy(); bas += k0 * KELIME
+    bastaki = ilk - bas # İlk kelimede atlanacak bit sayısı
+    if bastaki > 0: matris[:, 0] &= ~np.uint64((1 << bastaki) - 1)
+    sondaki = son - (bas + (k1 - k0 - 1) * KELIME) # Son kelimede tutulacak bit sayısı
+    if sondaki < KELIME: matris[:, -1] &= np.uint64((1 << sondaki) - 1)
+    return bas, matris
+
+
+def birliktelik_matrisi(matris):
+    """E x E: iki etkinliğin birlikte bulunduğu gün sayısı; köşegen = etkinliğin gün sayısı. Satır başına tek vektörel adım."""
+    sonuc = np.empty((len(matris), len(matris)), dtype=np.int64)
+    for i in range(len(matris)): sonuc[i] = bit_sayisi(matris[i] & matris)
+    return sonuc
+
+
+def jaccard(birliktelik):
+    """Birlikte / (A ∪ B) oranı; gün sayısı farklı etkinlikleri karşılaştırılabilir kılar."""
+    kosegen = np.diag(birliktelik)
+    birlesim = kosegen[:, None] + kosegen[None, :] - birliktelik
+    return np.divide(birliktelik, birlesim, out=np.zeros(birliktelik.shape), where=birlesim > 0)
+
+
+def fark_gunleri(bas, a, b):
+    """a'da olup b'de olmayan günlerin sıraları (a, b: hizalanmış kelime satırları)."""
+    return np.flatnonzero(_bitler(a & ~b)).astype(np.int32) + np.int32(bas)
+
+
+def gun_sayilari(bas, matris, ilk, son):
+    """[ilk, son) aralığındaki her gün için kaç etkinliğin kaydı olduğu: (günler, sayılar), yalnızca sıfırdan büyükler."""
+    k0 = max(0, (ilk - bas) // KELIME); k1 = min(matris.shape[1], -(-(son - bas) // KELIME))
+    if k1 <= k0: return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64)
+    sayilar = _bitler(matris[:, k0:k1]).sum(axis=0, dtype=np.int64)
+    gunler = np.arange(bas + k0 * KELIME, bas + k1 * KELIME, dtype=np.int32)
+    sec = (sayilar > 0) & (gunler >= ilk) & (gunler < son)
+    return gunler[sec], sayilar[sec]
+
+
+def aralik(bas, matris):
+    """Herhangi bir satırda biti açık ilk ve son gün: (ilk, son) ya da boşsa None."""
+    birlesim = np.bitwise_or.reduce(matris, axis=0) if len(matris) else matris
+    dolu = np.flatnonzero(birlesim)
+    if len(dolu) == 0: return None
+    ilk_k, son_k = int(dolu[0]), int(dolu[-1])
+    ilk = np.flatnonzero(_bitler(birlesim[ilk_k:ilk_k + 1]))[0]; son = np.flatnonzero(_bitler(birlesim[son_k:son_k + 1]))[-1]
+    return bas + ilk_k * KELIME + int(ilk), bas + son_k * KELIME + int(son)
+
+
+def birlesim_izgaralari(bas, matris, yillar):
+    """Seçili etkinliklerin birleşimi için yıl başına ısı haritası ızgaraları; hücre = o gün kaydı olan etkinlik sayısı."""
+    from analiz import isi_haritasi_izgarasi
+    gunler, sayilar = gun_sayilari(bas, matris, date(min(yillar), 1, 1).toordinal(), date(max(yillar) + 1, 1, 1).toordinal())
+    siralar = np.repeat(gunler, sayilar)
+    return [isi_haritasi_izgarasi(siralar, y) for y in yillar]
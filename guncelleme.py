@@ -0,0 +1,110 @@
+"""
+Sürüm kontrolü (GitHub "latest release"), diskte önbellekli ve koşullu:
+
+    python guncelleme.py --kullanici greenwake --repo EventTracker
+    ETKINLIK_GUNCELLEME_URL=http://127.0.0.1:8000 python guncelleme.py ... --zorla   # yerel sahte sunucuya karşı
+
+Son yanıt (etiket, sayfa, ETag, zaman) önbellek dosyasında tutulur. Önbellek TTL süresince tazeyse ağa hiç
+çıkılmaz; bayatsa ETag ile If-None-Match gönderilir ve 304 gelirse gövde indirilmeden önbellek tazelenir.
+Ağ hatasında HATA_TTL boyunca yeniden denenmez (çevrimdışı makinelerde her girişte bağlantı beklenmesin).
+İstekler tek bir requests.Session üzerinden gider; bağlantı havuzu ve TLS oturumu sonraki kontrollerde yeniden kullanılır.
+"""
+import json
+import os
+import threading
+import time
+
+API_KOKU = os.environ.get("ETKINLIK_GUNCELLEME_URL", "https://api.github.com").rstrip("/")
+TTL = int(os.environ.get("ETKINLIK_GUNCELLEME_TTL", 12 * 3600)) # saniye
+HATA_TTL = 3600 # Başarısız denemeden sonra otomatik kontrolün bekleyeceği süre (saniye)
+ZAMAN_ASIMI = (3, 5) # (bağlanma, okuma) saniye
+# Kullanıcı verisi klasörünün (Data) dışında: oradaki her .json bir hesap dosyası sayılır
+VARSAYILAN_ONBELLEK = os.path.join(os.path.expanduser("~"), ".eventtracker", "guncelleme.json")
+
+_oturum = None
+_kilit = threading.Lock() # Aynı anda tek kontrol: oturum ve önbellek dosyası paylaşılır
+
+
+def oturum():
+    global _oturum
+    if _oturum is None:
+        import requests # Yalnızca ağa çıkılacaksa yüklenir
+        _oturum = requests.Session()
+        _oturum.headers.update({"Accept": "application/vnd.github+json", "User-Agent": "EventTracker"})
+    return _oturum
+
+
+def adres(kullanici, repo, kok=None):
+    return f"{(kok or API_KOKU).rstrip('/')}/repos/{kullanici}/{repo}/releases/latest"
+
+
+def onbellek_oku(yol):
+    try:
+        with open(yol, "r", encoding="utf-8") as f: kayit = json.load(f)
+        return kayit if isinstance(kayit, dict) else {}
+    except (OSError, ValueError): return {}
+
+
+def _onbellek_yaz(yol, kayit):
+    gecici = f"{yol}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(yol) or ".", exist_ok=True)
+        with open(gecici, "w", encoding="utf-8") as f: json.dump(kayit, f, ensure_ascii=False)
+        os.replace(gecici, yol)
+    except OSError: pass # Önbellek yazılamazsa kontrol yine çalışır, yalnızca bir dahaki sefere tekrar sorulur
+
+
+def surum_bilgisi(kayit):
+    """Önbellek kaydından (etiket, sayfa); yayınlanmış sürüm yoksa None."""
+    return (kayit["etiket"], kayit["sayfa"]) if kayit.get("etiket") else None
+
+
+def taze_kayit(yol, url, simdi=None):
+    """Önbellek bu adres için tazeyse kaydı, değilse None döner. Yalnızca küçük bir dosya okur; ana thread'de çağrılabilir."""
+    kayit = onbellek_oku(yol)
+    if kayit.get("url") != url: return None
+    simdi = time.time() if simdi is None else simdi
+    return kayit if simdi - kayit.get("zaman", 0) < TTL or simdi - kayit.get("hata", 0) < HATA_TTL else None
+
+
+def son_surum(yol, url, simdi=None):
+    """
+    Ağdan (koşullu istekle) son sürümü sorar: (etiket, sayfa) ya da yayınlanmış sürüm / repo yoksa None.
+    Ağ hatası istisna olarak yükselir (deneme zamanı önbelleğe yazılır). İşçi thread'inde çağrılır.
+    """
+    with _kilit:
+        kayit = onbellek_oku(yol)
+        if kayit.get("url") != url: kayit = {"url": url}
+        simdi = time.time() if simdi is None else simdi
+        basliklar = {"If-None-Match": kayit["etag"]} if kayit.get("etag") else {}
+        try:
+            yanit = oturum().get(url, headers=basliklar, timeout=ZAMAN_ASIMI)
+            if yanit.status_code == 200:
+                veri = yanit.json()
+                kayit = {"url": url, "etag": yanit.headers.get("ETag"), "etiket": veri["tag_name"], "sayfa": veri["html_url"]}
+            elif yanit.status_code == 404: kayit = {"url": url} # Repo veya yayınlanmış sürüm yok
+            elif yanit.status_code != 304: raise IOError(f"HTTP {yanit.status_code}") # Örn. 403: istek sınırı
+        except Exception:
+            kayit["hata"] = simdi; _onbellek_yaz(yol, kayit)
+            raise
+        kayit["zaman"] = simdi; kayit.pop("hata", None)
+        _onbellek_yaz(yol, kayit)
+        return surum_bilgisi(kayit)
+
+
+def main():
+    import argparse # Uygulama bu modülü girişte yükler; yalnızca komut satırında gerekir
+    ap = argparse.ArgumentParser(description="Son yayınlanan sürümü (önbellekli) gösterir.")
+    ap.add_argument("--kullanici", required=True)
+    ap.add_argument("--repo", required=True)
+    ap.add_argument("--onbellek", default=VARSAYILAN_ONBELLEK)
+    ap.add_argument("--zorla", action="store_true", help="Önbellek taze olsa da (koşullu) istek gönder")
+    args = ap.parse_args()
+    url = adres(args.kullanici, args.repo)
+    taze = None if args.zorla else taze_kayit(args.onbellek, url)
+    sonuc = surum_bilgisi(taze) if taze else son_surum(args.onbellek, url)
+    print(f"{sonuc[0]}  {sonuc[1]}" if sonuc else "Yayınlanmış sürüm yok.", "(önbellekten)" if taze else "")
+
+
+if __name__ == "__main__":
+    main()
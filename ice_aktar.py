@@ -0,0 +1,197 @@
+"""
+TXT / CSV / ICS dosyalarından akış halinde tarih içe aktarma:
+
+    python ice_aktar.py --kullanici ali --etkinlik Spor eventList.txt
+    python ice_aktar.py --kullanici ali --etkinlik Genel --kaynak-adlari takvim.ics
+
+Dosya satır satır okunur (bellek dosya boyutuyla değil, yeni eklenen gün sayısıyla büyür), satırlar
+PARCA büyüklüğünde gruplar halinde işlenir ve her grubun ardından ilerleme bildirilir. Her kayıt bir etkinliğe
+eşlenir; etkinliğin mevcut günleri ve dosyada daha önce görülenler bir kümede tutulur, tekrarlar atlanır.
+Sonuç tek seferde kaydedilir (bkz. islemler).
+
+TXT: satır başına bir tarih; eski eventList.txt biçimindeki "[...] 01.02.2024" satırları da okunur.
+CSV: ayırıcı ilk satırdan tahmin edilir; başlık varsa tarih/etkinlik sütunları adından bulunur.
+ICS: her VEVENT'in DTSTART günü ve SUMMARY'si (RRULE tekrarları açılmaz).
+"""
+import argparse
+import csv
+import os
+import sys
+from array import array
+from itertools import chain, islice
+
+from depolama import veri_deposu_ac, DEPO_JSON, ISLEM_EKLE, ISLEM_ETKINLIK_EKLE
+from tarih_deposu import EtkinlikIndeksi, gun_sirasi, sira_metni
+
+BICIMLER = ("txt", "csv", "ics")
+PARCA = 10_000 # İlerleme bildirimi ve kümeye işleme aralığı (kayıt)
+EN_FAZLA_COZULMUS = 50_000 # Tarih kısmı -> sıra ön belleğinin üst sınırı (~137 yıllık farklı gün)
+TARIH_BASLIKLARI = {"tarih", "date", "gün", "gun", "day", "datetime", "başlangıç", "baslangic", "start", "dtstart"}
+ETKINLIK_BASLIKLARI = {"etkinlik", "event", "ad", "name", "başlık", "baslik", "title", "summary", "kategori", "category"}
+
+
+def bicim_tahmin(yol):
+    uzanti = os.path.splitext(yol)[1].lower().lstrip(".")
+    return uzanti if uzanti in BICIMLER else "txt"
+
+
+def tarih_parcasi(metin):
+    """Metnin saat kısmı atılmış tarih kısmı: "20240102T100000Z" -> "20240102", "01.02.2024 10:00" -> "01.02.2024"."""
+    parcalar = metin.split()
+    return parcalar[0].split("T")[0] if parcalar else ""
+
+
+def tarih_sirasi(metin):
+    """dd.mm.YYYY, dd/mm/YYYY, dd-mm-YYYY, YYYY-MM-DD ve YYYYMMDD (saat kısmı yok sayılır). Geçersizse None."""
+    return _parca_sirasi(tarih_parcasi(metin))
+
+
+def _parca_sirasi(metin):
+    if not metin: return None
+    try:
+        if len(metin) == 8 and metin.isdigit(): return gun_sirasi(f"{metin[6:8]}.{metin[4:6]}.{metin[0:4]}")
+        if len(metin) >= 10 and metin[4] == "-" and metin[7] == "-": return gun_sirasi(f"{metin[8:10]}.{metin[5:7]}.{metin[0:4]}")
+        return gun_sirasi(metin[:10].replace("/", ".").replace("-", "."))
+    except ValueError: return None
+
+
+# --- OKUMA HATTI: bayt satırları -> metin satırları -> (kaynak etkinlik adı | None, tarih metni) ---
+def satirlar(f, durum):
+    """İkili dosyadan metin satırları; okunan bayt durum["okunan"]'da tutulur. UTF-8 değilse cp1254 denenir."""
+    for i, ham in enumerate(f):
+        durum["okunan"] += len(ham)
+        try: satir = ham.decode("utf-8")
+        except UnicodeDecodeError: satir = ham.decode("cp1254", "replace") # Eski Windows kayıtları
+        if i == 0: satir = satir.lstrip("\ufeff")
+        yield satir.rstrip("\r\n")
+
+
+def txt_kayitlari(satirlar):
+    for s in satirlar:
+        s = s.split("]")[-1].strip() if "]" in s else s.strip()
+        if s: yield None, s
+
+
+def csv_kayitlari(satirlar):
+    ilk = next(satirlar, None)
+    if ilk is None: return
+    ayirici = max(";,\t|", key=ilk.count) if any(a in ilk for a in ";,\t|") else ","
+    okuyucu = csv.reader(chain([ilk], satirlar), delimiter=ayirici)
+    baslik = next(okuyucu, [])
+    adlar = [h.strip().lower() for h in baslik]
+    t_sutun = next((i for i, h in enumerate(adlar) if h in TARIH_BASLIKLARI), None)
+    e_sutun = next((i for i, h in enumerate(adlar) if h in ETKINLIK_BASLIKLARI), None)
+    if t_sutun is None:
+        # Başlık yok: ilk satır veridir; tarih içeren ilk sütun tarih, iki sütunluysa diğeri etkinlik
+        t_sutun = next((i for i, h in enumerate(baslik) if tarih_sirasi(h) is not None), 0)
+        if len(baslik) == 2: e_sutun = 1 - t_sutun
+        okuyucu = chain([baslik], okuyucu)
+    for satir in okuyucu:
+        if len(satir) <= t_sutun: continue
+        ad = satir[e_sutun].strip() if e_sutun is not None and e_sutun < len(satir) else ""
+        yield ad or None, satir[t_sutun]
+
+
+def _ics_coz(deger):
+    return deger.replace("\\n", " ").replace("\\N", " ").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\").strip()
+
+
+def ics_kayitlari(satirlar):
+    # Katlanmış satırlar (boşlukla başlayan devam satırları) akış içinde birleştirilir
+    def acilmis():
+        onceki = None
+        for s in satirlar:
+            if s[:1] in (" ", "\t") and onceki is not None: onceki += s[1:]; continue
+            if onceki is not None: yield onceki
+            onceki = s
+        if onceki is not None: yield onceki
+    olay = None
+    for s in acilmis():
+        ad, _, deger = s.partition(":")
+        ad = ad.split(";")[0].upper()
+        if ad == "BEGIN" and deger.upper() == "VEVENT": olay = {}
+        elif ad == "END" and deger.upper() == "VEVENT":
+            if olay and "DTSTART" in olay: yield olay.get("SUMMARY") or None, olay["DTSTART"]
+            olay = None
+        elif olay is not None and ad in ("DTSTART", "SUMMARY"): olay[ad] = _ics_coz(deger) if ad == "SUMMARY" else deger
+
+
+OKUYUCULAR = {"txt": txt_kayitlari, "csv": csv_kayitlari, "ics": ics_kayitlari}
+
+
+def _kume(deger):
+    # Mevcut etkinlik: EtkinlikIndeksi / sıra dizisi ya da henüz ayrıştırılmamış tarih metinleri
+    if isinstance(deger, EtkinlikIndeksi): return set(deger.kume)
+    if isinstance(deger, array): return set(deger)
+    return {s for s in map(tarih_sirasi, deger or ()) if s is not None}
+
+
+def ice_aktar(yol, mevcut, hedef, kaynak_adlari=False, eslestirme=None, bicim=None, ilerleme=None, parca=PARCA):
+    """
+    mevcut: {etkinlik: EtkinlikIndeksi | array('i') | [tarih metni]} — yalnızca okunur (işçi thread'inde kopyası verilir).
+    Adı olmayan kayıtlar ve kaynak_adlari=False iken tüm kayıtlar `hedef` etkinliğe gider;
+    eslestirme {kaynak ad: etkinlik} kaynak adlarını yeniden adlandırır.
+    ilerleme(okunan_bayt, toplam_bayt, eklenen) her parçadan sonra çağrılır.
+    Dönen sözlük: yeni {etkinlik: sıralı array('i')}, indeksler {etkinlik: birleşik EtkinlikIndeksi},
+    yeni_etkinlikler, kayit / eklenen / tekrar / hatali sayıları.
+    """
+    eslestirme = eslestirme or {}
+    kumeler, yeni = {}, {}
+    cozulmus = {} # tarih kısmı -> sıra; saatler farklı olsa da aynı günler çok tekrarlanır
+    sayac = {"kayit": 0, "eklenen": 0, "tekrar": 0, "hatali": 0}
+    durum = {"okunan": 0}
+    toplam = os.path.getsize(yol)
+    with open(yol, "rb") as f:
+        kayitlar = OKUYUCULAR[bicim or bicim_tahmin(yol)](satirlar(f, durum))
+        while True:
+            grup = list(islice(kayitlar, parca))
+            if not grup: break
+            for kaynak, metin in grup:
+                gun = tarih_parcasi(metin)
+                sira = cozulmus.get(gun, -1)
+                if sira == -1:
+                    if len(cozulmus) >= EN_FAZLA_COZULMUS: cozulmus.clear()
+                    sira = cozulmus[gun] = _parca_sirasi(gun)
+                if sira is None: sayac["hatali"] += 1; continue
+                ad = eslestirme.get(kaynak, kaynak) if kaynak_adlari and kaynak else hedef
+                kume = kumeler.get(ad)
+                if kume is None: kume = kumeler[ad] = _kume(mevcut.get(ad)); yeni[ad] = array("i")
+                if sira in kume: sayac["tekrar"] += 1; continue
+                kume.add(sira); yeni[ad].append(sira)
+            sayac["kayit"] += len(grup); sayac["eklenen"] = sum(map(len, yeni.values()))
+            if ilerleme: ilerleme(durum["okunan"], toplam, sayac["eklenen"])
+    yeni = {ad: array("i", sorted(s)) for ad, s in yeni.items() if s}
+    return {"yeni": yeni, "indeksler": {ad: EtkinlikIndeksi(sorted(kumeler[ad])) for ad in yeni},
+            "yeni_etkinlikler": [ad for ad in yeni if ad not in mevcut], **sayac}
+
+
+def islemler(sonuc):
+    """İçe aktarma sonucunu depoya tek uygula() çağrısıyla yazılacak işlemlere çevirir."""
+    for ad in sonuc["yeni_etkinlikler"]: yield (ISLEM_ETKINLIK_EKLE, ad)
+    for ad, siralar in sonuc["yeni"].items():
+        for s in siralar: yield (ISLEM_EKLE, ad, sira_metni(s))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="TXT/CSV/ICS dosyasından tarihleri bir kullanıcının verisine aktarır.")
+    ap.add_argument("dosya")
+    ap.add_argument("--kullanici", required=True)
+    ap.add_argument("--etkinlik", required=True, help="Adı olmayan kayıtların (veya --kaynak-adlari yoksa tümünün) etkinliği")
+    ap.add_argument("--kaynak-adlari", action="store_true", help="CSV etkinlik sütunu / ICS SUMMARY etkinlik adı olarak kullanılır")
+    ap.add_argument("--bicim", choices=BICIMLER, default=None, help="Varsayılan: dosya uzantısı")
+    ap.add_argument("--veri-klasoru", default="Data")
+    ap.add_argument("--depo", default=os.environ.get("ETKINLIK_DEPO", DEPO_JSON))
+    args = ap.parse_args()
+    os.makedirs(args.veri_klasoru, exist_ok=True)
+    depo = veri_deposu_ac(args.depo, args.veri_klasoru, args.kullanici, os.path.join(args.veri_klasoru, "eventtracker.db"))
+    def bildir(okunan, toplam, eklenen):
+        print(f"\r%{100 * okunan // max(toplam, 1):3d}  {eklenen} yeni", end="", file=sys.stderr, flush=True)
+    sonuc = ice_aktar(args.dosya, depo.yukle(), args.etkinlik, args.kaynak_adlari, bicim=args.bicim, ilerleme=bildir)
+    print(file=sys.stderr)
+    if sonuc["eklenen"]: depo.uygula(list(islemler(sonuc))); depo.bekle()
+    print(f"{sonuc['kayit']} kayıt okundu: {sonuc['eklenen']} eklendi, {sonuc['tekrar']} tekrar, {sonuc['hatali']} geçersiz"
+          + (f"; yeni etkinlikler: {', '.join(sonuc['yeni_etkinlikler'])}" if sonuc["yeni_etkinlikler"] else ""))
+
+
+if __name__ == "__main__":
+    main()
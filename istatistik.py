@@ -0,0 +1,139 @@
+"""
+Etkinlik başına sürekli güncellenen seri/aralık istatistikleri.
+
+Bir kez tüm geçmişten (NumPy ile) kurulur, sonra EtkinlikIndeksi.ekle/sil her tek tarih değişikliğinde yalnızca
+komşu aralıkları ve değişen seriyi günceller; seri sınırları sıralı dizide ikili aramayla bulunur (O(log n)).
+Karşılama ekranı ve histogram geçmişi yeniden taramadan buradan okur.
+
+Seri: art arda günlerden oluşan en uzun blok (ör. 3 gün üst üste kayıt = 3 günlük seri).
+"""
+from bisect import bisect_right
+from collections import Counter
+
+import numpy as np
+
+from tarih_deposu import hafta_basi
+
+
+def _sayac(dizi):
+    degerler, adetler = np.unique(dizi, return_counts=True)
+    return Counter(dict(zip(degerler.tolist(), adetler.tolist())))
+
+
+def _azalt(sayac, anahtar):
+    sayac[anahtar] -= 1
+    if sayac[anahtar] <= 0: del sayac[anahtar]
+
+
+def seri_basi(siralar, i):
+    """i. kaydın içinde bulunduğu serinin ilk indeksi: siralar[i] - siralar[j] == i - j olan en küçük j."""
+    lo, hi = 0, i
+    while lo < hi:
+        orta = (lo + hi) // 2
+        if siralar[i] - siralar[orta] == i - orta: hi = orta
+        else: lo = orta + 1
+    return lo
+
+
+def seri_sonu(siralar, i):
+    """i. kaydın içinde bulunduğu serinin son indeksi."""
+    lo, hi = i, len(siralar) - 1
+    while lo < hi:
+        orta = (lo + hi + 1) // 2
+        if siralar[orta] - siralar[i] == orta - i: lo = orta
+        else: hi = orta - 1
+    return lo
+
+
+class SeriIstatistikleri:
+    """
+    aralik_sayilari: ardışık iki kayıt arasındaki gün farkı -> adet (histogramın bugüne kadarki ara hariç kısmı)
+    seri_sayilari: seri uzunluğu -> adet
+    haftalik: hafta başı (Pazartesi) sırası -> kayıt sayısı (zaman çizelgesinin renklendirdiği haftalık sayılar)
+    """
+    __slots__ = ("aralik_sayilari", "seri_sayilari", "haftalik")
+
+    def __init__(self, aralik_sayilari=None, seri_sayilari=None, haftalik=None):
+        self.aralik_sayilari = aralik_sayilari or Counter()
+        self.seri_sayilari = seri_sayilari or Counter()
+        self.haftalik = haftalik or Counter()
+
+    @classmethod
+    def siralardan(cls, siralar):
+        s = np.frombuffer(siralar, dtype=np.int32).astype(np.int64) if len(siralar) else np.empty(0, dtype=np.int64)
+        if len(s) == 0: return cls()
+        farklar = np.diff(s)
+        kirilmalar = np.flatnonzero(farklar != 1)
+        seri_uzunluklari = np.diff(np.concatenate(([-1], kirilmalar, [len(s) - 1])))
+        return cls(_sayac(farklar), _sayac(seri_uzunluklari), _sayac(s - (s + 6) % 7))
+
+    # --- Artımlı güncelleme (EtkinlikIndeksi çağırır) ---
+    def eklendi(self, siralar, i):
+        """siralar[i] yeni eklendi (dizi zaten güncel)."""
+        s = siralar[i]
+        onceki = siralar[i - 1] if i > 0 else None
+        sonraki = siralar[i + 1] if i + 1 < len(siralar) else None
+        if onceki is not None and sonraki is not None: _azalt(self.aralik_sayilari, sonraki - onceki)
+        if onceki is not None: self.aralik_sayilari[s - onceki] += 1
+        if sonraki is not None: self.aralik_sayilari[sonraki - s] += 1
+        bas, son = seri_basi(siralar, i), seri_sonu(siralar, i)
+        # Sol ve sağdaki seriler (varsa) yeni günle birleşir
+        if i > bas: _azalt(self.seri_sayilari, i - bas)
+        if son > i: _azalt(self.seri_sayilari, son - i)
+        self.seri_sayilari[son - bas + 1] += 1
+        self.haftalik[hafta_basi(s)] += 1
+
+    def siliniyor(self, siralar, i):
+        """siralar[i] silinmek üzere (dizi henüz değişmedi)."""
+        s = siralar[i]
+        onceki = siralar[i - 1] if i > 0 else None
+        sonraki = siralar[i + 1] if i + 1 < len(siralar) else None
+        if onceki is not None: _azalt(self.aralik_sayilari, s - onceki)
+        if sonraki is not None: _azalt(self.aralik_sayilari, sonraki - s)
+        if onceki is not None and sonraki is not None: self.aralik_sayilari[sonraki - onceki] += 1
+        bas, son = seri_basi(siralar, i), seri_sonu(siralar, i)
+        _azalt(self.seri_sayilari, son - bas + 1)
+        if i > bas: self.seri_sayilari[i - bas] += 1
+        if son > i: self.seri_sayilari[son - i] += 1
+        _azalt(self.haftalik, hafta_basi(s))
+
+    # --- Okuma ---
+    def en_uzun_seri(self):
+        return max(self.seri_sayilari, default=0)
+
+    def aralik_dagilimi(self, siralar, bugun):
+        """analiz.aralik_dagilimi ile aynı sonuç (son kayıttan bugüne kadarki ara dahil), geçmiş taranmadan."""
+        sayilar = Counter(self.aralik_sayilari)
+        if len(siralar) and bugun > siralar[-1]: sayilar[bugun - siralar[-1]] += 1
+        gunler = sorted(g for g in sayilar if g > 0)
+        return np.array(gunler, dtype=np.int64), np.array([sayilar[g] for g in gunler], dtype=np.int64)
+
+    def ozet(self, siralar, bugun):
+        """Karşılama ekranı için anlık özet; her değer ikili arama veya sayaç okumasıdır."""
+        n = len(siralar)
+        if n == 0: return {"kayit": 0}
+        k = bisect_right(siralar, bugun) # İleri tarihli kayıtlar "son kayıt" ve mevcut seri için sayılmaz
+        son = siralar[k - 1] if k else None
+        mevcut = k - seri_basi(siralar, k - 1) if k and bugun - son <= 1 else 0 # Dün de kayıt yoksa seri bozulmuş sayılır
+        return {
+            "kayit": n,
+            "son_kayittan_beri_gun": bugun - son if k else None,
+            "mevcut_seri": mevcut,
+            "en_uzun_seri": self.en_uzun_seri(),
+            "en_sik_aralik": max(self.aralik_sayilari, key=self.aralik_sayilari.__getitem__, default=None),
+            "ortalama_aralik": round((siralar[-1] - siralar[0]) / (n - 1), 2) if n > 1 else None,
+            "bu_hafta": self.haftalik.get(hafta_basi(bugun), 0),
+            "son_30_gun": pencere_sayisi(siralar, bugun, 30),
+            "haftalik_ortalama_90": round(pencere_sayisi(siralar, bugun, 90) * 7 / 90, 2),
+        }
+
+
+def pencere_sayisi(siralar, bugun, gun):
+    """Son `gun` gün içindeki (bugün dahil) kayıt sayısı; iki ikili arama."""
+    return bisect_right(siralar, bugun) - bisect_right(siralar, bugun - gun)
+
+
+def istatistikler(indeks):
+    """İndeksin istatistiklerini döner; ilk istekte kurulur, sonra indeksle birlikte güncel tutulur."""
+    if indeks.istatistik is None: indeks.istatistik = SeriIstatistikleri.siralardan(indeks.siralar)
+    return indeks.istatistik
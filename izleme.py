@@ -0,0 +1,185 @@
+"""
+İsteğe bağlı performans izleme. Varsayılan olarak kapalıdır; kapalıyken her çağrı tek bir bayrak kontrolüdür.
+
+    ETKINLIK_IZLEME=1       eylem süreleri, p50/p95, Chrome iz dosyası
+    ETKINLIK_IZLEME=profil  + her eylem için cProfile dökümü (yalnızca ana thread)
+
+Eylem: kullanıcının başlattığı bir iş (buton, etkinlik değiştirme, json_kaydet...). Eylem, işçiye verilen görevler ve
+ertelenmiş çizim bitene kadar açık kalır; toplam süre o zaman ölçülür. Eylem içindeki süreler evrelere ayrılır:
+yukle / hesapla / ciz / kaydet. İz dosyası chrome://tracing veya Perfetto ile açılır.
+"""
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+IZ_KLASORU = os.environ.get("ETKINLIK_IZLEME_KLASORU", "Izleme")
+PENCERE = 200 # p50/p95 için eylem başına saklanan son ölçüm sayısı
+EN_FAZLA_OLAY = 200_000 # İz tamponu; dolunca en eskiler düşer
+
+_mevcut = contextvars.ContextVar("izleme_eylemi", default=None)
+
+
+def _yuzdelik(sirali, oran):
+    return sirali[min(len(sirali) - 1, int(round(oran * (len(sirali) - 1))))]
+
+
+class Eylem:
+    __slots__ = ("ad", "baslangic", "bekleyen", "evreler", "profil")
+
+    def __init__(self, ad):
+        self.ad = ad
+        self.baslangic = time.perf_counter_ns()
+        self.bekleyen = 1 # Eylemi açık tutanlar: kendi gövdesi + bekleyen görevler/çizimler
+        self.evreler = Counter() # evre adı -> ms
+        self.profil = None
+
+
+class Izleyici:
+    def __init__(self, mod=""):
+        self.acik = False
+        self.profil = False
+        self.bildir = None # Eylem bitince ana thread'de çağrılır: bildir(metin)
+        self._kilit = threading.Lock()
+        self._olaylar = deque(maxlen=EN_FAZLA_OLAY)
+        self._sureler = {} # eylem adı -> deque(ms)
+        self._sayac = Counter()
+        self._sifir = time.perf_counter_ns()
+        self._atexit = False
+        self.ayarla(mod)
+
+    def ayarla(self, mod):
+        """mod: "" (kapalı), "1" (açık) veya "profil"."""
+        self.acik = mod in ("1", "profil")
+        self.profil = mod == "profil"
+        if self.acik and not self._atexit: atexit.register(self.iz_kaydet); self._atexit = True
+
+    # --- Kayıt ---
+    def _olay(self, ad, kategori, bas_ns, bit_ns, **ek):
+        self._olaylar.append({"name": ad, "cat": kategori, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+                              "ts": (bas_ns - self._sifir) / 1000, "dur": (bit_ns - bas_ns) / 1000, "args": ek})
+
+    @contextmanager
+    def _eylem(self, ad):
+        ust = _mevcut.get()
+        if ust is not None:
+            # İç içe eylem (ör. tarih_ekle içinde json_kaydet): ayrı eylem sayılmaz, üstün içinde bir aralık olur
+            bas = time.perf_counter_ns()
+            try: yield
+            finally: self._olay(ad, "alt", bas, time.perf_counter_ns())
+            return
+        eylem = Eylem(ad)
+        if self.profil and threading.current_thread() is threading.main_thread():
+            import cProfile
+            eylem.profil = cProfile.Profile()
+            try: eylem.profil.enable()
+            except ValueError: eylem.profil = None # Başka bir eylemin profili hâlâ açık
+        belirtec = _mevcut.set(eylem)
+        try: yield
+        finally:
+            _mevcut.reset(belirtec)
+            self.birak(eylem)
+
+    def eylem(self, ad):
+        return self._eylem(ad) if self.acik else nullcontext()
+
+    @contextmanager
+    def _evre(self, ad):
+        bas = time.perf_counter_ns()
+        try: yield
+        finally:
+            bit = time.perf_counter_ns()
+            eylem = _mevcut.get()
+            if eylem is not None:
+                with self._kilit: eylem.evreler[ad] += (bit - bas) / 1e6
+            self._olay(ad, "evre", bas, bit, eylem=eylem.ad if eylem else None)
+
+    def evre(self, ad):
+        return self._evre(ad) if self.acik else nullcontext()
+
+    def evrede(self, ad, fonk):
+        """fonk'u çağrıldığı yerde (ör. işçi thread'inde) verilen evre olarak ölçen sarmalayıcı."""
+        if not self.acik: return fonk
+        def sarili(*args, **kwargs):
+            with self._evre(ad): return fonk(*args, **kwargs)
+        return sarili
+
+    # --- Eylemi ertelenmiş işler boyunca açık tutma ---
+    def tut(self):
+        """Mevcut eylemi, dönen belirteç birak'a verilene kadar açık tutar. Eylem yoksa None."""
+        eylem = _mevcut.get() if self.acik else None
+        if eylem is not None:
+            with self._kilit: eylem.bekleyen += 1
+        return eylem
+
+    def birak(self, eylem):
+        if eylem is None: return
+        with self._kilit:
+            eylem.bekleyen -= 1
+            bitti = eylem.bekleyen == 0
+        if bitti: self._bitir(eylem)
+
+    @contextmanager
+    def devam(self, eylem):
+        """Ertelenmiş bir geri çağrıyı tut() ile alınmış eylemin içinde çalıştırır ve eylemi bırakır."""
+        if eylem is None: yield; return
+        belirtec = _mevcut.set(eylem)
+        try: yield
+        finally:
+            _mevcut.reset(belirtec)
+            self.birak(eylem)
+
+    def _bitir(self, eylem):
+        bit = time.perf_counter_ns()
+        toplam = (bit - eylem.baslangic) / 1e6
+        self._olay(eylem.ad, "eylem", eylem.baslangic, bit, **{k: round(v, 3) for k, v in eylem.evreler.items()})
+        with self._kilit:
+            sureler = self._sureler.setdefault(eylem.ad, deque(maxlen=PENCERE))
+            sureler.append(toplam)
+            self._sayac[eylem.ad] += 1
+            n = self._sayac[eylem.ad]
+        if eylem.profil is not None:
+            eylem.profil.disable()
+            os.makedirs(IZ_KLASORU, exist_ok=True)
+            eylem.profil.dump_stats(os.path.join(IZ_KLASORU, f"{eylem.ad}_{os.getpid()}_{n}.prof"))
+        if self.bildir:
+            _, p50, p95 = self.istatistik(eylem.ad)
+            evreler = " · ".join(f"{k} {v:.0f}" for k, v in eylem.evreler.items())
+            self.bildir(f"⏱ {eylem.ad}: {toplam:.0f} ms" + (f" ({evreler})" if evreler else "") + f"\np50 {p50:.0f} / p95 {p95:.0f} ms (n={n})")
+
+    # --- Raporlama ---
+    def istatistik(self, ad):
+        """(n, p50, p95) — son PENCERE ölçüm üzerinden, ms."""
+        with self._kilit: sirali = sorted(self._sureler.get(ad, ()))
+        if not sirali: return 0, 0.0, 0.0
+        return len(sirali), _yuzdelik(sirali, 0.5), _yuzdelik(sirali, 0.95)
+
+    def ozet(self):
+        with self._kilit: adlar = sorted(self._sureler)
+        return {ad: self.istatistik(ad) for ad in adlar}
+
+    def iz_kaydet(self, yol=None):
+        """Chrome trace-event JSON yazar; yolu döner. Kayıt yoksa None."""
+        if not self._olaylar: return None
+        yol = yol or os.path.join(IZ_KLASORU, f"iz_{os.getpid()}.json")
+        os.makedirs(os.path.dirname(yol) or ".", exist_ok=True)
+        with open(yol, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": list(self._olaylar), "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        return yol
+
+
+izleyici = Izleyici(os.environ.get("ETKINLIK_IZLEME", ""))
+
+
+def izle(fonk):
+    """Metodu, adıyla bir eylem olarak ölçer (izleme kapalıyken doğrudan çağırır)."""
+    @wraps(fonk)
+    def sarili(*args, **kwargs):
+        if not izleyici.acik: return fonk(*args, **kwargs)
+        with izleyici.eylem(fonk.__name__): return fonk(*args, **kwargs)
+    return sarili
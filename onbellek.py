@@ -0,0 +1,48 @@
+from collections import OrderedDict, Counter
+
+
+class AnalizOnbellegi:
+    """
+    Grafiklerin türetilmiş verileri için (etkinlik, anahtar, veri sürümü) anahtarlı, sınırlı LRU önbellek.
+    Bir etkinliğin verisi değişince sürümü artırılır ve yalnızca o etkinliğin kayıtları düşürülür.
+    Tüm veri değişince (temizle) dönem artırılır: surum() o ana kadar verilmiş her sürümü, henüz hiç
+    sorulmamış etkinliklerinkini de eskitir.
+    """
+
+    def __init__(self, kapasite=32):
+        self.kapasite = kapasite
+        self.surumler = Counter()
+        self.donem = 0
+        self._kayitlar = OrderedDict()
+
+    def surum(self, etkinlik):
+        """Etkinliğin verisinin güncel sürümü; hesaplama başlarken alınır, koy'a verilir."""
+        return self.donem, self.surumler[etkinlik]
+
+    def getir(self, etkinlik, anahtar, hesapla):
+        bulundu, deger = self.bul(etkinlik, anahtar)
+        if bulundu: return deger
+        deger = hesapla()
+        self.koy(etkinlik, self.surum(etkinlik), anahtar, deger)
+        return deger
+
+    def bul(self, etkinlik, anahtar):
+        """(bulundu_mu, değer) döner; hesaplamayı arka plana vermek isteyenler için getir'in yarısı."""
+        tam = (etkinlik, self.surum(etkinlik)) + anahtar
+        if tam not in self._kayitlar: return False, None
+        self._kayitlar.move_to_end(tam)
+        return True, self._kayitlar[tam]
+
+    def koy(self, etkinlik, surum, anahtar, deger):
+        # Hesaplama sürerken veri değiştiyse (sürüm ilerlediyse) bayat sonuç saklanmaz
+        if surum != self.surum(etkinlik): return
+        self._kayitlar[(etkinlik, surum) + anahtar] = deger
+        while len(self._kayitlar) > self.kapasite: self._kayitlar.popitem(last=False)
+
+    def gecersiz_kil(self, etkinlik):
+        self.surumler[etkinlik] += 1
+        for tam in [k for k in self._kayitlar if k[0] == etkinlik]: del self._kayitlar[tam]
+
+    def temizle(self):
+        self.donem += 1
+        self._kayitlar.clear()
@@ -0,0 +1,85 @@
+"""
+Toplu rapor: veri klasöründeki her kullanıcı (<kullanici>.json + günlükleri) ve her etkinlik için özet üretir.
+Arayüz gerektirmez; sunucuda gece raporları için:
+
+    python rapor.py --veri-klasoru Data --bicim jsonl > rapor.jsonl
+    python rapor.py --bicim csv --cikti rapor.csv --isci 8
+
+Kullanıcılar süreç havuzunda paralel işlenir; sonuçlar geldikçe (kullanıcı sırasıyla) yazılır, hepsi bellekte biriktirilmez.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import partial
+
+from analiz import siralar_dizisi, etkinlik_ozeti
+from depolama import GunlukDepo, kullanici_verisi_mi
+from tarih_deposu import EtkinlikIndeksi
+
+CSV_ALANLARI = ["kullanici", "etkinlik", "kayit", "ilk", "son", "son_kayittan_beri_gun", "ortalama_aralik", "medyan_aralik",
+                "en_sik_aralik", "en_uzun_ara", "haftalik_ortalama", "en_yogun_hafta", "haftanin_gunleri", "yillik", "aylik"]
+
+
+def kullanici_dosyalari(veri_klasoru):
+    return sorted(glob.glob(os.path.join(veri_klasoru, "*.json")))
+
+
+def kullanici_raporu(json_yolu, bugun):
+    """Bir kullanıcının tüm etkinlik özetleri. Süreç havuzunda çalışır; dosyalara yazmaz."""
+    kullanici = os.path.splitext(os.path.basename(json_yolu))[0]
+    satirlar = []
+    veriler = GunlukDepo(json_yolu).oku()
+    if not kullanici_verisi_mi(veriler): return satirlar # Veri klasöründeki kullanıcı verisi olmayan JSON'lar
+    for etkinlik, tarihler in veriler.items():
+        ozet = etkinlik_ozeti(siralar_dizisi(EtkinlikIndeksi.metinlerden(tarihler)), bugun)
+        satirlar.append({"kullanici": kullanici, "etkinlik": etkinlik, **ozet})
+    return satirlar
+
+
+def raporla(veri_klasoru, bugun=None, isci=None):
+    """Özet satırlarını üretir. isci=1 ise havuz kurulmaz (hata ayıklama, küçük klasörler)."""
+    bugun = (bugun or date.today()).toordinal()
+    yollar = kullanici_dosyalari(veri_klasoru)
+    is_fonk = partial(kullanici_raporu, bugun=bugun)
+    if isci == 1 or len(yollar) <= 1:
+        for yol in yollar: yield from is_fonk(yol)
+        return
+    isci = isci or os.cpu_count() or 1
+    # Küçük kullanıcı dosyalarında süreçler arası gidiş-dönüş baskın olmasın diye işler gruplanır
+    parca = max(1, len(yollar) // (isci * 8))
+    with ProcessPoolExecutor(max_workers=isci) as havuz:
+        for satirlar in havuz.map(is_fonk, yollar, chunksize=parca): yield from satirlar
+
+
+def _csv_degeri(deger):
+    return json.dumps(deger, ensure_ascii=False, separators=(",", ":")) if isinstance(deger, (dict, list)) else deger
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Tüm kullanıcılar ve etkinlikler için toplu özet raporu.")
+    ap.add_argument("--veri-klasoru", default="Data")
+    ap.add_argument("--bicim", choices=("jsonl", "csv"), default="jsonl")
+    ap.add_argument("--cikti", default="-", help="Çıktı dosyası (varsayılan: standart çıktı)")
+    ap.add_argument("--isci", type=int, default=None, help="Süreç sayısı (varsayılan: işlemci sayısı)")
+    ap.add_argument("--bugun", type=date.fromisoformat, default=None, help="YYYY-MM-DD; tekrarlanabilir raporlar için")
+    args = ap.parse_args()
+
+    cikti = sys.stdout if args.cikti == "-" else open(args.cikti, "w", encoding="utf-8", newline="")
+    try:
+        if args.bicim == "csv":
+            yazici = csv.DictWriter(cikti, fieldnames=CSV_ALANLARI, extrasaction="ignore")
+            yazici.writeheader()
+        for satir in raporla(args.veri_klasoru, args.bugun, args.isci):
+            if args.bicim == "csv": yazici.writerow({k: _csv_degeri(v) for k, v in satir.items()})
+            else: cikti.write(json.dumps(satir, ensure_ascii=False) + "\n")
+    finally:
+        if cikti is not sys.stdout: cikti.close()
+
+
+if __name__ == "__main__":
+    main()
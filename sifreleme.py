@@ -0,0 +1,94 @@
+"""
+Parola özetleri. Kayıt biçimi kendini tanımlar:
+
+    pbkdf2_sha256$<iterasyon>$<tuz hex>$<özet hex>
+
+Eski "tuz:özet" kayıtları 100.000 iterasyonlu pbkdf2_sha256 sayılır ve başarılı girişte yeni biçime yükseltilir.
+İterasyon sayısı ETKINLIK_PBKDF2_ITERASYON ortam değişkeniyle kuruluma göre ayarlanır; uygun değeri bulmak için:
+
+    python sifreleme.py --hedef-ms 250
+"""
+import argparse
+import hashlib
+import hmac
+import os
+import time
+
+ALGORITMA = "pbkdf2_sha256"
+ESKI_ITERASYON = 100000 # "tuz:özet" biçimindeki kayıtların maliyeti
+EN_AZ_ITERASYON = 100000
+VARSAYILAN_ITERASYON = int(os.environ.get("ETKINLIK_PBKDF2_ITERASYON", ESKI_ITERASYON)) # Yükseltmek kuruluma bırakılır (--hedef-ms)
+TUZ_UZUNLUGU = 16
+
+
+def _pbkdf2(sifre, tuz, iterasyon):
+    return hashlib.pbkdf2_hmac("sha256", sifre.encode("utf-8"), tuz, iterasyon)
+
+
+def sifre_ozeti(sifre, iterasyon=None):
+    iterasyon = iterasyon or VARSAYILAN_ITERASYON
+    tuz = os.urandom(TUZ_UZUNLUGU)
+    return f"{ALGORITMA}${iterasyon}${tuz.hex()}${_pbkdf2(sifre, tuz, iterasyon).hex()}"
+
+
+def ozeti_coz(kayit):
+    """(algoritma, iterasyon, tuz, özet) döner; tanınmayan kayıtta ValueError."""
+    if "$" in kayit:
+        algoritma, iterasyon, tuz_hex, ozet_hex = kayit.split("$")
+        if algoritma != ALGORITMA: raise ValueError(f"Bilinmeyen algoritma: {algoritma}")
+        return algoritma, int(iterasyon), bytes.fromhex(tuz_hex), bytes.fromhex(ozet_hex)
+    tuz_hex, ozet_hex = kayit.split(":")
+    return ALGORITMA, ESKI_ITERASYON, bytes.fromhex(tuz_hex), bytes.fromhex(ozet_hex)
+
+
+def dogrula(sifre, kayit):
+    try: _, iterasyon, tuz, ozet = ozeti_coz(kayit)
+    except ValueError: return False
+    return hmac.compare_digest(_pbkdf2(sifre, tuz, iterasyon), ozet)
+
+
+def sure_esitle(sifre, kayit=None, iterasyon=None):
+    """
+    Reddedilen bir denemenin toplam maliyetini güncel ayara tamamlar: olmayan hesap, eski (ucuz) kayıt ve
+    güncel kayıt aynı sürede reddedilir, yanıt süresinden hangi hesapların var olduğu anlaşılmaz.
+    """
+    try: harcanan = ozeti_coz(kayit)[1] if kayit else 0
+    except ValueError: harcanan = 0 # dogrula tanınmayan kayıtta özet hesaplamaz
+    kalan = (iterasyon or VARSAYILAN_ITERASYON) - harcanan
+    if kalan > 0: _pbkdf2(sifre, bytes(TUZ_UZUNLUGU), kalan)
+
+
+def yukseltilmeli_mi(kayit, iterasyon=None):
+    """Kayıt eski biçimdeyse veya maliyeti güncel ayardan düşükse True."""
+    try: _, kayit_iterasyonu, _, _ = ozeti_coz(kayit)
+    except ValueError: return False
+    return "$" not in kayit or kayit_iterasyonu < (iterasyon or VARSAYILAN_ITERASYON)
+
+
+def kalibre_et(hedef_ms=250, deneme=3):
+    """
+    Bu makinede tek özetin yaklaşık hedef_ms sürmesi için iterasyon sayısı.
+    Kısa bir ölçümden kaba tahmin yapılır, tahmin edilen sayıda yeniden ölçülüp düzeltilir (her adımda en iyi deneme).
+    10.000'e yuvarlanır, EN_AZ_ITERASYON'un altına inmez.
+    """
+    tuz = os.urandom(TUZ_UZUNLUGU)
+    def sure(iterasyon):
+        en_iyi = float("inf")
+        for _ in range(deneme):
+            bas = time.perf_counter(); _pbkdf2("kalibrasyon", tuz, iterasyon)
+            en_iyi = min(en_iyi, time.perf_counter() - bas)
+        return en_iyi
+    iterasyon = 20000
+    for _ in range(2):
+        iterasyon = max(1000, int(iterasyon * (hedef_ms / 1000) / sure(iterasyon)))
+    return max(EN_AZ_ITERASYON, round(iterasyon, -4))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Hedef giriş gecikmesi için PBKDF2 iterasyon sayısını ölçer.")
+    ap.add_argument("--hedef-ms", type=float, default=250)
+    args = ap.parse_args()
+    iterasyon = kalibre_et(args.hedef_ms)
+    bas = time.perf_counter(); sifre_ozeti("kalibrasyon", iterasyon); gecen = (time.perf_counter() - bas) * 1000
+    print(f"Önerilen iterasyon: {iterasyon} (ölçülen: {gecen:.0f} ms)")
+    print(f"Kullanım: ETKINLIK_PBKDF2_ITERASYON={iterasyon}")
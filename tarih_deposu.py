@@ -0,0 +1,206 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from datetime import date
+
+# matplotlib tarih sayıları 1970-01-01'den itibaren gün cinsindendir
+MPL_EPOCH_SIRASI = date(1970, 1, 1).toordinal()
+
+_AY_BASLARI = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_AY_GUNLERI = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_yil_basi_onbellek = {}
+
+
+def _yil_basi(yil):
+    s = _yil_basi_onbellek.get(yil)
+    if s is None:
+        s = _yil_basi_onbellek[yil] = date(yil, 1, 1).toordinal()
+    return s
+
+
+def _artik_mi(yil):
+    return yil % 4 == 0 and (yil % 100 != 0 or yil % 400 == 0)
+
+
+def _ay_basi(yil, ay):
+    # ay: 1..13 (13 = sonraki yılın başı)
+    if ay == 13: return _yil_basi(yil + 1)
+    return _yil_basi(yil) + _AY_BASLARI[ay - 1] + (ay > 2 and _artik_mi(yil))
+
+
+def gun_sirasi(t_str):
+    """
+    "dd.mm.YYYY" metnini gün sırasına (date.toordinal) çevirir.
+    strptime kullanmaz; sabit biçim dilimlenip doğrudan hesaplanır. Geçersiz metinde ValueError.
+    """
+    if len(t_str) != 10 or t_str[2] != "." or t_str[5] != ".": raise ValueError(t_str)
+    g, a, y = int(t_str[0:2]), int(t_str[3:5]), int(t_str[6:10])
+    if not 1 <= a <= 12 or y < 1: raise ValueError(t_str)
+    if not 1 <= g <= _AY_GUNLERI[a - 1] + (a == 2 and _artik_mi(y)): raise ValueError(t_str)
+    return _ay_basi(y, a) + g - 1
+
+
+def sira_metni(sira):
+    return date.fromordinal(sira).strftime("%d.%m.%Y")
+
+
+def hafta_basi(sira):
+    # 1. gün (01.01.0001) Pazartesi olduğundan haftanın günü (sira + 6) % 7
+    return sira - (sira + 6) % 7
+
+
+class TarihDeposu:
+    """
+    Bir etkinliğin tarihlerini sıralı gün sıraları olarak array('i') içinde tutar.
+    Kayıt başına 4 bayt; datetime listesine göre ~10 kat daha az bellek.
+    """
+    __slots__ = ("siralar",)
+
+    def __init__(self, siralar=()):
+        self.siralar = array("i", siralar)
+
+    @classmethod
+    def metinlerden(cls, metinler):
+        siralar = []
+        for t_str in metinler:
+            try: siralar.append(gun_sirasi(t_str))
+            except ValueError: continue
+        siralar.sort()
+        return cls(siralar)
+
+    def __len__(self):
+        return len(self.siralar)
+
+    def __bool__(self):
+        return len(self.siralar) > 0
+
+    def __iter__(self):
+        return iter(self.siralar)
+
+    def ilk(self):
+        return date.fromordinal(self.siralar[0])
+
+    def son(self):
+        return date.fromordinal(self.siralar[-1])
+
+    def tarih(self, i):
+        return date.fromordinal(self.siralar[i])
+
+    def mpl_gunleri(self):
+        """matplotlib'in tarih ekseninde doğrudan kullanılabilecek gün sayıları."""
+        return [s - MPL_EPOCH_SIRASI for s in self.siralar]
+
+    def yil_araligi(self, yil):
+        return (bisect_left(self.siralar, _yil_basi(yil)), bisect_left(self.siralar, _yil_basi(yil + 1)))
+
+    def aralik(self, ilk, son):
+        """[ilk, son) gün sıraları arasındaki kayıtların kopyasız görünümü (bkz. TarihGorunumu)."""
+        return TarihGorunumu(self, ilk, son)
+
+    def yil(self, yil):
+        return self.aralik(_yil_basi(yil), _yil_basi(yil + 1))
+
+    def ay(self, yil, ay):
+        return self.aralik(_ay_basi(yil, ay), _ay_basi(yil, ay + 1))
+
+    def son_gunler(self, gun, bugun):
+        """Bugün dahil son `gun` gün."""
+        return self.aralik(bugun - gun + 1, bugun + 1)
+
+    def yillar(self):
+        """Kayıt bulunan yıllar (artan). Her yıl için bir ikili arama; tam tarama yok."""
+        sonuc = []
+        i, n = 0, len(self.siralar)
+        while i < n:
+            y = date.fromordinal(self.siralar[i]).year
+            sonuc.append(y)
+            i = bisect_left(self.siralar, _yil_basi(y + 1), i)
+        return sonuc
+
+    def aylik_sayilar(self, yil):
+        sinirlar = [bisect_left(self.siralar, _ay_basi(yil, a)) for a in range(1, 14)]
+        return [sinirlar[a + 1] - sinirlar[a] for a in range(12)]
+
+
+class TarihGorunumu(TarihDeposu):
+    """
+    Kaynak deponun [ilk, son) gün aralığına düşen kayıtları; kopya tutmaz. Sınırlar her erişimde iki ikili aramayla
+    bulunur, bu yüzden kaynağa sonradan eklenen/silinen kayıtlar görünüme de yansır (önbellekte bayatlamaz).
+    siralar kaynak dizinin memoryview dilimidir: array, dışa açık tamponu varken büyüyüp küçülemeyeceğinden
+    bu dilim (ve üzerinden alınan NumPy görünümleri) kaynağa ekleme/silme yapılmadan önce bırakılmalıdır.
+    """
+    __slots__ = ("kaynak", "ilk_sira", "son_sira")
+
+    def __init__(self, kaynak, ilk, son):
+        if isinstance(kaynak, TarihGorunumu): # İç içe görünüm: aralıklar kesiştirilir, zincir uzamaz
+            ilk, son = max(ilk, kaynak.ilk_sira), min(son, kaynak.son_sira); kaynak = kaynak.kaynak
+        self.kaynak = kaynak
+        self.ilk_sira = ilk
+        self.son_sira = max(ilk, son)
+
+    def sinirlar(self):
+        s = self.kaynak.siralar
+        lo = bisect_left(s, self.ilk_sira)
+        return lo, bisect_left(s, self.son_sira, lo)
+
+    @property
+    def siralar(self):
+        lo, hi = self.sinirlar()
+        return memoryview(self.kaynak.siralar)[lo:hi]
+
+    def __len__(self):
+        lo, hi = self.sinirlar()
+        return hi - lo
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+class EtkinlikIndeksi(TarihDeposu):
+    """
+    Değiştirilebilir etkinlik indeksi: sıralı dizi + hash kümesi + yıl başına kayıt sayısı.
+    Tekrar kontrolü O(1), ekleme/silme yeri ikili aramayla O(log n) bulunur.
+    ekle/sil, yıl listesi değiştiyse (yeni yıl geldi / son kaydı silinen yıl gitti) True döner.
+    istatistik: kurulmuşsa (bkz. istatistik.istatistikler) her ekle/sil'de artımlı güncellenir.
+    """
+    __slots__ = ("kume", "yil_sayilari", "istatistik")
+
+    def __init__(self, siralar=()):
+        super().__init__(siralar)
+        self.kume = set(self.siralar)
+        if len(self.kume) != len(self.siralar): self.siralar = array("i", sorted(self.kume))
+        self.yil_sayilari = Counter()
+        for y in super().yillar():
+            lo, hi = self.yil_araligi(y)
+            self.yil_sayilari[y] = hi - lo
+        self.istatistik = None
+
+    def __contains__(self, sira):
+        return sira in self.kume
+
+    def ekle(self, sira):
+        i = bisect_left(self.siralar, sira)
+        self.siralar.insert(i, sira)
+        self.kume.add(sira)
+        if self.istatistik is not None: self.istatistik.eklendi(self.siralar, i)
+        y = date.fromordinal(sira).year
+        self.yil_sayilari[y] += 1
+        return self.yil_sayilari[y] == 1
+
+    def sil(self, sira):
+        i = bisect_left(self.siralar, sira)
+        if self.istatistik is not None: self.istatistik.siliniyor(self.siralar, i)
+        del self.siralar[i]
+        self.kume.discard(sira)
+        y = date.fromordinal(sira).year
+        self.yil_sayilari[y] -= 1
+        if self.yil_sayilari[y] == 0:
+            del self.yil_sayilari[y]
+            return True
+        return False
+
+    def yillar(self):
+        return sorted(self.yil_sayilari)
+
+    def metinler(self):
+        return [sira_metni(s) for s in self.siralar]
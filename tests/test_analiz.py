@@ -0,0 +1,22 @@
+from datetime import date
+
+from analiz import siralar_dizisi, zaman_cizelgesi_verisi
+from tarih_deposu import EtkinlikIndeksi
+
+BUGUN = date(2026, 10, 17).toordinal()
+
+
+def test_zaman_cizelgesi_yalnizca_ileri_tarihli_kayit():
+    ind = EtkinlikIndeksi.metinlerden(["05.03.2027", "06.03.2027"])
+    veri = zaman_cizelgesi_verisi(siralar_dizisi(ind), ind.siralar[0], BUGUN) # "Tümü": ilk kayıttan bugüne
+    assert veri["son_gun"] >= veri["ilk_gun"]
+    assert len(veri["x"]) == 2
+    assert len(veri["hafta_x"]) == len(veri["kategori"]) >= 1
+
+
+def test_zaman_cizelgesi_gelecek_yil():
+    ind = EtkinlikIndeksi.metinlerden(["01.06.2025", "05.03.2027"])
+    ilk_gun, son_gun = date(2027, 1, 1).toordinal(), min(date(2027, 12, 31).toordinal(), BUGUN)
+    veri = zaman_cizelgesi_verisi(siralar_dizisi(ind.yil(2027)), ilk_gun, son_gun)
+    assert veri["son_gun"] == ilk_gun + 6
+    assert veri["kategori"].sum() == 0
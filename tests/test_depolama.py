@@ -0,0 +1,127 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+import guncelleme
+from depolama import (DEPO_SQLITE, ISLEM_EKLE, ISLEM_ETKINLIK_ADLANDIR, ISLEM_ETKINLIK_EKLE, ISLEM_ETKINLIK_SIL, ISLEM_SIL,
+                      GunlukDepo, SqliteDepo, kullanici_deposu_ac)
+
+
+def test_ilk_goc_guncelleme_onbellegini_kullanici_saymaz(tmp_path):
+    veri = tmp_path / "Data"
+    veri.mkdir()
+    (veri / "guncelleme.json").write_text(json.dumps(
+        {"url": "https://api.github.com/repos/a/b/releases/latest", "etag": "W/\"1\"", "etiket": "v1.0", "sayfa": "https://x", "zaman": 1.0}))
+    GunlukDepo(str(veri / "ali.json")).hepsini_yaz({"Koşu": ["01.02.2024", "03.02.2024"]})
+    users = tmp_path / "users.json"
+    users.write_text(json.dumps({"ali": "00:11"}))
+    db = str(veri / "eventtracker.db")
+
+    depo = kullanici_deposu_ac(DEPO_SQLITE, str(veri), str(users), db)
+    assert depo.getir("ali") == "00:11"
+    depo.kapat()
+
+    with sqlite3.connect(db) as baglanti:
+        kullanicilar = {k for (k,) in baglanti.execute("SELECT DISTINCT kullanici FROM etkinlikler")}
+    assert kullanicilar == {"ali"}
+    assert SqliteDepo(db, "guncelleme").yukle() == {}
+    assert SqliteDepo(db, "ali").yukle() == {"Koşu": ["01.02.2024", "03.02.2024"]}
+    # Göç kaynak dosyalara dokunmaz: eski users.json taşınmaz, parçalı kayıt klasörü oluşturulmaz
+    assert users.exists() and not (veri / "kullanicilar").exists()
+
+
+def test_sqlite_indeksli_sorgular(tmp_path):
+    depo = SqliteDepo(str(tmp_path / "t.db"), "ali")
+    depo.hepsini_yaz({"Spor": ["01.02.2024", "15.02.2024", "03.05.2024", "31.12.2023"], "Okuma": ["01.02.2024"]})
+    assert depo.tarih_var_mi("Spor", "15.02.2024") and not depo.tarih_var_mi("Okuma", "15.02.2024")
+    assert depo.yillar("Spor") == [2024, 2023]
+    assert depo.yil_tarihleri("Spor", 2024) == ["01.02.2024", "15.02.2024", "03.05.2024"]
+    assert depo.aylik_sayilar("Spor", 2024) == [0, 2, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]
+    depo.kapat()
+
+
+def test_guncelleme_onbellegi_veri_klasorunde_degil():
+    assert os.path.basename(os.path.dirname(guncelleme.VARSAYILAN_ONBELLEK)) != "Data"
+
+
+def _gunluklu_depo(klasor):
+    # Anlık görüntü {A, B} + tekrar oynatılınca sonucu değiştiren silme/adlandırma günlüğü
+    depo = GunlukDepo(str(klasor / "ali.json"))
+    depo.hepsini_yaz({"A": ["01.01.2024"], "B": ["05.05.2024"]})
+    depo.uygula([(ISLEM_ETKINLIK_SIL, "A"), (ISLEM_ETKINLIK_ADLANDIR, "B", "A")])
+    return depo
+
+
+@pytest.mark.parametrize("adim", ["eski_silinmeden", "yeni_yerine_konmadan"])
+def test_sikistirma_yarida_kalirsa_gunluk_iki_kez_oynatilmaz(tmp_path, monkeypatch, adim):
+    depo = _gunluklu_depo(tmp_path)
+    beklenen = {"A": ["05.05.2024"]}
+    gercek_remove, gercek_replace = os.remove, os.replace
+
+    def cok(*a): raise RuntimeError("çökme")
+    if adim == "eski_silinmeden":
+        monkeypatch.setattr(os, "remove", lambda yol: cok() if yol == depo.eski_gunluk_yolu else gercek_remove(yol))
+    else:
+        monkeypatch.setattr(os, "replace", lambda a, b: cok() if a == depo.yeni_json_yolu else gercek_replace(a, b))
+    with pytest.raises(RuntimeError): depo.sikistir(arka_planda=False)
+    monkeypatch.undo()
+
+    assert GunlukDepo(depo.json_yolu).oku() == beklenen
+    yeniden = GunlukDepo(depo.json_yolu)
+    assert yeniden.yukle() == beklenen
+    yeniden.bekle()
+    assert GunlukDepo(depo.json_yolu).oku() == beklenen
+    assert not os.path.exists(depo.eski_gunluk_yolu) and not os.path.exists(depo.yeni_json_yolu)
+
+
+def test_gunluk_ekleme_ve_yeniden_oynatma(tmp_path):
+    depo = GunlukDepo(str(tmp_path / "ali.json"))
+    assert depo.yukle() == {}
+    depo.uygula([(ISLEM_ETKINLIK_EKLE, "Spor"), (ISLEM_EKLE, "Spor", "01.02.2024")])
+    depo.uygula([(ISLEM_EKLE, "Spor", "02.02.2024"), (ISLEM_SIL, "Spor", "01.02.2024")])
+    assert not os.path.exists(depo.json_yolu) # Yalnızca günlüğe yazıldı
+    assert GunlukDepo(depo.json_yolu).oku() == {"Spor": ["02.02.2024"]}
+
+
+def test_gunlugun_yarim_son_satiri_atlanir(tmp_path):
+    depo = GunlukDepo(str(tmp_path / "ali.json"))
+    depo.uygula([(ISLEM_EKLE, "Spor", "01.02.2024")])
+    with open(depo.gunluk_yolu, "a", encoding="utf-8") as f: f.write('["ekle", "Spor", "02.0') # Çökme anında yarım satır
+    assert GunlukDepo(depo.json_yolu).oku() == {"Spor": ["01.02.2024"]}
+
+
+def test_esik_asilinca_sikistirilir(tmp_path):
+    depo = GunlukDepo(str(tmp_path / "ali.json"))
+    depo.SIKISTIRMA_ESIGI = 3
+    depo.uygula([(ISLEM_EKLE, "Spor", f"0{g}.02.2024") for g in range(1, 4)])
+    depo.bekle()
+    assert not os.path.exists(depo.gunluk_yolu) and not os.path.exists(depo.eski_gunluk_yolu)
+    with open(depo.json_yolu, encoding="utf-8") as f: assert json.load(f) == {"Spor": ["01.02.2024", "02.02.2024", "03.02.2024"]}
+    depo.uygula([(ISLEM_EKLE, "Spor", "04.02.2024")])
+    assert GunlukDepo(depo.json_yolu).oku()["Spor"][-1] == "04.02.2024"
+
+
+def test_dondurulmus_ama_katlanmamis_gunluk_acilista_katlanir(tmp_path):
+    # Döndürmeden sonra, katlamadan önce çökülmüş: .log.eski + ondan sonra yazılmış yeni .log
+    depo = GunlukDepo(str(tmp_path / "ali.json"))
+    depo.hepsini_yaz({"Spor": ["01.02.2024"]})
+    depo.uygula([(ISLEM_ETKINLIK_ADLANDIR, "Spor", "Koşu")])
+    os.replace(depo.gunluk_yolu, depo.eski_gunluk_yolu)
+    depo.uygula([(ISLEM_EKLE, "Koşu", "02.02.2024")])
+    beklenen = {"Koşu": ["01.02.2024", "02.02.2024"]}
+    assert GunlukDepo(depo.json_yolu).oku() == beklenen
+    yeniden = GunlukDepo(depo.json_yolu)
+    assert yeniden.yukle() == beklenen
+    yeniden.bekle()
+    assert not os.path.exists(depo.eski_gunluk_yolu)
+    assert GunlukDepo(depo.json_yolu).oku() == beklenen
+
+
+def test_hepsini_yaz_gunlukleri_siler(tmp_path):
+    depo = GunlukDepo(str(tmp_path / "ali.json"))
+    depo.uygula([(ISLEM_EKLE, "Spor", "01.02.2024")])
+    depo.hepsini_yaz({"Okuma": []})
+    assert not os.path.exists(depo.gunluk_yolu)
+    assert GunlukDepo(depo.json_yolu).oku() == {"Okuma": []}
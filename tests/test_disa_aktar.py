@@ -0,0 +1,25 @@
+from datetime import date
+
+import pytest
+
+from depolama import GunlukDepo
+from disa_aktar import disa_aktar, grafik_girdisi
+from tarih_deposu import EtkinlikIndeksi
+
+BUGUN = date(2026, 10, 17)
+
+
+def test_gelecek_yilin_zaman_cizelgesi_atlanir():
+    ind = EtkinlikIndeksi.metinlerden(["01.06.2025", "05.03.2027"])
+    assert grafik_girdisi("zaman", "Spor", ind, 2027, BUGUN.toordinal()) is None
+    assert grafik_girdisi("zaman", "Spor", ind, 2025, BUGUN.toordinal()) is not None
+
+
+def test_gelecek_yil_disa_aktarimi_bozmaz(tmp_path):
+    pytest.importorskip("matplotlib")
+    veri = tmp_path / "Data"
+    veri.mkdir()
+    GunlukDepo(str(veri / "ali.json")).hepsini_yaz({"Spor": ["01.06.2025", "05.03.2027"]})
+    sayac = disa_aktar(str(veri), str(tmp_path / "Grafikler"), grafikler=("zaman", "aylik"), bugun=BUGUN, isci=1)
+    assert sayac["yazildi"] == 3 # zaman_2025, aylik_2025, aylik_2027
+    assert (tmp_path / "Grafikler" / "ali" / "Spor" / "aylik_2027.png").exists()
@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+
+from depolama import ISLEM_EKLE, ISLEM_ETKINLIK_ADLANDIR, ISLEM_SIL
+from gun_bitmapi import (BitmapIndeksi, GunBitmapi, aralik, birliktelik_matrisi, bit_sayisi, fark_gunleri, gun_sayilari,
+                         hizala, kes)
+from tarih_deposu import EtkinlikIndeksi, gun_sirasi, sira_metni
+
+BAS = gun_sirasi("01.01.2020")
+
+
+def _kume(rastgele, n, yayilim=1500):
+    return {BAS + rastgele.randrange(yayilim) for _ in range(n)}
+
+
+def _bitmap(kume):
+    return GunBitmapi.siralardan(np.array(sorted(kume), dtype=np.int32))
+
+
+def test_bit_sayisi_python_sayimiyla_ayni():
+    kelimeler = np.random.default_rng(1).integers(0, 2**64, size=257, dtype=np.uint64).astype("<u8")
+    assert int(bit_sayisi(kelimeler)) == sum(bin(int(k)).count("1") for k in kelimeler)
+
+
+def test_popcount_kume_sayimiyla_ayni():
+    rastgele = random.Random(7)
+    for n in (0, 1, 63, 64, 65, 900):
+        kume = _kume(rastgele, n)
+        bm = _bitmap(kume)
+        assert len(bm) == len(kume)
+        assert bm.siralar().tolist() == sorted(kume)
+
+
+def test_ekle_sil_aralik_disina_buyur():
+    rastgele = random.Random(3)
+    kume = _kume(rastgele, 50)
+    bm = _bitmap(kume)
+    for sira in (BAS - 5000, BAS + 9000, BAS + 10, BAS - 1):
+        bm.ekle(sira); kume.add(sira)
+    for sira in list(kume)[:10] + [BAS - 99999]:
+        bm.sil(sira); kume.discard(sira)
+    assert len(bm) == len(kume) and bm.siralar().tolist() == sorted(kume)
+
+
+def test_karsilastirmalar_kume_islemleriyle_ayni():
+    rastgele = random.Random(11)
+    kumeler = [_kume(rastgele, n, yayilim) for n, yayilim in ((400, 1500), (200, 700), (0, 1), (300, 3000))]
+    bas, matris = hizala([_bitmap(k) for k in kumeler])
+    birlikte = birliktelik_matrisi(matris)
+    for i, a in enumerate(kumeler):
+        for j, b in enumerate(kumeler): assert birlikte[i, j] == len(a & b)
+    assert fark_gunleri(bas, matris[0], matris[1]).tolist() == sorted(kumeler[0] - kumeler[1])
+    ilk, son = BAS + 100, BAS + 1001 # Kelime sınırına denk gelmeyen aralık
+    kb, km = kes(bas, matris, ilk, son)
+    assert bit_sayisi(km).tolist() == [sum(ilk <= s < son for s in k) for k in kumeler]
+    gunler, sayilar = gun_sayilari(bas, matris, ilk, son)
+    beklenen = {g: sum(g in k for k in kumeler) for g in set().union(*kumeler) if ilk <= g < son}
+    assert dict(zip(gunler.tolist(), sayilar.tolist())) == beklenen
+    hepsi = set().union(*kumeler)
+    assert aralik(bas, matris) == (min(hepsi), max(hepsi))
+
+
+def test_indeks_islemleri_yansitir():
+    ind = EtkinlikIndeksi.metinlerden(["01.02.2024", "02.02.2024"])
+    bmi = BitmapIndeksi()
+    bm = bmi.getir("Spor", ind)
+    bmi.uygula([(ISLEM_EKLE, "Spor", "05.02.2024"), (ISLEM_SIL, "Spor", "01.02.2024"), (ISLEM_EKLE, "Yok", "01.02.2024"),
+                (ISLEM_ETKINLIK_ADLANDIR, "Spor", "Koşu")])
+    assert "Spor" not in bmi.bitmapler and bmi.bitmapler["Koşu"] is bm
+    assert [sira_metni(s) for s in bm.siralar()] == ["02.02.2024", "05.02.2024"]
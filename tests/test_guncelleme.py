@@ -0,0 +1,92 @@
+import pytest
+
+import guncelleme
+from guncelleme import HATA_TTL, TTL, onbellek_oku, son_surum, surum_bilgisi, taze_kayit
+
+URL = guncelleme.adres("greenwake", "EventTracker", "http://sahte")
+
+
+class Yanit:
+    def __init__(self, durum, govde=None, etag=None):
+        self.status_code = durum
+        self.headers = {"ETag": etag} if etag else {}
+        self._govde = govde
+
+    def json(self):
+        return self._govde
+
+
+class SahteOturum:
+    """requests.Session yerine: yanıtları sırayla döner, gönderilen başlıkları kaydeder."""
+    def __init__(self, *yanitlar):
+        self.yanitlar = list(yanitlar)
+        self.istekler = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.istekler.append((url, dict(headers or {})))
+        yanit = self.yanitlar.pop(0)
+        if isinstance(yanit, Exception): raise yanit
+        return yanit
+
+
+@pytest.fixture
+def oturum(monkeypatch):
+    def kur(*yanitlar):
+        sahte = SahteOturum(*yanitlar)
+        monkeypatch.setattr(guncelleme, "_oturum", sahte)
+        return sahte
+    return kur
+
+
+@pytest.fixture
+def yol(tmp_path):
+    return str(tmp_path / "onbellek" / "guncelleme.json") # Klasör ilk yazmada oluşturulur
+
+
+def _surum(etiket="v2.0"):
+    return Yanit(200, {"tag_name": etiket, "html_url": f"https://sayfa/{etiket}"}, etag='W/"1"')
+
+
+def test_200_onbellege_yazilir_ve_ttl_boyunca_tazedir(oturum, yol):
+    oturum(_surum())
+    assert son_surum(yol, URL, simdi=1000) == ("v2.0", "https://sayfa/v2.0")
+    assert onbellek_oku(yol)["etag"] == 'W/"1"'
+    assert surum_bilgisi(taze_kayit(yol, URL, simdi=1000 + TTL - 1)) == ("v2.0", "https://sayfa/v2.0")
+    assert taze_kayit(yol, URL, simdi=1000 + TTL) is None
+
+
+def test_304_govdesiz_tazeler(oturum, yol):
+    sahte = oturum(_surum(), Yanit(304))
+    son_surum(yol, URL, simdi=1000)
+    assert son_surum(yol, URL, simdi=1000 + TTL) == ("v2.0", "https://sayfa/v2.0")
+    assert sahte.istekler[0][1] == {}
+    assert sahte.istekler[1][1] == {"If-None-Match": 'W/"1"'}
+    assert onbellek_oku(yol)["zaman"] == 1000 + TTL
+
+
+def test_404_yayinlanmis_surum_yok(oturum, yol):
+    oturum(_surum(), Yanit(404))
+    son_surum(yol, URL, simdi=1000)
+    assert son_surum(yol, URL, simdi=1000 + TTL) is None
+    kayit = taze_kayit(yol, URL, simdi=1000 + TTL)
+    assert kayit is not None and surum_bilgisi(kayit) is None and "etag" not in kayit
+
+
+def test_ag_hatasinda_hata_ttl_boyunca_yeniden_denenmez(oturum, yol):
+    oturum(_surum(), ConnectionError("çevrimdışı"), Yanit(403))
+    son_surum(yol, URL, simdi=1000)
+    with pytest.raises(ConnectionError): son_surum(yol, URL, simdi=1000 + TTL)
+    # Bayat önbellek + yeni hata kaydı: HATA_TTL boyunca eski sonuç kullanılır
+    assert surum_bilgisi(taze_kayit(yol, URL, simdi=1000 + TTL + HATA_TTL - 1)) == ("v2.0", "https://sayfa/v2.0")
+    assert taze_kayit(yol, URL, simdi=1000 + TTL + HATA_TTL) is None
+    with pytest.raises(IOError): son_surum(yol, URL, simdi=1000 + TTL + HATA_TTL) # Örn. istek sınırı
+
+
+def test_adres_degisince_onbellek_sifirlanir(oturum, yol):
+    sahte = oturum(_surum(), _surum("v3.0"))
+    son_surum(yol, URL, simdi=1000)
+    baska = guncelleme.adres("baska", "Repo", "http://sahte")
+    assert taze_kayit(yol, baska, simdi=1000) is None
+    assert son_surum(yol, baska, simdi=1000) == ("v3.0", "https://sayfa/v3.0")
+    assert sahte.istekler[1] == (baska, {}) # Başka adresin ETag'i gönderilmez
+    assert taze_kayit(yol, URL, simdi=1000) is None
@@ -0,0 +1,73 @@
+from array import array
+
+from depolama import GunlukDepo
+from ice_aktar import ice_aktar, islemler, tarih_sirasi
+from tarih_deposu import EtkinlikIndeksi, gun_sirasi
+
+
+def _aktar(tmp_path, ad, icerik, mevcut=None, kodlama="utf-8", **kw):
+    yol = tmp_path / ad
+    yol.write_bytes(icerik.encode(kodlama))
+    return ice_aktar(str(yol), mevcut or {}, "Genel", **kw)
+
+
+def test_tarih_bicimleri():
+    beklenen = gun_sirasi("02.01.2024")
+    for metin in ("02.01.2024", "02/01/2024", "02-01-2024", "2024-01-02", "20240102", "20240102T100000Z", "2024-01-02T10:00", "02.01.2024 10:00"):
+        assert tarih_sirasi(metin) == beklenen, metin
+    assert tarih_sirasi("") is None and tarih_sirasi("31.02.2024") is None and tarih_sirasi("dün") is None
+
+
+def test_txt_eski_eventlist_satirlari(tmp_path):
+    sonuc = _aktar(tmp_path, "eventList.txt", "[1] 01.02.2024\n[Spor] 02.02.2024\r\n\n2024-02-03\nbozuk\n01.02.2024\n")
+    assert sonuc["yeni"]["Genel"].tolist() == [gun_sirasi(t) for t in ("01.02.2024", "02.02.2024", "03.02.2024")]
+    assert (sonuc["kayit"], sonuc["eklenen"], sonuc["tekrar"], sonuc["hatali"]) == (5, 3, 1, 1)
+
+
+def test_txt_cp1254_ve_bom(tmp_path):
+    assert _aktar(tmp_path, "a.txt", "\ufeff01.02.2024\n")["eklenen"] == 1
+    assert _aktar(tmp_path, "b.txt", "[Koşu] 01.02.2024\n", kodlama="cp1254")["eklenen"] == 1
+
+
+def test_csv_baslikli(tmp_path):
+    icerik = "Not;Etkinlik;Tarih\nx;Spor;01.02.2024\ny;Okuma;2024-02-02\nz;;03.02.2024\n"
+    sonuc = _aktar(tmp_path, "a.csv", icerik, kaynak_adlari=True, eslestirme={"Okuma": "Kitap"})
+    assert {ad: d.tolist() for ad, d in sonuc["yeni"].items()} == {
+        "Spor": [gun_sirasi("01.02.2024")], "Kitap": [gun_sirasi("02.02.2024")], "Genel": [gun_sirasi("03.02.2024")]}
+    assert sorted(sonuc["yeni_etkinlikler"]) == ["Genel", "Kitap", "Spor"]
+
+
+def test_csv_basliksiz(tmp_path):
+    sonuc = _aktar(tmp_path, "a.csv", "Spor,01.02.2024\nOkuma,02.02.2024\n", kaynak_adlari=True)
+    assert sorted(sonuc["yeni"]) == ["Okuma", "Spor"]
+    # kaynak_adlari olmadan her kayıt hedef etkinliğe gider
+    assert _aktar(tmp_path, "b.csv", "Spor,01.02.2024\nOkuma,02.02.2024\n")["yeni"]["Genel"].tolist() == [
+        gun_sirasi("01.02.2024"), gun_sirasi("02.02.2024")]
+
+
+def test_ics_katlanmis_ve_kacisli_satirlar(tmp_path):
+    icerik = ("BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:Koşu\\, sabah\r\nDTSTART;VALUE=DATE:20240201\r\nEND:VEVENT\r\n"
+              "BEGIN:VEVENT\r\nSUMMARY:Uzun bir\r\n  etkinlik adı\r\nDTSTART:20240202T070000Z\r\nEND:VEVENT\r\n"
+              "BEGIN:VEVENT\r\nDTSTART:20240203\r\nEND:VEVENT\r\nBEGIN:VEVENT\r\nSUMMARY:Tarihsiz\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n")
+    sonuc = _aktar(tmp_path, "takvim.ics", icerik, kaynak_adlari=True)
+    assert {ad: d.tolist() for ad, d in sonuc["yeni"].items()} == {
+        "Koşu, sabah": [gun_sirasi("01.02.2024")], "Uzun bir etkinlik adı": [gun_sirasi("02.02.2024")],
+        "Genel": [gun_sirasi("03.02.2024")]}
+
+
+def test_mevcut_gunler_tekrar_sayilir(tmp_path):
+    mevcut = {"Genel": EtkinlikIndeksi.metinlerden(["01.02.2024"]), "Eski": ["02.02.2024"], "Dizi": array("i")}
+    sonuc = _aktar(tmp_path, "a.txt", "01.02.2024\n05.02.2024\n", mevcut=mevcut)
+    assert (sonuc["eklenen"], sonuc["tekrar"], sonuc["yeni_etkinlikler"]) == (1, 1, [])
+    assert sonuc["indeksler"]["Genel"].siralar.tolist() == [gun_sirasi("01.02.2024"), gun_sirasi("05.02.2024")]
+
+
+def test_islemler_depoya_gidip_donunce_ayni_gunler(tmp_path):
+    depo = GunlukDepo(str(tmp_path / "ali.json"))
+    depo.hepsini_yaz({"Spor": ["01.02.2024"]})
+    sonuc = _aktar(tmp_path, "a.csv", "etkinlik,tarih\nSpor,01.02.2024\nSpor,02.02.2024\nOkuma,03.02.2024\n",
+                   mevcut=depo.yukle(), kaynak_adlari=True)
+    depo.uygula(list(islemler(sonuc)))
+    veriler = GunlukDepo(depo.json_yolu).oku()
+    assert veriler == {"Spor": ["01.02.2024", "02.02.2024"], "Okuma": ["03.02.2024"]}
+    assert _aktar(tmp_path, "a.csv", "Spor,02.02.2024\n", mevcut=veriler, kaynak_adlari=True)["eklenen"] == 0
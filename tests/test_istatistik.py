@@ -0,0 +1,28 @@
+from array import array
+
+from istatistik import SeriIstatistikleri
+
+
+def test_ozet_ileri_tarihli_kayitlari_yok_sayar():
+    bugun = 700_000
+    siralar = array("i", [bugun - 2, bugun - 1, bugun, bugun + 5, bugun + 6])
+    o = SeriIstatistikleri.siralardan(siralar).ozet(siralar, bugun)
+    assert o["kayit"] == 5
+    assert o["son_kayittan_beri_gun"] == 0
+    assert o["mevcut_seri"] == 3
+
+
+def test_ozet_dunku_seri_ileri_tarihli_kayitla_bozulmaz():
+    bugun = 700_000
+    siralar = array("i", [bugun - 3, bugun - 2, bugun - 1, bugun + 30])
+    o = SeriIstatistikleri.siralardan(siralar).ozet(siralar, bugun)
+    assert o["son_kayittan_beri_gun"] == 1
+    assert o["mevcut_seri"] == 3
+
+
+def test_ozet_yalnizca_ileri_tarihli_kayit():
+    bugun = 700_000
+    siralar = array("i", [bugun + 1, bugun + 2])
+    o = SeriIstatistikleri.siralardan(siralar).ozet(siralar, bugun)
+    assert o["son_kayittan_beri_gun"] is None
+    assert o["mevcut_seri"] == 0
@@ -0,0 +1,30 @@
+from onbellek import AnalizOnbellegi
+
+
+def test_surum_ilerleyince_bayat_sonuc_saklanmaz():
+    o = AnalizOnbellegi()
+    surum = o.surum("Spor")
+    o.gecersiz_kil("Spor")
+    o.koy("Spor", surum, ("zaman",), "bayat")
+    assert o.bul("Spor", ("zaman",)) == (False, None)
+
+
+def test_temizle_once_alinmis_surumleri_eskitir():
+    o = AnalizOnbellegi()
+    o.gecersiz_kil("Spor")
+    bilinen, bilinmeyen = o.surum("Spor"), o.surum("Okuma") # "Okuma" hiç geçersiz kılınmamış
+    o.temizle() # Anlık görüntünün tamamı yazıldı
+    o.koy("Spor", bilinen, ("zaman",), "bayat")
+    o.koy("Okuma", bilinmeyen, ("zaman",), "bayat")
+    assert o.bul("Spor", ("zaman",)) == (False, None)
+    assert o.bul("Okuma", ("zaman",)) == (False, None)
+    o.koy("Okuma", o.surum("Okuma"), ("zaman",), "taze")
+    assert o.bul("Okuma", ("zaman",)) == (True, "taze")
+
+
+def test_kapasite_en_eski_kaydi_dusurur():
+    o = AnalizOnbellegi(kapasite=2)
+    for i in range(3): o.getir("Spor", (i,), lambda: i)
+    o.bul("Spor", (1,))
+    o.getir("Spor", (3,), lambda: 3)
+    assert [o.bul("Spor", (i,))[0] for i in range(4)] == [False, True, False, True]
@@ -0,0 +1,31 @@
+import json
+from datetime import date
+
+from analiz import etkinlik_ozeti, siralar_dizisi
+from depolama import GunlukDepo
+from rapor import kullanici_raporu, raporla
+from tarih_deposu import EtkinlikIndeksi
+
+BUGUN = date(2026, 10, 17)
+
+
+def test_ozet_ileri_tarihli_kayitlari_son_kayit_saymaz():
+    ind = EtkinlikIndeksi.metinlerden(["10.10.2026", "15.10.2026", "05.03.2027"])
+    ozet = etkinlik_ozeti(siralar_dizisi(ind), BUGUN.toordinal())
+    assert ozet["kayit"] == 3
+    assert ozet["son_kayittan_beri_gun"] == 2
+    assert ozet["son"] == "2027-03-05"
+
+
+def test_ozet_yalnizca_ileri_tarihli_kayit():
+    ind = EtkinlikIndeksi.metinlerden(["05.03.2027"])
+    assert etkinlik_ozeti(siralar_dizisi(ind), BUGUN.toordinal())["son_kayittan_beri_gun"] is None
+
+
+def test_rapor_kullanici_verisi_olmayan_json_dosyalarini_atlar(tmp_path):
+    (tmp_path / "surumler.json").write_text(json.dumps({"url": "x", "zaman": 1.0}))
+    (tmp_path / "liste.json").write_text(json.dumps([1, 2]))
+    GunlukDepo(str(tmp_path / "ali.json")).hepsini_yaz({"Spor": ["01.10.2026"]})
+    assert kullanici_raporu(str(tmp_path / "liste.json"), BUGUN.toordinal()) == []
+    satirlar = list(raporla(str(tmp_path), BUGUN, isci=1))
+    assert [(s["kullanici"], s["etkinlik"], s["son_kayittan_beri_gun"]) for s in satirlar] == [("ali", "Spor", 16)]
@@ -0,0 +1,24 @@
+import hashlib
+import os
+
+import sifreleme
+from sifreleme import ESKI_ITERASYON, dogrula, ozeti_coz, sifre_ozeti, yukseltilmeli_mi
+
+
+def _eski_kayit(sifre):
+    tuz = os.urandom(16)
+    return f"{tuz.hex()}:{hashlib.pbkdf2_hmac('sha256', sifre.encode('utf-8'), tuz, ESKI_ITERASYON).hex()}"
+
+
+def test_varsayilan_maliyet_eski_kayitlarla_ayni():
+    assert sifreleme.VARSAYILAN_ITERASYON == ESKI_ITERASYON or "ETKINLIK_PBKDF2_ITERASYON" in os.environ
+
+
+def test_eski_kayit_dogrulanir_ve_ayni_maliyetle_yeni_bicime_yukseltilir():
+    eski = _eski_kayit("parola")
+    assert dogrula("parola", eski) and not dogrula("yanlis", eski)
+    assert yukseltilmeli_mi(eski)
+    yeni = sifre_ozeti("parola", ESKI_ITERASYON)
+    assert ozeti_coz(yeni)[1] == ESKI_ITERASYON and dogrula("parola", yeni)
+    assert not yukseltilmeli_mi(yeni, ESKI_ITERASYON)
+    assert yukseltilmeli_mi(yeni, 2 * ESKI_ITERASYON) # Operatör ayarı yükseltirse bir sonraki girişte